@@ -29,6 +29,31 @@ CREWAI_CONFIG = {
     "allow_delegation": False,
     "max_iterations": 3,
     "max_rpm": 10,
+    # Concurrent LLM calls across the process; debate systems also pace starts to the RPM budget
+    "llm_concurrency": int(os.getenv("CIVICAI_LLM_CONCURRENCY", "8")),
+    "llm_requests_per_minute": float(os.getenv("CIVICAI_LLM_RPM", "50")),
+    "plan_cache_enabled": os.getenv("CIVICAI_PLAN_CACHE", "0") == "1",
+    # Exact-match reuse of tool-free task outputs across workflow runs
+    "task_cache_enabled": os.getenv("CIVICAI_TASK_CACHE", "0") == "1",
+    "plan_cache_similarity": float(os.getenv("CIVICAI_PLAN_CACHE_SIMILARITY", "0.9")),
+    # Concurrent LLM calls allowed per provider; more than this only produces 429 retry storms
+    "provider_concurrency": {
+        "anthropic": 3,
+        "openai": 5,
+        "gemini": 4,
+        "ollama": 1,
+    },
+    "max_task_retries": 3,
+    # Start topic analysis before stakeholder identification and research finish; it then
+    # runs without the stakeholder context, so it is off by default
+    "prefetch_topic_analysis": os.getenv("CIVICAI_PREFETCH_TOPICS", "0") == "1",
+    # When set, per-stakeholder workflow outputs are written here as they finish and
+    # results hold file paths instead of the full text. This is for crash persistence;
+    # with inject_research_context on, research is still read back into the prompts
+    "workflow_output_dir": os.getenv("CIVICAI_WORKFLOW_OUTPUT_DIR"),
+    # Append stakeholder research and debate topics to the argument and synthesis task
+    # descriptions; off by default since it makes those prompts much larger
+    "inject_research_context": os.getenv("CIVICAI_INJECT_RESEARCH", "0") == "1",
 }
 
 # Policy discovery configuration
@@ -1,6 +1,36 @@
 from crewai import Agent, Crew, Process, Task, LLM
 from crewai.project import CrewBase, agent, crew, task
 from crewai.tools import BaseTool
+import os
+import asyncio
+import atexit
+import json
+import logging
+import random
+import threading
+import time
+import uuid
+import yaml
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from functools import cached_property
+from typing import ClassVar, List, Dict, Any, Optional, Tuple
+from pathlib import Path
+
+# Import the integrated policy discovery agent
+from .policy_discovery import PolicyDiscoveryAgent, UserContext, PolicyDomain, GovernmentLevel
+from .config import CREWAI_CONFIG
+from .debate_context import DebateContext
+from .llm_cache import LLMResponseCache, PlanCache
+from .policy_discovery.config import CACHE_CONFIG
+from .policy_discovery.utils import PolicyDiskCache
+
+# Import the robust LLM client (renamed from weave_client)
+from .weave_client import get_weave_client, initialize_weave_client, close_weave_client
+# Import the dedicated Weave inference client
+from .weave_inference_client import get_weave_inference_client, initialize_weave_inference_client
+
+logger = logging.getLogger(__name__)
 
 # Mock tools to replace missing crewai_tools
 class SerperDevTool(BaseTool):
@@ -16,20 +46,6 @@ class ScrapeWebsiteTool(BaseTool):
     
     def _run(self, url: str) -> str:
         return f"Mock scraped content from: {url}"
-import os
-import logging
-import yaml
-from datetime import datetime
-from typing import List, Dict, Any
-from pathlib import Path
-
-# Import the integrated policy discovery agent
-from .policy_discovery import PolicyDiscoveryAgent, UserContext, PolicyDomain, GovernmentLevel
-
-# Import the robust LLM client (renamed from weave_client)
-from .weave_client import get_weave_client, initialize_weave_client
-# Import the dedicated Weave inference client
-from .weave_inference_client import get_weave_inference_client, initialize_weave_inference_client
 
 # CrewAI LLM wrapper for robust client
 class RobustCrewAILLM:
@@ -97,6 +113,37 @@ from .tools.custom_tool import (
     DebateModerator
 )
 
+# Stakeholder agent/task prompt templates, rendered with str.format_map
+_STAKEHOLDER_ROLE_TPL = "{name} Advocate"
+_STAKEHOLDER_GOAL_TPL = "Analyze policies from the perspective of {name} and advocate for their interests"
+_STAKEHOLDER_BACKSTORY_TPL = (
+    "You are a dedicated advocate for {name}. Your role is to understand how policies affect {name} "
+    "and present their viewpoint in policy debates. You have deep knowledge of {type} concerns and interests."
+)
+_STAKEHOLDER_TASK_DESC_TPL = (
+    "Research and analyze the policy from {name}'s perspective. Use the StakeholderResearcher tool "
+    "to conduct detailed analysis and store findings in the knowledge base."
+)
+_STAKEHOLDER_TASK_OUTPUT_TPL = (
+    "Comprehensive analysis of policy impacts on {name}, including key arguments, concerns, and recommendations."
+)
+_STAKEHOLDER_RESEARCH_DESC_TPL = (
+    "IMPORTANT: Use the StakeholderResearcher tool directly to conduct detailed analysis of the policy from {name}'s perspective. "
+    "Do NOT delegate this task. Use the KnowledgeBaseManager tool to store your findings. Use SerperDevTool for additional research if needed. "
+    "You must complete this analysis yourself using the available tools."
+)
+_STAKEHOLDER_RESEARCH_OUTPUT_TPL = (
+    "Comprehensive research report from {name}'s perspective stored in the knowledge base using KnowledgeBaseManager."
+)
+_STAKEHOLDER_DEBATE_DESC_TPL = (
+    "IMPORTANT: Use the ArgumentGenerator tool directly to create evidence-based arguments from {name}'s perspective on the debate topics. "
+    "Use A2AMessenger for structured communication with other agents. Do NOT delegate this task. "
+    "You must generate arguments yourself using the available tools."
+)
+_STAKEHOLDER_DEBATE_OUTPUT_TPL = (
+    "Evidence-based arguments from {name}'s perspective using ArgumentGenerator, with structured communication via A2AMessenger."
+)
+
 def load_yaml_config(config_file: str) -> Dict[str, Any]:
     """Load YAML configuration file"""
     config_path = Path(__file__).parent / "config" / config_file
@@ -116,6 +163,10 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
     Dynamic CrewAI system for policy analysis and debate with robust LLM integration
     """
     
+    # Background workflow tasks (topic prefetch) share one worker, created on first use
+    _background_executor: ClassVar[Optional[ThreadPoolExecutor]] = None
+    _background_executor_lock: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(self):
         # Load configurations before calling super().__init__()
         
@@ -128,6 +179,12 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
         # Load configurations
         self.agents_config = self._load_config('agents.yaml')
         self.tasks_config = self._load_config('tasks.yaml')
+        # @task methods only need these two strings - look them up once
+        self._task_specs = {
+            name: (cfg['description'], cfg['expected_output'])
+            for name, cfg in (self.tasks_config or {}).items()
+            if isinstance(cfg, dict) and 'description' in cfg and 'expected_output' in cfg
+        }
         
         # Initialize LLM with Claude as primary, with robust fallback
         try:
@@ -268,11 +325,32 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
         
         # Initialize tools
         self._initialize_tools()
+        # Tool sets shared by every stakeholder research/debate task
+        self._research_tools = (self.stakeholder_researcher, self.knowledge_base_manager, self.serper_tool)
+        self._debate_tools = (self.argument_generator, self.a2a_messenger, self.knowledge_base_manager)
         
         # Initialize stakeholder tracking attributes
         self.stakeholder_agents = {}
         self.stakeholder_tasks = {}
         
+        # Persistent cache for policy discovery results (keyed by context hash)
+        self._discovery_cache = PolicyDiskCache(
+            os.path.join(CACHE_CONFIG["cache_directory"], "context"),
+            ttl_hours=CACHE_CONFIG["context_ttl_hours"]
+        )
+        
+        # Optionally reuse outputs of tool-free tasks for identical prompts across workflow runs
+        self.task_cache_enabled = CREWAI_CONFIG["task_cache_enabled"]
+        self._task_cache = LLMResponseCache(ttl_seconds=3600)
+        self.plan_cache_enabled = CREWAI_CONFIG["plan_cache_enabled"]
+        self._plan_cache = PlanCache(similarity_threshold=CREWAI_CONFIG["plan_cache_similarity"])
+        self._provider_limits = {
+            provider: threading.BoundedSemaphore(limit)
+            for provider, limit in CREWAI_CONFIG["provider_concurrency"].items()
+        }
+        self._preflight_cache: Optional[List[str]] = None
+        self._preflight_config_hash = None
+        
         # Call parent constructor
         super().__init__()
         
@@ -313,9 +391,19 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
             print(f"❌ Tool initialization failed: {e}")
             raise ValueError(f"Failed to initialize tools: {e}")
 
+    # Stateless mock tools, built on first use and shared by every agent and task
+    @cached_property
+    def serper_tool(self) -> SerperDevTool:
+        return SerperDevTool()
+
+    @cached_property
+    def scrape_tool(self) -> ScrapeWebsiteTool:
+        return ScrapeWebsiteTool()
+
     @agent
     def coordinator_agent(self) -> Agent:
-        print(f"🔍 Creating coordinator_agent with config: {self.agents_config.get('coordinator_agent', 'NOT_FOUND')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Creating %s with config: %s", 'coordinator_agent', self.agents_config.get('coordinator_agent', 'NOT_FOUND'))
         try:
             return Agent(
                 config=self.agents_config['coordinator_agent'],
@@ -326,28 +414,29 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
                 max_iter=1,  # Limit iterations to prevent loops
             )
         except Exception as e:
-            print(f"❌ Error in coordinator_agent: {e}")
-            print(f"   agents_config type: {type(self.agents_config)}")
-            print(f"   agents_config keys: {list(self.agents_config.keys()) if isinstance(self.agents_config, dict) else 'Not a dict'}")
+            logger.error("Error in %s: %s", 'coordinator_agent', e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("agents_config type: %s, keys: %s", type(self.agents_config),
+                             list(self.agents_config.keys()) if isinstance(self.agents_config, dict) else 'Not a dict')
             raise
 
     @agent
     def policy_discovery_agent(self) -> Agent:
         """Enhanced policy discovery agent using integrated Exa API for comprehensive policy search"""
-        print(f"🔍 Creating policy_discovery_agent")
+        logger.debug("Creating %s", 'policy_discovery_agent')
         try:
             return Agent(
                 role="Universal Policy Discovery Specialist",
                 goal="Discover and categorize relevant policies across all government levels (Federal, State of California, City of San Francisco) based on user context and stakeholder roles using integrated Exa API",
                 backstory="""You are an expert in navigating complex government policy landscapes with deep knowledge of Federal, California State, and San Francisco local governance structures. You excel at identifying policies that impact specific stakeholder groups using advanced AI-powered search capabilities through the integrated Exa API. Your expertise includes real-time policy discovery, stakeholder impact assessment, and translating complex governmental processes into actionable insights for civic engagement.""",
-                tools=[self.policy_file_reader, SerperDevTool(), ScrapeWebsiteTool()],
+                tools=[self.policy_file_reader, self.serper_tool, self.scrape_tool],
                 llm=self.llm,
                 verbose=True,
                 allow_delegation=False,  # Prevent delegation, use tools directly
                 max_iter=1,  # Limit iterations to prevent loops
             )
         except Exception as e:
-            print(f"❌ Error in policy_discovery_agent: {e}")
+            logger.error("Error in %s: %s", 'policy_discovery_agent', e)
             raise
 
     async def discover_policies_for_context(self, user_location: str, stakeholder_roles: List[str], interests: List[str]) -> Dict[str, Any]:
@@ -366,6 +455,16 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
         if not hasattr(self, 'llm_client') or not self.llm_client:
             return {"error": "Policy discovery client not available - using W&B Inference LLM directly"}
         
+        # Identical contexts produce the same discovery results for hours - serve them from disk
+        cache_key = PolicyDiskCache.make_key(
+            loc=user_location,
+            roles=stakeholder_roles,
+            interests=interests
+        )
+        cached_result = self._discovery_cache.get(cache_key)
+        if cached_result is not None:
+            return cached_result
+        
         try:
             # Create user context for policy discovery with refined parameters
             user_context = UserContext(
@@ -377,24 +476,26 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
             # Discover policies using the refined integrated agent
             results = await self.llm_client.discover_policies(user_context=user_context)
             
-            # Return structured results with enhanced quality metrics
-            return {
-                "success": True,
-                "total_found": results.total_found,
-                "search_time": results.search_time,
-                "priority_policies": [
-                    {
+            # Single pass over the ranked policies: project each policy's shared fields
+            # once and accumulate the search metadata counters alongside
+            now = datetime.now()
+            policy_fields = {}
+            priority_policies = []
+            recent_policies_count = 0
+            high_confidence_count = 0
+            document_types = {}
+            government_levels = {}
+            
+            for i, policy in enumerate(results.priority_ranking):
+                fields = self._project_policy_fields(policy)
+                policy_fields[id(policy)] = fields
+                
+                if i < 15:  # Top 15 policies for better coverage
+                    priority_policies.append({
                         "id": f"policy_{i}",
-                        "title": policy.title,
-                        "url": policy.url,
-                        "government_level": policy.government_level.value,
-                        "domain": policy.domain.value,
-                        "summary": policy.summary,
+                        **fields,
                         "status": policy.status.value,
-                        "source_agency": policy.source_agency,
-                        "document_type": policy.document_type,
                         "last_updated": policy.last_updated.isoformat() if policy.last_updated else None,
-                        "confidence_score": policy.confidence_score,
                         "content_preview": policy.content_preview,
                         "stakeholder_impacts": [
                             {
@@ -404,69 +505,94 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
                                 "affected_areas": impact.affected_areas
                             } for impact in policy.stakeholder_impacts
                         ]
-                    } for i, policy in enumerate(results.priority_ranking[:15])  # Top 15 policies for better coverage
-                ],
-                "stakeholder_impact_map": {
-                    role: [
-                        {
-                            "id": f"policy_{j}",
-                            "title": policy.title,
-                            "url": policy.url,
-                            "government_level": policy.government_level.value,
-                            "domain": policy.domain.value,
-                            "summary": policy.summary,
-                            "confidence_score": policy.confidence_score,
-                            "document_type": policy.document_type,
-                            "source_agency": policy.source_agency
-                        } for j, policy in enumerate(policies[:5])  # Limit to top 5 per role
-                    ] for role, policies in results.stakeholder_impact_map.items()
-                },
+                    })
+                
+                if policy.last_updated and (now - policy.last_updated).days <= 90:
+                    recent_policies_count += 1
+                if policy.confidence_score >= 0.8:
+                    high_confidence_count += 1
+                document_types[policy.document_type] = document_types.get(policy.document_type, 0) + 1
+                level = fields["government_level"]
+                government_levels[level] = government_levels.get(level, 0) + 1
+            
+            # Per-role maps reuse the projected fields instead of re-reading attributes
+            stakeholder_impact_map = {}
+            for role, policies in results.stakeholder_impact_map.items():
+                role_policies = []
+                for j, policy in enumerate(policies[:5]):  # Limit to top 5 per role
+                    fields = policy_fields.get(id(policy)) or self._project_policy_fields(policy)
+                    role_policies.append({"id": f"policy_{j}", **fields})
+                stakeholder_impact_map[role] = role_policies
+            
+            top_ranked = results.priority_ranking[:10]
+            
+            # Return structured results with enhanced quality metrics
+            discovery_result = {
+                "success": True,
+                "total_found": results.total_found,
+                "search_time": results.search_time,
+                "priority_policies": priority_policies,
+                "stakeholder_impact_map": stakeholder_impact_map,
                 "search_metadata": {
                     "domains_searched": results.search_metadata.get("domains_searched", []),
                     "levels_searched": results.search_metadata.get("levels_searched", []),
-                    "search_quality_score": sum(p.confidence_score for p in results.priority_ranking[:10]) / min(10, len(results.priority_ranking)) if results.priority_ranking else 0,
-                    "recent_policies_count": len([p for p in results.priority_ranking if p.last_updated and (datetime.now() - p.last_updated).days <= 90]),
-                    "high_confidence_count": len([p for p in results.priority_ranking if p.confidence_score >= 0.8]),
-                    "document_types": {
-                        doc_type: len([p for p in results.priority_ranking if p.document_type == doc_type])
-                        for doc_type in set(p.document_type for p in results.priority_ranking)
-                    },
-                    "government_levels": {
-                        level.value: len([p for p in results.priority_ranking if p.government_level == level])
-                        for level in set(p.government_level for p in results.priority_ranking)
-                    }
+                    "search_quality_score": sum(p.confidence_score for p in top_ranked) / len(top_ranked) if top_ranked else 0,
+                    "recent_policies_count": recent_policies_count,
+                    "high_confidence_count": high_confidence_count,
+                    "document_types": document_types,
+                    "government_levels": government_levels
                 }
             }
             
+            self._discovery_cache.set(cache_key, discovery_result)
+            return discovery_result
+            
         except Exception as e:
             self.logger.error(f"Policy discovery failed: {str(e)}")
             return {"error": f"Policy discovery failed: {str(e)}"}
 
+    @staticmethod
+    def _project_policy_fields(policy) -> Dict[str, Any]:
+        """Project the policy fields shared by priority and per-role listings"""
+        return {
+            "title": policy.title,
+            "url": policy.url,
+            "government_level": policy.government_level.value,
+            "domain": policy.domain.value,
+            "summary": policy.summary,
+            "confidence_score": policy.confidence_score,
+            "document_type": policy.document_type,
+            "source_agency": policy.source_agency
+        }
+
     @agent
     def policy_debate_agent(self) -> Agent:
-        print(f"🔍 Creating policy_debate_agent with config: {self.agents_config.get('policy_debate_agent', 'NOT_FOUND')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Creating %s with config: %s", 'policy_debate_agent', self.agents_config.get('policy_debate_agent', 'NOT_FOUND'))
         try:
             return Agent(
                 config=self.agents_config['policy_debate_agent'],
                 tools=[
                     self.stakeholder_identifier, 
                     self.knowledge_base_manager,
-                    SerperDevTool(), 
-                    ScrapeWebsiteTool()
+                    self.serper_tool, 
+                    self.scrape_tool
                 ],
                 llm=self.llm,
                 allow_delegation=False,  # Prevent delegation, use tools directly
                 max_iter=1,  # Limit iterations to prevent loops
             )
         except Exception as e:
-            print(f"❌ Error in policy_debate_agent: {e}")
-            print(f"   agents_config type: {type(self.agents_config)}")
-            print(f"   agents_config keys: {list(self.agents_config.keys()) if isinstance(self.agents_config, dict) else 'Not a dict'}")
+            logger.error("Error in %s: %s", 'policy_debate_agent', e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("agents_config type: %s, keys: %s", type(self.agents_config),
+                             list(self.agents_config.keys()) if isinstance(self.agents_config, dict) else 'Not a dict')
             raise
 
     @agent
     def advocate_sub_agents(self) -> Agent:
-        print(f"🔍 Creating advocate_sub_agents with config: {self.agents_config.get('advocate_sub_agents', 'NOT_FOUND')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Creating %s with config: %s", 'advocate_sub_agents', self.agents_config.get('advocate_sub_agents', 'NOT_FOUND'))
         try:
             return Agent(
                 config=self.agents_config['advocate_sub_agents'],
@@ -475,22 +601,24 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
                     self.knowledge_base_manager,
                     self.argument_generator,
                     self.a2a_messenger,
-                    SerperDevTool(),
-                    ScrapeWebsiteTool()
+                    self.serper_tool,
+                    self.scrape_tool
                 ],
                 llm=self.llm,
                 allow_delegation=False,  # Prevent delegation, use tools directly
                 max_iter=1,  # Limit iterations to prevent loops
             )
         except Exception as e:
-            print(f"❌ Error in advocate_sub_agents: {e}")
-            print(f"   agents_config type: {type(self.agents_config)}")
-            print(f"   agents_config keys: {list(self.agents_config.keys()) if isinstance(self.agents_config, dict) else 'Not a dict'}")
+            logger.error("Error in %s: %s", 'advocate_sub_agents', e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("agents_config type: %s, keys: %s", type(self.agents_config),
+                             list(self.agents_config.keys()) if isinstance(self.agents_config, dict) else 'Not a dict')
             raise
 
     @agent
     def action_agent(self) -> Agent:
-        print(f"🔍 Creating action_agent with config: {self.agents_config.get('action_agent', 'NOT_FOUND')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Creating %s with config: %s", 'action_agent', self.agents_config.get('action_agent', 'NOT_FOUND'))
         try:
             return Agent(
                 config=self.agents_config['action_agent'],
@@ -500,14 +628,16 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
                 max_iter=1,  # Limit iterations to prevent loops
             )
         except Exception as e:
-            print(f"❌ Error in action_agent: {e}")
-            print(f"   agents_config type: {type(self.agents_config)}")
-            print(f"   agents_config keys: {list(self.agents_config.keys()) if isinstance(self.agents_config, dict) else 'Not a dict'}")
+            logger.error("Error in %s: %s", 'action_agent', e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("agents_config type: %s, keys: %s", type(self.agents_config),
+                             list(self.agents_config.keys()) if isinstance(self.agents_config, dict) else 'Not a dict')
             raise
 
     @agent
     def debate_moderator_agent(self) -> Agent:
-        print(f"🔍 Creating debate_moderator_agent with config: {self.agents_config.get('debate_moderator_agent', 'NOT_FOUND')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Creating %s with config: %s", 'debate_moderator_agent', self.agents_config.get('debate_moderator_agent', 'NOT_FOUND'))
         try:
             return Agent(
                 config=self.agents_config['debate_moderator_agent'],
@@ -516,7 +646,7 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
                     self.debate_moderator,
                     self.a2a_messenger,
                     self.knowledge_base_manager,
-                    SerperDevTool()
+                    self.serper_tool
                 ],
                 llm=self.llm,
                 allow_delegation=False,  # Prevent delegation, use tools directly
@@ -524,21 +654,24 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
                 max_iter=1,  # Limit iterations to prevent loops
             )
         except Exception as e:
-            print(f"❌ Error in debate_moderator_agent: {e}")
-            print(f"   agents_config type: {type(self.agents_config)}")
-            print(f"   agents_config keys: {list(self.agents_config.keys()) if isinstance(self.agents_config, dict) else 'Not a dict'}")
+            logger.error("Error in %s: %s", 'debate_moderator_agent', e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("agents_config type: %s, keys: %s", type(self.agents_config),
+                             list(self.agents_config.keys()) if isinstance(self.agents_config, dict) else 'Not a dict')
             raise
 
     def create_stakeholder_agent(self, stakeholder_info: Dict[str, Any]) -> Agent:
         """Create a dynamic agent for a specific stakeholder"""
-        stakeholder_name = stakeholder_info.get("name", "Unknown Stakeholder")
-        stakeholder_type = stakeholder_info.get("type", "stakeholder")
+        template_values = {
+            "name": stakeholder_info.get("name", "Unknown Stakeholder"),
+            "type": stakeholder_info.get("type", "stakeholder")
+        }
         
         # Create agent configuration
         agent_config = {
-            "role": f"{stakeholder_name} Advocate",
-            "goal": f"Analyze policies from the perspective of {stakeholder_name} and advocate for their interests",
-            "backstory": f"You are a dedicated advocate for {stakeholder_name}. Your role is to understand how policies affect {stakeholder_name} and present their viewpoint in policy debates. You have deep knowledge of {stakeholder_type} concerns and interests.",
+            "role": _STAKEHOLDER_ROLE_TPL.format_map(template_values),
+            "goal": _STAKEHOLDER_GOAL_TPL.format_map(template_values),
+            "backstory": _STAKEHOLDER_BACKSTORY_TPL.format_map(template_values),
             "verbose": True,
             "allow_delegation": False
         }
@@ -555,8 +688,8 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
                 self.knowledge_base_manager,
                 self.argument_generator,
                 self.a2a_messenger,
-                SerperDevTool(),
-                ScrapeWebsiteTool()
+                self.serper_tool,
+                self.scrape_tool
             ],
             llm=self.llm
         )
@@ -565,19 +698,41 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
 
     def create_stakeholder_task(self, stakeholder_info: Dict[str, Any], agent: Agent) -> Task:
         """Create a task for a stakeholder agent"""
-        stakeholder_name = stakeholder_info.get("name", "Unknown Stakeholder")
+        template_values = {"name": stakeholder_info.get("name", "Unknown Stakeholder")}
         
         # Create task with minimal agent reference to avoid circular references
         # Use agent name instead of full agent object when possible
         task = Task(
-            description=f"Research and analyze the policy from {stakeholder_name}'s perspective. Use the StakeholderResearcher tool to conduct detailed analysis and store findings in the knowledge base.",
-            expected_output=f"Comprehensive analysis of policy impacts on {stakeholder_name}, including key arguments, concerns, and recommendations.",
+            description=_STAKEHOLDER_TASK_DESC_TPL.format_map(template_values),
+            expected_output=_STAKEHOLDER_TASK_OUTPUT_TPL.format_map(template_values),
             agent=agent,
             tools=[self.stakeholder_researcher, self.knowledge_base_manager]
         )
         
         return task
 
+    async def run_stakeholders_stream(self, stakeholder_list: List[Dict[str, Any]]):
+        """
+        Run every stakeholder's research task concurrently and yield each result as soon as it finishes
+        
+        Usage:
+            async for result in crew_instance.run_stakeholders_stream(stakeholder_list):
+                render(result)
+        """
+        async def run_one(stakeholder_info: Dict[str, Any]) -> Dict[str, Any]:
+            stakeholder_name = stakeholder_info.get("name", "Unknown")
+            try:
+                agent = self.create_stakeholder_agent(stakeholder_info)
+                task = self.create_stakeholder_task(stakeholder_info, agent)
+                output = await asyncio.to_thread(self._cached_execute, task)
+                return {"name": stakeholder_name, "result": output, "status": "success"}
+            except Exception as e:
+                return {"name": stakeholder_name, "error": str(e), "status": "error"}
+        
+        pending = [asyncio.create_task(run_one(s)) for s in stakeholder_list]
+        for next_done in asyncio.as_completed(pending):
+            yield await next_done
+
     def create_task_without_circular_refs(self, description: str, expected_output: str, agent: Agent, tools: List = None) -> Task:
         """Create a task without circular references by using minimal agent information"""
         # Create a simplified task that avoids circular references
@@ -589,149 +744,82 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
         )
         return task
 
+    def _build_task(self, name: str, agent: Agent, tools: List) -> Task:
+        """Build a config-defined task from the precomputed description/expected_output"""
+        spec = self._task_specs.get(name)
+        if spec is None:
+            self._build_task_debug(name)
+        description, expected_output = spec
+        return Task(
+            description=description,
+            expected_output=expected_output,
+            agent=agent,
+            tools=tools,
+        )
+
+    def _build_task_debug(self, name: str):
+        """Report why a task could not be built from tasks_config and raise"""
+        logger.error("Error in %s: no usable entry in tasks_config", name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("tasks_config type: %s, keys: %s", type(self.tasks_config),
+                         list(self.tasks_config.keys()) if isinstance(self.tasks_config, dict) else 'Not a dict')
+        raise KeyError(name)
+
     @task
     def receive_query_task(self) -> Task:
-        print(f"🔍 Creating receive_query_task with config: {self.tasks_config.get('receive_query_task', 'NOT_FOUND')}")
-        try:
-            task_config = self.tasks_config['receive_query_task']
-            return Task(
-                description=task_config['description'],
-                expected_output=task_config['expected_output'],
-                agent=self.coordinator_agent(),
-                tools=[self.policy_file_reader],
-            )
-        except Exception as e:
-            print(f"❌ Error in receive_query_task: {e}")
-            print(f"   tasks_config type: {type(self.tasks_config)}")
-            print(f"   tasks_config keys: {list(self.tasks_config.keys()) if isinstance(self.tasks_config, dict) else 'Not a dict'}")
-            raise
+        return self._build_task('receive_query_task', self.coordinator_agent(), [self.policy_file_reader])
 
     @task
     def fetch_policy_text_task(self) -> Task:
-        print(f"🔍 Creating fetch_policy_text_task with config: {self.tasks_config.get('fetch_policy_text_task', 'NOT_FOUND')}")
-        try:
-            task_config = self.tasks_config['fetch_policy_text_task']
-            return Task(
-                description=task_config['description'],
-                expected_output=task_config['expected_output'],
-                agent=self.policy_discovery_agent(),
-                tools=[self.policy_file_reader, SerperDevTool(), ScrapeWebsiteTool()],
-            )
-        except Exception as e:
-            print(f"❌ Error in fetch_policy_text_task: {e}")
-            print(f"   tasks_config type: {type(self.tasks_config)}")
-            print(f"   tasks_config keys: {list(self.tasks_config.keys()) if isinstance(self.tasks_config, dict) else 'Not a dict'}")
-            raise
+        return self._build_task('fetch_policy_text_task', self.policy_discovery_agent(), [self.policy_file_reader, self.serper_tool, self.scrape_tool])
 
     @task
     def analyze_policy_text_task(self) -> Task:
-        print(f"🔍 Creating analyze_policy_text_task with config: {self.tasks_config.get('analyze_policy_text_task', 'NOT_FOUND')}")
-        try:
-            task_config = self.tasks_config['analyze_policy_text_task']
-            return Task(
-                description=task_config['description'],
-                expected_output=task_config['expected_output'],
-                agent=self.policy_debate_agent(),
-                tools=[self.stakeholder_identifier],
-            )
-        except Exception as e:
-            print(f"❌ Error in analyze_policy_text_task: {e}")
-            print(f"   tasks_config type: {type(self.tasks_config)}")
-            print(f"   tasks_config keys: {list(self.tasks_config.keys()) if isinstance(self.tasks_config, dict) else 'Not a dict'}")
-            raise
+        return self._build_task('analyze_policy_text_task', self.policy_debate_agent(), [self.stakeholder_identifier])
 
     @task
     def dynamic_sub_agent_creation_task(self) -> Task:
-        task_config = self.tasks_config['dynamic_sub_agent_creation_task']
-        return Task(
-            description=task_config['description'],
-            expected_output=task_config['expected_output'],
-            agent=self.policy_debate_agent(),
-            tools=[self.stakeholder_identifier, self.knowledge_base_manager],
-        )
+        return self._build_task('dynamic_sub_agent_creation_task', self.policy_debate_agent(), [self.stakeholder_identifier, self.knowledge_base_manager])
 
     @task
     def stakeholder_analysis_task(self) -> Task:
-        task_config = self.tasks_config['stakeholder_analysis_task']
-        return Task(
-            description=task_config['description'],
-            expected_output=task_config['expected_output'],
-            agent=self.advocate_sub_agents(),
-            tools=[self.stakeholder_researcher, self.knowledge_base_manager],
-        )
+        return self._build_task('stakeholder_analysis_task', self.advocate_sub_agents(), [self.stakeholder_researcher, self.knowledge_base_manager])
 
     @task
     def synthesize_summary_task(self) -> Task:
-        task_config = self.tasks_config['synthesize_summary_task']
-        return Task(
-            description=task_config['description'],
-            expected_output=task_config['expected_output'],
-            agent=self.action_agent(),
-            tools=[self.knowledge_base_manager],
-        )
+        return self._build_task('synthesize_summary_task', self.action_agent(), [self.knowledge_base_manager])
 
     @task
     def draft_email_task(self) -> Task:
-        task_config = self.tasks_config['draft_email_task']
-        return Task(
-            description=task_config['description'],
-            expected_output=task_config['expected_output'],
-            agent=self.action_agent(),
-            tools=[self.knowledge_base_manager],
-        )
+        return self._build_task('draft_email_task', self.action_agent(), [self.knowledge_base_manager])
 
     @task
     def analyze_debate_topics_task(self) -> Task:
-        task_config = self.tasks_config['analyze_debate_topics_task']
-        return Task(
-            description=task_config['description'],
-            expected_output=task_config['expected_output'],
-            agent=self.debate_moderator_agent(),
-            tools=[self.topic_analyzer],
-        )
+        return self._build_task('analyze_debate_topics_task', self.debate_moderator_agent(), [self.topic_analyzer])
 
     @task
     def initiate_debate_session_task(self) -> Task:
-        task_config = self.tasks_config['initiate_debate_session_task']
-        return Task(
-            description=task_config['description'],
-            expected_output=task_config['expected_output'],
-            agent=self.debate_moderator_agent(),
-            tools=[self.debate_moderator, self.knowledge_base_manager],
-        )
+        return self._build_task('initiate_debate_session_task', self.debate_moderator_agent(), [self.debate_moderator, self.knowledge_base_manager])
 
     @task
     def conduct_stakeholder_debate_task(self) -> Task:
-        task_config = self.tasks_config['conduct_stakeholder_debate_task']
-        return Task(
-            description=task_config['description'],
-            expected_output=task_config['expected_output'],
-            agent=self.advocate_sub_agents(),
-            tools=[self.argument_generator, self.a2a_messenger, self.knowledge_base_manager],
-        )
+        return self._build_task('conduct_stakeholder_debate_task', self.advocate_sub_agents(), [self.argument_generator, self.a2a_messenger, self.knowledge_base_manager])
 
     @task
     def moderate_debate_flow_task(self) -> Task:
-        task_config = self.tasks_config['moderate_debate_flow_task']
-        return Task(
-            description=task_config['description'],
-            expected_output=task_config['expected_output'],
-            agent=self.debate_moderator_agent(),
-            tools=[self.debate_moderator, self.a2a_messenger],
-        )
+        return self._build_task('moderate_debate_flow_task', self.debate_moderator_agent(), [self.debate_moderator, self.a2a_messenger])
 
     @task
     def summarize_debate_outcomes_task(self) -> Task:
-        task_config = self.tasks_config['summarize_debate_outcomes_task']
-        return Task(
-            description=task_config['description'],
-            expected_output=task_config['expected_output'],
-            agent=self.debate_moderator_agent(),
-            tools=[self.debate_moderator, self.knowledge_base_manager],
-        )
+        return self._build_task('summarize_debate_outcomes_task', self.debate_moderator_agent(), [self.debate_moderator, self.knowledge_base_manager])
 
     def preflight_health_check(self):
         """Check LLM and tool availability before running workflow."""
+        # The result only depends on the LLM and task config - skip the re-check until either changes
+        config_hash = hash((id(getattr(self, 'llm', None)), tuple(sorted(self.tasks_config.keys()))))
+        if config_hash == self._preflight_config_hash:
+            return list(self._preflight_cache)
+        
         errors = []
         
         # Check LLM - handle Claude, Gemini, W&B Inference, and fallback clients
@@ -775,8 +863,144 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
         except Exception as e:
             errors.append(f"Tool health check failed: {e}")
         
+        # Only cache a healthy result so a failed check is retried on the next run
+        if not errors:
+            self._preflight_cache = errors
+            self._preflight_config_hash = config_hash
         return errors
 
+    def _cached_execute(self, task: Task) -> Any:
+        """
+        Execute a task, reusing the output of an identical prompt from an earlier run
+        
+        Only exact prompt matches are reused, and only for tasks whose agent has no
+        tools - a tool task's side effects (knowledge-base writes, searches) must run.
+        """
+        if not self.task_cache_enabled or task.tools or getattr(task.agent, 'tools', None):
+            return self._execute_with_provider_limit(task)
+        
+        cache_key = LLMResponseCache.make_key(
+            model=getattr(self.llm, 'model', None) or getattr(self.llm, 'model_name', None),
+            agent=getattr(task.agent, 'role', None),
+            description=task.description,
+            expected_output=task.expected_output
+        )
+        cached_output = self._task_cache.get(cache_key)
+        if cached_output is not None:
+            return cached_output
+        
+        output = self._execute_with_provider_limit(task)
+        self._task_cache.set(cache_key, output)
+        return output
+
+    def _llm_provider(self) -> str:
+        """Provider family of the configured LLM, used to pick its concurrency limit"""
+        model_name = str(getattr(self.llm, 'model', None) or getattr(self.llm, 'model_name', '')).lower()
+        if 'claude' in model_name or 'anthropic' in model_name:
+            return 'anthropic'
+        if 'gemini' in model_name:
+            return 'gemini'
+        if 'ollama' in model_name:
+            return 'ollama'
+        return 'openai'
+
+    def _execute_with_provider_limit(self, task: Task) -> Any:
+        """
+        Execute a task while holding a slot of the provider's concurrency limit
+        
+        Rate-limit and network errors are retried with exponential backoff (the slot is
+        released while waiting); malformed JSON output is retried immediately.
+        """
+        limit = self._provider_limits.get(self._llm_provider(), self._provider_limits['openai'])
+        max_retries = CREWAI_CONFIG["max_task_retries"]
+        
+        for attempt in range(max_retries):
+            try:
+                with limit:
+                    return task.execute()
+            except json.JSONDecodeError:
+                if attempt == max_retries - 1:
+                    raise
+            except Exception as e:
+                error_msg = str(e).lower()
+                retryable = any(indicator in error_msg for indicator in [
+                    'rate limit', 'rate_limit', 'too many requests', '429', 'overloaded',
+                    'timeout', 'timed out', 'connection'
+                ])
+                if not retryable or attempt == max_retries - 1:
+                    raise
+                delay = min(2 ** attempt + random.uniform(0, 1), 30)
+                print(f"⚠️  LLM call failed ({e}), retrying in {delay:.1f}s...")
+                time.sleep(delay)
+
+    @staticmethod
+    def _spill_output(output_dir: str, result_key: str, output: Any) -> str:
+        """Write a task output to output_dir and return its path"""
+        path = os.path.join(output_dir, f"{result_key}.txt")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(str(output))
+        return path
+
+    @staticmethod
+    def _read_output(results: Dict[str, Any], result_key: str) -> Any:
+        """
+        Task output for result_key, reading it back from disk if it was spilled
+
+        Only call this where the text is actually consumed; reading spilled outputs
+        back puts them in memory again.
+        """
+        value = results[result_key]
+        if results.get('output_dir'):
+            with open(value, 'r', encoding='utf-8') as f:
+                return f.read()
+        return value
+
+    @classmethod
+    def _workflow_background_executor(cls) -> ThreadPoolExecutor:
+        """Persistent single-worker pool, so workflow runs don't start a thread each"""
+        if cls._background_executor is None:
+            with cls._background_executor_lock:
+                if cls._background_executor is None:
+                    cls._background_executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="workflow-background"
+                    )
+                    atexit.register(cls._background_executor.shutdown)
+        return cls._background_executor
+
+    def _execute_tasks_parallel(self, jobs: List[tuple], results: Dict[str, Any],
+                                errors: List[str], local_logger: logging.Logger,
+                                output_dir: Optional[str] = None):
+        """
+        Execute independent tasks concurrently
+        
+        Args:
+            jobs: List of (result_key, label, task) tuples; outputs are stored as results[result_key]
+            results: Workflow results dictionary to fill
+            errors: Workflow error list; failures are appended as "<label> failed: <error>"
+            local_logger: Orchestration logger
+            output_dir: If given, each output is written there as soon as it finishes and
+                results[result_key] holds the file path
+        """
+        if not jobs:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(len(jobs), 10)) as executor:
+            future_to_job = {}
+            for result_key, label, t in jobs:
+                local_logger.info(f"Running {label[0].lower() + label[1:]} task...")
+                future_to_job[executor.submit(self._cached_execute, t)] = (result_key, label)
+            
+            for future in as_completed(future_to_job):
+                result_key, label = future_to_job[future]
+                try:
+                    if output_dir:
+                        results[result_key] = self._spill_output(output_dir, result_key, future.result())
+                    else:
+                        results[result_key] = future.result()
+                except Exception as e:
+                    local_logger.error(f"{label} failed: {e}")
+                    errors.append(f"{label} failed: {e}")
+
     def run_debate_workflow(self, policy_text, stakeholder_list):
         """Run the full debate workflow with robust error handling."""
         # Use local logger only, do not attach to self or pass to Weave
@@ -810,12 +1034,23 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
             return {"success": False, "errors": errors}
 
         # 3. Setup tasks (explicit, robust, clear descriptions)
+        # Every description is this run's append-only context followed by the task instruction
+        context = DebateContext()
+        context.reset(policy_text, stakeholder_list)
+        argument_instruction = (
+            "Use the ArgumentGenerator tool to generate an opening argument for this stakeholder on the main debate topic. "
+            "Stakeholder: {stakeholder}\n"
+            "Return the argument as structured text."
+        )
+        synthesis_instruction = (
+            "Use the KnowledgeBaseManager tool to synthesize all stakeholder research into a summary. "
+            "Return a balanced summary."
+        )
         try:
             # Policy discovery task
             discovery_task = Task(
-                description=(
-                    "Use the policy discovery tools to find relevant policies for the following context. "
-                    f"Policy text: {policy_text}\nStakeholders: {stakeholder_list}\n"
+                description=context.render(
+                    "Use the policy discovery tools to find relevant policies for the context above. "
                     "Return a list of relevant policies."
                 ),
                 expected_output="List of relevant policies.",
@@ -823,9 +1058,8 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
             )
             # Stakeholder identification
             stakeholder_id_task = Task(
-                description=(
-                    "Use the StakeholderIdentifier tool to identify main stakeholders in the following policy. "
-                    f"Policy text: {policy_text}\n"
+                description=context.render(
+                    "Use the StakeholderIdentifier tool to identify main stakeholders in the policy above. "
                     "Return a list of stakeholders with their interests and stances."
                 ),
                 expected_output="List of stakeholders with interests and stances.",
@@ -835,9 +1069,9 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
             stakeholder_research_tasks = []
             for s, agent in zip(stakeholder_list, stakeholder_agents):
                 stakeholder_research_tasks.append(Task(
-                    description=(
-                        "Use the StakeholderResearcher tool to analyze the following policy for this stakeholder. "
-                        f"Stakeholder: {s}\nPolicy: {policy_text}\n"
+                    description=context.render(
+                        "Use the StakeholderResearcher tool to analyze the policy above for this stakeholder. "
+                        f"Stakeholder: {s}\n"
                         "Store findings in the knowledge base using KnowledgeBaseManager."
                     ),
                     expected_output=f"Research report for {s.get('name', 'stakeholder')}",
@@ -845,9 +1079,8 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
                 ))
             # Topic analysis
             topic_task = Task(
-                description=(
-                    "Use the TopicAnalyzer tool to identify key debate topics and areas of contention for the following policy and stakeholders. "
-                    f"Policy: {policy_text}\nStakeholders: {stakeholder_list}\n"
+                description=context.render(
+                    "Use the TopicAnalyzer tool to identify key debate topics and areas of contention for the policy and stakeholders above. "
                     "Return a list of debate topics."
                 ),
                 expected_output="List of debate topics.",
@@ -857,21 +1090,13 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
             argument_tasks = []
             for s, agent in zip(stakeholder_list, stakeholder_agents):
                 argument_tasks.append(Task(
-                    description=(
-                        "Use the ArgumentGenerator tool to generate an opening argument for this stakeholder on the main debate topic. "
-                        f"Stakeholder: {s}\nPolicy: {policy_text}\n"
-                        "Return the argument as structured text."
-                    ),
+                    description=context.render(argument_instruction.format(stakeholder=s)),
                     expected_output=f"Opening argument for {s.get('name', 'stakeholder')}",
                     agent=agent,
                 ))
             # Synthesis
             synthesis_task = Task(
-                description=(
-                    "Use the KnowledgeBaseManager tool to synthesize all stakeholder research into a summary. "
-                    f"Stakeholders: {stakeholder_list}\nPolicy: {policy_text}\n"
-                    "Return a balanced summary."
-                ),
+                description=context.render(synthesis_instruction),
                 expected_output="Balanced summary of all stakeholder perspectives.",
                 agent=action_agent,
             )
@@ -881,49 +1106,96 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
             return {"success": False, "errors": errors}
 
         # 4. Run workflow step by step, catching errors
+        # Each stakeholder phase fans out in parallel and is joined by a single sequential step:
+        # research -> topic analysis, arguments -> synthesis
+        # A near-duplicate earlier policy lets us reuse its stakeholder/topic planning
+        plan = None
+        if self.plan_cache_enabled:
+            plan, similarity = self._plan_cache.lookup(policy_text, stakeholder_list)
+            if plan is not None:
+                local_logger.info(f"planner: cache hit sim={similarity:.2f}")
+                results.update(plan)
+            else:
+                local_logger.info(f"planner: cache miss best_sim={similarity:.2f}")
+        # Topic analysis only needs the workflow inputs - start it now so its LLM round trip
+        # overlaps discovery, identification and research instead of following them
+        topic_future = None
+        if CREWAI_CONFIG["prefetch_topic_analysis"] and not plan:
+            local_logger.info("Prefetching topic analysis task...")
+            topic_future = self._workflow_background_executor().submit(self._cached_execute, topic_task)
+        # Discovery and identification only depend on the inputs - run them side by side
+        self._execute_tasks_parallel([
+            ('discovery', "Policy discovery", discovery_task),
+        ] + ([] if plan else [
+            ('stakeholder_id', "Stakeholder identification", stakeholder_id_task),
+        ]), results, errors, local_logger)
+        # Optionally persist per-stakeholder outputs to disk as they finish, so a crashed
+        # run keeps them; results then hold only paths until something reads them back
+        output_dir = None
+        if CREWAI_CONFIG["workflow_output_dir"]:
+            output_dir = os.path.join(CREWAI_CONFIG["workflow_output_dir"], uuid.uuid4().hex[:8])
+            os.makedirs(output_dir, exist_ok=True)
+            results['output_dir'] = output_dir
+        # Stakeholder research tasks are independent of each other - run them concurrently
+        self._execute_tasks_parallel([
+            (f'stakeholder_research_{i}', f"Stakeholder research {i}", t)
+            for i, t in enumerate(stakeholder_research_tasks)
+        ], results, errors, local_logger, output_dir)
         try:
-            local_logger.info("Running policy discovery task...")
-            results['discovery'] = discovery_task.execute()
-        except Exception as e:
-            local_logger.error(f"Policy discovery failed: {e}")
-            errors.append(f"Policy discovery failed: {e}")
-        try:
-            local_logger.info("Running stakeholder identification task...")
-            results['stakeholder_id'] = stakeholder_id_task.execute()
-        except Exception as e:
-            local_logger.error(f"Stakeholder identification failed: {e}")
-            errors.append(f"Stakeholder identification failed: {e}")
-        for i, t in enumerate(stakeholder_research_tasks):
-            try:
-                local_logger.info(f"Running stakeholder research task {i}...")
-                results[f'stakeholder_research_{i}'] = t.execute()
-            except Exception as e:
-                local_logger.error(f"Stakeholder research {i} failed: {e}")
-                errors.append(f"Stakeholder research {i} failed: {e}")
-        try:
-            local_logger.info("Running topic analysis task...")
-            results['topic_analysis'] = topic_task.execute()
+            if topic_future is not None:
+                results['topic_analysis'] = topic_future.result()
+            elif not plan:
+                local_logger.info("Running topic analysis task...")
+                results['topic_analysis'] = self._cached_execute(topic_task)
         except Exception as e:
             local_logger.error(f"Topic analysis failed: {e}")
             errors.append(f"Topic analysis failed: {e}")
-        for i, t in enumerate(argument_tasks):
-            try:
-                local_logger.info(f"Running argument generation task {i}...")
-                results[f'argument_{i}'] = t.execute()
-            except Exception as e:
-                local_logger.error(f"Argument generation {i} failed: {e}")
-                errors.append(f"Argument generation {i} failed: {e}")
+        # Optionally give argument and synthesis tasks the research and topics as extra context
+        if CREWAI_CONFIG["inject_research_context"]:
+            for i, s in enumerate(stakeholder_list):
+                if f'stakeholder_research_{i}' in results:
+                    context.append(f"Research for {s.get('name', 'stakeholder')}",
+                                   self._read_output(results, f'stakeholder_research_{i}'))
+            if 'topic_analysis' in results:
+                context.append("Debate topics", results['topic_analysis'])
+            for s, t in zip(stakeholder_list, argument_tasks, strict=True):
+                t.description = context.render(argument_instruction.format(stakeholder=s))
+            synthesis_task.description = context.render(synthesis_instruction)
+        self._execute_tasks_parallel([
+            (f'argument_{i}', f"Argument generation {i}", t)
+            for i, t in enumerate(argument_tasks)
+        ], results, errors, local_logger, output_dir)
         try:
             local_logger.info("Running synthesis task...")
-            results['synthesis'] = synthesis_task.execute()
+            results['synthesis'] = self._cached_execute(synthesis_task)
         except Exception as e:
             local_logger.error(f"Synthesis failed: {e}")
             errors.append(f"Synthesis failed: {e}")
 
         results['errors'] = errors
         results['success'] = len(errors) == 0
+        if self.plan_cache_enabled and results['success'] and not plan:
+            self._plan_cache.store(policy_text, stakeholder_list, {
+                'stakeholder_id': results['stakeholder_id'],
+                'topic_analysis': results['topic_analysis'],
+            })
         return results
 
+    @staticmethod
+    def _fresh_task(template: Task) -> Task:
+        """
+        New Task with a config-defined task's description, expected output, agent and tools
+        
+        CrewAI stores per-run state (output, timing) on Task objects and the @task
+        factories are memoized, so every crew gets its own copies.
+        """
+        return Task(
+            description=template.description,
+            expected_output=template.expected_output,
+            agent=template.agent,
+            tools=list(template.tools or []),
+        )
+
     def setup_dynamic_stakeholder_crew(self, stakeholder_list: List[Dict[str, Any]]) -> Crew:
         """Set up a dynamic crew with stakeholder-specific agents"""
         
@@ -945,15 +1217,17 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
         
         # Combine all agents and tasks
         # Get agents and tasks from the CrewBase class
-        base_agents = [self.coordinator_agent(), self.policy_discovery_agent(), 
-                      self.policy_debate_agent(), self.advocate_sub_agents(), 
-                      self.action_agent(), self.debate_moderator_agent()]
-        base_tasks = [self.receive_query_task(), self.fetch_policy_text_task(),
-                     self.analyze_policy_text_task(), self.dynamic_sub_agent_creation_task(),
-                     self.stakeholder_analysis_task(), self.synthesize_summary_task(),
-                     self.draft_email_task(), self.analyze_debate_topics_task(),
-                     self.initiate_debate_session_task(), self.conduct_stakeholder_debate_task(),
-                     self.moderate_debate_flow_task(), self.summarize_debate_outcomes_task()]
+        base_agents = [self.coordinator_agent(), self.policy_discovery_agent(),
+                       self.policy_debate_agent(), self.advocate_sub_agents(),
+                       self.action_agent(), self.debate_moderator_agent()]
+        base_tasks = [self._fresh_task(t) for t in (
+            self.receive_query_task(), self.fetch_policy_text_task(),
+            self.analyze_policy_text_task(), self.dynamic_sub_agent_creation_task(),
+            self.stakeholder_analysis_task(), self.synthesize_summary_task(),
+            self.draft_email_task(), self.analyze_debate_topics_task(),
+            self.initiate_debate_session_task(), self.conduct_stakeholder_debate_task(),
+            self.moderate_debate_flow_task(), self.summarize_debate_outcomes_task()
+        )]
         
         all_agents = base_agents + stakeholder_agents
         all_tasks = base_tasks + stakeholder_tasks
@@ -964,15 +1238,43 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
             tasks=all_tasks,
             process=Process.sequential,
             verbose=True,
-            manager_llm=self.llm,
         )
 
+    def _build_stakeholder_tasks(self, stakeholder_info: Dict[str, Any], agent: Agent) -> Tuple[Task, Task]:
+        """Build a stakeholder's (research, debate) task pair for the debate crew"""
+        template_values = {"name": stakeholder_info.get("name", "Unknown")}
+        
+        research_task = Task(
+            description=_STAKEHOLDER_RESEARCH_DESC_TPL.format_map(template_values),
+            expected_output=_STAKEHOLDER_RESEARCH_OUTPUT_TPL.format_map(template_values),
+            agent=agent,  # Assign to specific stakeholder agent
+            tools=list(self._research_tools),
+            async_execution=True,
+        )
+        debate_task = Task(
+            description=_STAKEHOLDER_DEBATE_DESC_TPL.format_map(template_values),
+            expected_output=_STAKEHOLDER_DEBATE_OUTPUT_TPL.format_map(template_values),
+            agent=agent,
+            tools=list(self._debate_tools),
+            context=[research_task],
+            async_execution=True,
+        )
+        return research_task, debate_task
+
     def setup_debate_crew(self, stakeholder_list: List[Dict[str, Any]]) -> Crew:
-        """Set up a crew specifically for conducting structured debates with A2A protocols"""
+        """
+        Set up a crew specifically for conducting structured debates with A2A protocols
+        
+        Stakeholders are independent, so their research and argument tasks run as
+        parallel phases (async_execution) and the moderator tasks after each phase
+        act as the sequential join:
+            topics -> research (parallel) -> initiate session -> arguments (parallel) -> moderate -> summarize
+        """
         
         # Create stakeholder agents with debate capabilities
         stakeholder_agents = []
-        stakeholder_tasks = []
+        research_tasks = []
+        argument_tasks = []
         
         for stakeholder_info in stakeholder_list:
             agent = self.create_stakeholder_agent(stakeholder_info)
@@ -980,23 +1282,10 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
             
             stakeholder_name = stakeholder_info.get("name", "Unknown")
             
-            # Create stakeholder-specific research task for this agent
-            stakeholder_research_task = Task(
-                description=f"IMPORTANT: Use the StakeholderResearcher tool directly to conduct detailed analysis of the policy from {stakeholder_name}'s perspective. Do NOT delegate this task. Use the KnowledgeBaseManager tool to store your findings. Use SerperDevTool for additional research if needed. You must complete this analysis yourself using the available tools.",
-                expected_output=f"Comprehensive research report from {stakeholder_name}'s perspective stored in the knowledge base using KnowledgeBaseManager.",
-                agent=agent,  # Assign to specific stakeholder agent
-                tools=[self.stakeholder_researcher, self.knowledge_base_manager, SerperDevTool()]
-            )
-            
-            # Create stakeholder-specific debate task for this agent
-            stakeholder_debate_task = Task(
-                description=f"IMPORTANT: Use the ArgumentGenerator tool directly to create evidence-based arguments from {stakeholder_name}'s perspective on the debate topics. Use A2AMessenger for structured communication with other agents. Do NOT delegate this task. You must generate arguments yourself using the available tools.",
-                expected_output=f"Evidence-based arguments from {stakeholder_name}'s perspective using ArgumentGenerator, with structured communication via A2AMessenger.",
-                agent=agent,  # Assign to specific stakeholder agent
-                tools=[self.argument_generator, self.a2a_messenger, self.knowledge_base_manager]
-            )
+            stakeholder_research_task, stakeholder_debate_task = self._build_stakeholder_tasks(stakeholder_info, agent)
             
-            stakeholder_tasks.extend([stakeholder_research_task, stakeholder_debate_task])
+            research_tasks.append(stakeholder_research_task)
+            argument_tasks.append(stakeholder_debate_task)
             
             # Store for later reference
             self.stakeholder_agents[stakeholder_name] = agent
@@ -1009,22 +1298,70 @@ class DynamicCrewAutomationForPolicyAnalysisAndDebateCrew():
             self.policy_debate_agent(),
         ] + stakeholder_agents
         
-        # Debate-specific tasks (non-stakeholder tasks)
-        debate_tasks = [
+        # Debate-specific tasks, with each parallel stakeholder phase followed by a synchronous join
+        topics_task, initiate_task, moderate_task, summarize_task = (self._fresh_task(t) for t in (
             self.analyze_debate_topics_task(),
             self.initiate_debate_session_task(),
             self.moderate_debate_flow_task(),
             self.summarize_debate_outcomes_task(),
-        ] + stakeholder_tasks  # Add stakeholder-specific tasks
+        ))
+        debate_tasks = (
+            [topics_task] + research_tasks +
+            [initiate_task] + argument_tasks +
+            [moderate_task, summarize_task]
+        )
         
         return Crew(
             agents=debate_agents,
             tasks=debate_tasks,
-            process=Process.hierarchical,
+            process=Process.sequential,
             verbose=True,
-            manager_llm=self.llm,
         )
 
+    def kickoff_for_each_parallel(self, inputs_list: List[Dict[str, Any]], max_workers: int = None) -> List[Any]:
+        """
+        Run the crew once per input set on a bounded thread pool
+        
+        Args:
+            inputs_list: List of kickoff inputs (e.g. [{"policy_name": "policy_1"}, ...])
+            max_workers: Maximum concurrent kickoffs (defaults to CIVICAI_LLM_CONCURRENCY)
+            
+        Returns:
+            Kickoff results in the same order as inputs_list
+        """
+        if not inputs_list:
+            return []
+        
+        max_workers = min(max_workers or CREWAI_CONFIG["llm_concurrency"], len(inputs_list))
+        base_crew = self.crew()
+        results = [None] * len(inputs_list)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Crew.copy() gives every kickoff its own Agent and Task objects, so per-run state
+            # (task outputs, agent executors) is not shared. The copies still share the tool
+            # instances and the LLM: the tools keep no per-call state (KnowledgeBaseManager
+            # only writes per-stakeholder files), the LLM holds configuration only, and this
+            # crew runs without memory
+            future_to_index = {
+                executor.submit(base_crew.copy().kickoff, inputs=inputs): i
+                for i, inputs in enumerate(inputs_list)
+            }
+            
+            for future in as_completed(future_to_index):
+                i = future_to_index[future]
+                results[i] = future.result()
+                logger.info("Kickoff %d/%d completed", i + 1, len(inputs_list))
+        
+        return results
+
+    def close(self):
+        """Release pooled LLM provider connections; call once the crew is no longer needed"""
+        llm_client = getattr(self, 'llm_client', None)
+        if llm_client is not None and hasattr(llm_client, 'close'):
+            llm_client.close()
+        # Tools share the global client
+        close_weave_client()
+
     @crew
     def crew(self) -> Crew:
         """Creates the DynamicCrewAutomationForPolicyAnalysisAndDebate crew"""
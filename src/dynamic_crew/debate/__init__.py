@@ -15,7 +15,7 @@ from .systems.weave import WeaveDebateSystem
 from .systems.human import HumanDebateSystem
 from .moderator import HumanModerator
 from .personas import HumanPersona
-from .base import BaseDebateSystem
+from .base import BaseDebateSystem, ToolError
 
 __all__ = [
     'DebugDebateSystem',
@@ -23,7 +23,8 @@ __all__ = [
     'HumanDebateSystem',
     'HumanModerator',
     'HumanPersona',
-    'BaseDebateSystem'
+    'BaseDebateSystem',
+    'ToolError'
 ]
 
 __version__ = '1.0.0' 
\ No newline at end of file
@@ -4,125 +4,78 @@ Base debate system with common functionality for all debate implementations.
 
 import os
 import json
-import uuid
+import logging
+import asyncio
+import atexit
+import copy
+import hashlib
+import io
+import threading
+import secrets
 import time
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Any, Optional, Tuple
 from abc import ABC, abstractmethod
+from collections import deque
+from functools import cached_property, lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from heapq import nlargest
 
-from ..tools.custom_tool import (
-    PolicyFileReader,
-    StakeholderIdentifier,
-    KnowledgeBaseManager,
-    StakeholderResearcher,
-    TopicAnalyzer,
-    ArgumentGenerator,
-    A2AMessenger,
-    DebateModerator
-)
+# orjson is a much faster drop-in for the JSON blobs passed between tools; fall back to json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
+# pysimdjson parses with SIMD structural indexing; preferred over orjson for decoding when installed
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
 
-class BaseDebateSystem(ABC):
-    """
-    Base class for all debate systems with common functionality.
-    """
-    
-    def __init__(self, system_name: str):
-        """Initialize the base debate system"""
-        self.system_name = system_name
-        self.session_id = f"{system_name}_{uuid.uuid4().hex[:8]}"
-        
-        # Initialize tools
-        self.policy_reader = PolicyFileReader()
-        self.stakeholder_identifier = StakeholderIdentifier()
-        self.kb_manager = KnowledgeBaseManager()
-        self.stakeholder_researcher = StakeholderResearcher()
-        self.topic_analyzer = TopicAnalyzer()
-        self.argument_generator = ArgumentGenerator()
-        self.a2a_messenger = A2AMessenger()
-        self.debate_moderator = DebateModerator()
-        
-        # Common tracking
-        self.debate_round = 0
-        self.conversation_history = []
-        self.all_arguments = []
-        self.personas = {}
-        
-        print(f"🎭 {system_name} Active - Session: {self.session_id}")
-    
-    def log_step(self, step: str, message: str, status: str = "🔄"):
-        """Log each step with timestamp - base implementation"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"\n[{timestamp}] {status} {step}: {message}")
-    
-    def log_agent_action(self, agent_name: str, action: str, details: str = ""):
-        """Log individual agent actions - base implementation"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"[{timestamp}] 🤖 {agent_name}: {action}")
-        if details:
-            print(f"    💬 {details}")
+# ijson streams list items out of a JSON document without building the enclosing object
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
-    def load_policy(self, policy_name: str) -> Dict[str, Any]:
-        """Load policy data from file"""
-        try:
-            # Ensure the filename has the .json extension
-            if not policy_name.endswith('.json'):
-                policy_file = f"{policy_name}.json"
-            else:
-                policy_file = policy_name
-            
-            policy_result = self.policy_reader._run(policy_file)
-            
-            if policy_result.startswith("Error"):
-                return {"error": policy_result}
-            
-            policy_data = json.loads(policy_result)
-            
-            # Handle nested policy structure
-            if "policy_document" in policy_data:
-                policy_doc = policy_data["policy_document"]
-                return {
-                    "id": policy_name,
-                    "title": policy_doc.get("title", "Unknown Policy"),
-                    "text": policy_doc.get("text", ""),
-                    "source_url": policy_doc.get("source_url", ""),
-                    "summary": policy_doc.get("summary", "No summary available"),
-                    "date": policy_data.get("date", "Unknown Date"),
-                    "user_profile": policy_data.get("user_profile", {})
-                }
-            else:
-                # Handle flat structure (fallback)
-                return {
-                    "id": policy_name,
-                    "title": policy_data.get("title", "Unknown Policy"),
-                    "text": policy_data.get("text", ""),
-                    "summary": policy_data.get("summary", "No summary available"),
-                    "date": policy_data.get("date", "Unknown Date")
-                }
-        except Exception as e:
-            return {"error": f"Error loading policy: {str(e)}"}
-    
-    def get_llm_response(self, prompt: str, analysis_type: str = "general") -> Dict[str, Any]:
-        """Get LLM response using Claude instead of mock weave client"""
-        try:
-            # Import here to avoid circular imports
-            from crewai import LLM
-            import os
-            
-            # Try to use Claude LLM
-            anthropic_api_key = os.getenv('ANTHROPIC_API_KEY')
-            if anthropic_api_key:
-                llm = LLM(
-                    model="claude-3-5-sonnet-20241022",
-                    api_key=anthropic_api_key,
-                    temperature=0.7,
-                    max_tokens=4096
-                )
-                
-                # Create analysis-specific prompts
-                if analysis_type == "stakeholder_identification":
-                    formatted_prompt = f"""
+from ..config import CREWAI_CONFIG
+from ..llm_cache import LLMResponseCache
+
+# Tool classes are imported when first used (see the tool properties below); the
+# custom_tool module pulls in CrewAI and every tool's dependencies
+if TYPE_CHECKING:
+    from ..tools.custom_tool import (
+        PolicyFileReader,
+        StakeholderIdentifier,
+        KnowledgeBaseManager,
+        StakeholderResearcher,
+        TopicAnalyzer,
+        ArgumentGenerator,
+        A2AMessenger,
+        DebateModerator
+    )
+
+# Arguments requested per multi-item LLM call; keeps each response well under max_tokens
+ARGUMENT_BATCH_SIZE = 8
+
+# Debate analysis types whose LLM responses are reused within a debate; user-facing
+# prompts (moderator replies, emails, pivots) are always sent fresh
+CACHED_ANALYSIS_TYPES = frozenset({"stakeholder_identification", "topic_analysis", "argument_generation"})
+
+# In-flight stakeholder research calls allowed by research_stakeholders_async
+RESEARCH_ASYNC_CONCURRENCY = int(os.getenv("CIVIC_RESEARCH_CONCURRENCY", "20"))
+
+# Seconds of demo pause between speakers; 0 (the default) skips the pacing sleeps
+DEBATE_PACING = float(os.getenv("CIVIC_DEBATE_PACING", "0"))
+
+
+# Prompt templates for get_llm_response, filled with str.format_map
+_STAKEHOLDER_PROMPT_TPL = """
 Analyze the following policy text and identify ONLY the main stakeholders who are directly and significantly affected.
 
 Policy Text:
@@ -142,8 +95,8 @@ Return ONLY a valid JSON object with this exact structure:
     ]
 }}
 """
-                elif analysis_type == "topic_analysis":
-                    formatted_prompt = f"""
+
+_TOPIC_PROMPT_TPL = """
 Analyze this policy and identify key debate topics that would generate discussion.
 
 Policy Text:
@@ -162,30 +115,405 @@ Return ONLY a valid JSON object with this structure:
     ]
 }}
 """
-                elif analysis_type == "policy_explanation":
-                    formatted_prompt = f"""
+
+_POLICY_EXPLANATION_PROMPT_TPL = """
 {prompt}
 
 You are an expert policy analyst. Provide a comprehensive, citizen-friendly explanation that helps ordinary people understand this policy's real-world impact. Use clear, accessible language and avoid legal jargon. Return ONLY valid JSON with no markdown formatting.
 """
-                elif analysis_type == "argument_generation":
-                    formatted_prompt = prompt  # For argument generation, the prompt is already formatted
+
+# Argument prompts put the text shared by every request first, then the topic, then the
+# speaker, so requests in a debate share the longest possible prefix for provider prompt caching
+_ARGUMENT_PROMPT_TPL = """
+You are representing a stakeholder in a policy debate. The argument you generate MUST be:
+- Factual and evidence-based (NO made-up statistics, data, or research citations)
+- Based on logical reasoning and real-world policy implications
+- Relevant to their likely interests and concerns as this stakeholder group
+- Professional, respectful, and substantive
+- 2-3 sentences long
+- Focused on actual policy impacts rather than speculative numbers
+
+IMPORTANT: Do NOT include any specific statistics, percentages, dollar amounts, or research citations unless they are widely known public facts. Focus on logical arguments about policy impacts, implementation challenges, and stakeholder concerns.
+
+Return ONLY a valid JSON object with this structure:
+{{
+    "stakeholder_name": "Stakeholder name",
+    "argument_type": "Argument type",
+    "content": "The actual argument content here (no made-up statistics)",
+    "key_points": ["main concern 1", "main concern 2"],
+    "reasoning": "The logical basis for this argument",
+    "concerns_addressed": ["specific concern 1", "specific concern 2"]
+}}
+
+Topic: {topic_title}
+Description: {topic_description}
+
+Generate a {argument_type} argument from {stakeholder_name}'s perspective on "{topic_title}" (stakeholder_name: "{stakeholder_name}", argument_type: "{argument_type}").
+"""
+
+_ARGUMENT_BATCH_PROMPT_HEAD = """
+You are representing several stakeholders in a policy debate. Each <item> at the end asks for one argument.
+
+For EACH item, generate the argument from that stakeholder's perspective. Every argument MUST be:
+- Factual and evidence-based (NO made-up statistics, data, or research citations)
+- Based on logical reasoning and real-world policy implications
+- Relevant to the stakeholder's likely interests and concerns
+- Professional, respectful, and substantive
+- 2-3 sentences long
+
+Return ONLY a valid JSON object with this structure, one entry per item id:
+{
+    "arguments": [
+        {
+            "id": 0,
+            "stakeholder_name": "Stakeholder name",
+            "argument_type": "Argument type",
+            "content": "The actual argument content here (no made-up statistics)",
+            "key_points": ["main concern 1", "main concern 2"],
+            "reasoning": "The logical basis for this argument",
+            "concerns_addressed": ["specific concern 1", "specific concern 2"]
+        }
+    ]
+}
+
+"""
+
+_PROMPT_TEMPLATES = {
+    "stakeholder_identification": _STAKEHOLDER_PROMPT_TPL,
+    "topic_analysis": _TOPIC_PROMPT_TPL,
+    "policy_explanation": _POLICY_EXPLANATION_PROMPT_TPL,
+}
+
+
+logger = logging.getLogger(__name__)
+
+
+class _LLMRateGate:
+    """
+    Caps concurrent LLM requests and smooths them to a requests-per-minute budget
+
+    The budget is a leaky bucket: up to `requests_per_minute` requests may start in
+    a burst, after which starts are spaced to the sustained rate.
+    """
+
+    def __init__(self, max_concurrency: int, requests_per_minute: float):
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._capacity = float(requests_per_minute)
+        self._rate = requests_per_minute / 60.0
+        self._level = 0.0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self._slots.acquire()
+        if self._rate > 0:
+            with self._lock:
+                now = time.monotonic()
+                self._level = max(0.0, self._level - (now - self._updated) * self._rate)
+                self._updated = now
+                wait = (self._level + 1 - self._capacity) / self._rate
+                self._level += 1
+            if wait > 0:
+                time.sleep(wait)
+        return self
+
+    def __exit__(self, *exc_info):
+        self._slots.release()
+
+
+class ToolError(Exception):
+    """A debate tool returned its "Error..." result instead of data"""
+
+
+def _call_tool(tool, *args) -> str:
+    """Run a tool and raise ToolError for its error sentinel, so callers handle failures in one except"""
+    result = tool._run(*args)
+    if result.startswith("Error"):
+        raise ToolError(result)
+    return result
+
+
+# simdjson parsers reuse their buffers and are not thread-safe - one per thread
+_simdjson_local = threading.local()
+
+
+def _json_loads(data):
+    """Parse JSON text, using simdjson or orjson when available"""
+    if SIMDJSON_AVAILABLE:
+        parser = getattr(_simdjson_local, "parser", None)
+        if parser is None:
+            parser = _simdjson_local.parser = simdjson.Parser()
+        try:
+            # recursive=True builds plain dicts/lists, so results outlive the parser buffer
+            return parser.parse(data.encode("utf-8") if isinstance(data, str) else data, recursive=True)
+        except ValueError as e:
+            # Callers handle json.JSONDecodeError, as raised by json and orjson
+            doc = data if isinstance(data, str) else bytes(data).decode("utf-8", "replace")
+            raise json.JSONDecodeError(str(e), doc, 0) from e
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to a JSON string, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+def _json_line(obj) -> bytes:
+    """Encode one NDJSON record (JSON plus trailing newline) as bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + "\n").encode("utf-8")
+
+
+def _policy_from_data(policy_name: str, policy_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the fields the debate systems use from a parsed policy file"""
+    # Handle nested policy structure
+    if "policy_document" in policy_data:
+        policy_doc = policy_data["policy_document"]
+        return {
+            "id": policy_name,
+            "title": policy_doc.get("title", "Unknown Policy"),
+            "text": policy_doc.get("text", ""),
+            "source_url": policy_doc.get("source_url", ""),
+            "summary": policy_doc.get("summary", "No summary available"),
+            "date": policy_data.get("date", "Unknown Date"),
+            "user_profile": policy_data.get("user_profile", {})
+        }
+    # Handle flat structure (fallback)
+    return {
+        "id": policy_name,
+        "title": policy_data.get("title", "Unknown Policy"),
+        "text": policy_data.get("text", ""),
+        "summary": policy_data.get("summary", "No summary available"),
+        "date": policy_data.get("date", "Unknown Date")
+    }
+
+
+@lru_cache(maxsize=32)
+def _read_policy(policy_name: str, policy_file: str, mtime: float) -> Dict[str, Any]:
+    """Policy fields from PolicyFileReader, cached per (policy, file mtime) across debate systems"""
+    from ..tools.custom_tool import PolicyFileReader
+    return _policy_from_data(policy_name, _json_loads(_call_tool(PolicyFileReader(), policy_file)))
+
+
+def _strip_json_fences(response: str) -> str:
+    """Remove the ```json markdown fence the LLM sometimes wraps its JSON in"""
+    cleaned_response = response.strip()
+    if cleaned_response.startswith("```json"):
+        cleaned_response = cleaned_response[7:]
+    if cleaned_response.endswith("```"):
+        cleaned_response = cleaned_response[:-3]
+    return cleaned_response.strip()
+
+
+# (second, "HH:MM:SS") of the last log line; a tuple so threads always see a matching pair
+_log_clock = (0, "")
+
+
+def _log_timestamp() -> str:
+    """Current time as HH:MM:SS, formatted at most once per second"""
+    global _log_clock
+    now = int(time.time())
+    if _log_clock[0] != now:
+        _log_clock = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _log_clock[1]
+
+
+def _topic_priority(topic: Dict[str, Any]) -> float:
+    """Sort key for debate topics; LLM output may omit the priority or give it as a string"""
+    try:
+        return float(topic.get('priority', 0))
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class BaseDebateSystem(ABC):
+    """
+    Base class for all debate systems with common functionality.
+    """
+    
+    # Research worker pool shared by every debate system in the process, created on first use
+    _executor: ClassVar[Optional[ThreadPoolExecutor]] = None
+    _executor_lock: ClassVar[threading.Lock] = threading.Lock()
+    # Research runs on the shared pool; knowledge-base file writes from every system go one at a time
+    _kb_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    # Every LLM-backed call in the process (research, arguments, analyses) passes through
+    # this gate, so parallel fan-out stays inside the provider's rate limits
+    _llm_gate: ClassVar[_LLMRateGate] = _LLMRateGate(
+        CREWAI_CONFIG["llm_concurrency"],
+        CREWAI_CONFIG["llm_requests_per_minute"]
+    )
+    
+    def __init__(self, system_name: str, pacing: Optional[float] = None):
+        """Initialize the base debate system; pacing defaults to CIVIC_DEBATE_PACING"""
+        self.system_name = system_name
+        self.pacing = DEBATE_PACING if pacing is None else pacing
+        self.session_id = f"{system_name}_{secrets.token_hex(4)}"
+        
+        # Common tracking
+        self.debate_round = 0
+        # Ring buffers: long debates keep only the most recent CIVIC_HISTORY_MAX entries in memory
+        history_max = int(os.getenv("CIVIC_HISTORY_MAX", "10000"))
+        self.conversation_history = deque(maxlen=history_max)
+        self.all_arguments = deque(maxlen=history_max)
+        self.personas = {}
+        
+        # Read-only context of the current moderator session, and its serialized form
+        self.session_context: Optional[MappingProxyType] = None
+        self._session_context_json: Optional[str] = None
+        self._session_context_key: Optional[tuple] = None
+        
+        # Raw JSON of successful debate-analysis responses, keyed by prompt hash; bounded,
+        # and cleared when a debate starts so long-lived instances never serve stale answers
+        self._llm_cache = LLMResponseCache(
+            max_entries=int(os.getenv("CIVIC_LLM_CACHE_MAX", "256")),
+            ttl_seconds=float(os.getenv("CIVIC_LLM_CACHE_TTL", "3600"))
+        )
+        
+        # Serialized A2A contexts for this session - every pair in a round sends the same one
+        self._ctx_cache: Dict[tuple, str] = {}
+        
+        logger.info(f"🎭 {system_name} Active - Session: {self.session_id}")
+    
+    # Tools are created on first use; most debate systems only touch a few of them
+    @cached_property
+    def policy_reader(self) -> "PolicyFileReader":
+        from ..tools.custom_tool import PolicyFileReader
+        return PolicyFileReader()
+    
+    @cached_property
+    def stakeholder_identifier(self) -> "StakeholderIdentifier":
+        from ..tools.custom_tool import StakeholderIdentifier
+        return StakeholderIdentifier()
+    
+    @cached_property
+    def kb_manager(self) -> "KnowledgeBaseManager":
+        from ..tools.custom_tool import KnowledgeBaseManager
+        return KnowledgeBaseManager()
+    
+    @cached_property
+    def stakeholder_researcher(self) -> "StakeholderResearcher":
+        from ..tools.custom_tool import StakeholderResearcher
+        return StakeholderResearcher()
+    
+    @cached_property
+    def topic_analyzer(self) -> "TopicAnalyzer":
+        from ..tools.custom_tool import TopicAnalyzer
+        return TopicAnalyzer()
+    
+    @cached_property
+    def argument_generator(self) -> "ArgumentGenerator":
+        from ..tools.custom_tool import ArgumentGenerator
+        return ArgumentGenerator()
+    
+    @cached_property
+    def a2a_messenger(self) -> "A2AMessenger":
+        from ..tools.custom_tool import A2AMessenger
+        return A2AMessenger()
+    
+    @cached_property
+    def debate_moderator(self) -> "DebateModerator":
+        from ..tools.custom_tool import DebateModerator
+        return DebateModerator()
+    
+    @cached_property
+    def _llm(self):
+        """Claude LLM shared by every get_llm_response call of this system, or None without an API key"""
+        # Import here to avoid circular imports
+        from crewai import LLM
+        
+        anthropic_api_key = os.getenv('ANTHROPIC_API_KEY')
+        if not anthropic_api_key:
+            return None
+        return LLM(
+            model="claude-3-5-sonnet-20241022",
+            api_key=anthropic_api_key,
+            temperature=0.7,
+            max_tokens=4096
+        )
+    
+    def log_step(self, step: str, message: str, status: str = "🔄"):
+        """Log each step with timestamp - base implementation"""
+        timestamp = _log_timestamp()
+        logger.info(f"\n[{timestamp}] {status} {step}: {message}")
+    
+    def log_agent_action(self, agent_name: str, action: str, details: str = ""):
+        """Log individual agent actions - base implementation"""
+        timestamp = _log_timestamp()
+        logger.info(f"[{timestamp}] 🤖 {agent_name}: {action}")
+        if details:
+            logger.info(f"    💬 {details}")
+    
+    def pause(self, beats: float = 1.0):
+        """Demo pause of beats * pacing seconds; does nothing when pacing is 0"""
+        if self.pacing:
+            time.sleep(beats * self.pacing)
+
+    def load_policy(self, policy_name: str) -> Dict[str, Any]:
+        """Load policy data from file"""
+        try:
+            # Ensure the filename has the .json extension
+            if not policy_name.endswith('.json'):
+                policy_file = f"{policy_name}.json"
+            else:
+                policy_file = policy_name
+            
+            # Replays of an unchanged policy file skip PolicyFileReader and the parse entirely
+            policy_path = policy_file if os.path.isabs(policy_file) else os.path.join("test_data", policy_file)
+            try:
+                if os.path.exists(policy_path):
+                    policy = _read_policy(policy_name, policy_file, os.stat(policy_path).st_mtime)
                 else:
-                    formatted_prompt = prompt
-                
-                response = llm.call(formatted_prompt)
+                    policy = _policy_from_data(policy_name, _json_loads(_call_tool(self.policy_reader, policy_file)))
+            except ToolError as e:
+                return {"error": str(e)}
+            # Callers get their own copy - the cached policy is shared
+            return copy.deepcopy(policy)
+        except Exception as e:
+            return {"error": f"Error loading policy: {str(e)}"}
+    
+    @staticmethod
+    def _llm_cache_key(prompt: str, analysis_type: str) -> Optional[str]:
+        """Cache key for a prompt, or None when responses of this analysis type must not be reused"""
+        if analysis_type not in CACHED_ANALYSIS_TYPES:
+            return None
+        return hashlib.blake2b(f"{analysis_type}|{prompt}".encode(), digest_size=16).hexdigest()
+    
+    def _call_llm(self, prompt: str, analysis_type: str) -> str:
+        """Send the analysis-specific prompt to the LLM and return the raw response"""
+        # Analysis-specific prompt; argument generation and others arrive already formatted
+        formatted_prompt = _PROMPT_TEMPLATES.get(analysis_type, "{prompt}").format_map({"prompt": prompt})
+        with self._llm_gate:
+            return self._llm.call(formatted_prompt)
+    
+    def get_llm_response(self, prompt: str, analysis_type: str = "general") -> Dict[str, Any]:
+        """Get LLM response using Claude instead of mock weave client"""
+        # Identical prompts recur within a debate (same policy text, repeated argument prompts)
+        cache_key = self._llm_cache_key(prompt, analysis_type)
+        cached = self._llm_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            # Re-parse so callers always get their own copy to mutate
+            return _json_loads(cached)
+        
+        try:
+            # Try to use Claude LLM
+            if self._llm is not None:
+                response = self._call_llm(prompt, analysis_type)
                 
                 # Try to parse as JSON
                 try:
                     # Clean up response if it has markdown formatting
-                    cleaned_response = response.strip()
-                    if cleaned_response.startswith("```json"):
-                        cleaned_response = cleaned_response[7:]
-                    if cleaned_response.endswith("```"):
-                        cleaned_response = cleaned_response[:-3]
-                    cleaned_response = cleaned_response.strip()
+                    cleaned_response = _strip_json_fences(response)
                     
-                    return json.loads(cleaned_response)
+                    result = _json_loads(cleaned_response)
+                    if cache_key is not None and isinstance(result, dict) and "error" not in result:
+                        self._llm_cache.set(cache_key, cleaned_response)
+                    return result
                 except json.JSONDecodeError:
                     # If not valid JSON, return as text
                     return {"error": f"Failed to parse JSON response: {response}"}
@@ -195,13 +523,48 @@ You are an expert policy analyst. Provide a comprehensive, citizen-friendly expl
         except Exception as e:
             return {"error": f"LLM error: {str(e)}"}
 
+    def get_llm_response_key(self, prompt: str, analysis_type: str, target_key: str) -> Dict[str, Any]:
+        """
+        Like get_llm_response, but only extracts the list under `target_key`
+
+        With ijson installed the list items are streamed out of the response text,
+        so the rest of the document is never materialized.
+
+        Returns:
+            {target_key: [items]} or {"error": message}
+        """
+        if not IJSON_AVAILABLE:
+            result = self.get_llm_response(prompt, analysis_type)
+            if "error" in result:
+                return result
+            return {target_key: result.get(target_key, [])}
+        
+        cache_key = self._llm_cache_key(prompt, analysis_type)
+        try:
+            cleaned_response = self._llm_cache.get(cache_key) if cache_key is not None else None
+            if cleaned_response is None:
+                if self._llm is None:
+                    return {"error": "No LLM available - ANTHROPIC_API_KEY not found"}
+                cleaned_response = _strip_json_fences(self._call_llm(prompt, analysis_type))
+            
+            try:
+                items = list(ijson.items(io.BytesIO(cleaned_response.encode("utf-8")), f"{target_key}.item", use_float=True))
+            except ijson.JSONError:
+                return {"error": f"Failed to parse JSON response: {cleaned_response}"}
+            
+            if cache_key is not None:
+                self._llm_cache.set(cache_key, cleaned_response)
+            return {target_key: items}
+        except Exception as e:
+            return {"error": f"LLM error: {str(e)}"}
+
     def identify_stakeholders(self, policy_text: str) -> List[Dict[str, Any]]:
         """Identify stakeholders using proper LLM"""
         try:
-            result = self.get_llm_response(policy_text, "stakeholder_identification")
+            result = self.get_llm_response_key(policy_text, "stakeholder_identification", "stakeholders")
             
             if "error" in result:
-                print(f"❌ Error in stakeholder identification: {result['error']}")
+                logger.error(f"❌ Error in stakeholder identification: {result['error']}")
                 # Return fallback stakeholders
                 return [
                     {"name": "Tenants", "type": "residents", "interests": ["affordable_housing"], "likely_stance": "supportive"},
@@ -210,16 +573,16 @@ You are an expert policy analyst. Provide a comprehensive, citizen-friendly expl
                 ]
             
             stakeholders = result.get("stakeholders", [])
-            print(f"✅ Found {len(stakeholders)} stakeholders")
+            logger.info(f"✅ Found {len(stakeholders)} stakeholders")
             for i, stakeholder in enumerate(stakeholders, 1):
                 name = stakeholder.get('name', 'Unknown')
                 stance = stakeholder.get('stance', stakeholder.get('likely_stance', 'neutral'))
-                print(f"   {i}. {name} (Stance: {stance})")
+                logger.info(f"   {i}. {name} (Stance: {stance})")
             
             return stakeholders
             
         except Exception as e:
-            print(f"❌ Error in stakeholder identification: {str(e)}")
+            logger.error(f"❌ Error in stakeholder identification: {str(e)}")
             # Return fallback stakeholders
             return [
                 {"name": "Tenants", "type": "residents", "interests": ["affordable_housing"], "likely_stance": "supportive"},
@@ -235,11 +598,12 @@ You are an expert policy analyst. Provide a comprehensive, citizen-friendly expl
             for stakeholder in stakeholders:
                 stakeholder_context += f"- {stakeholder.get('name', 'Unknown')}: {stakeholder.get('likely_stance', 'neutral')} stance\n"
             
-            combined_prompt = policy_text + stakeholder_context
-            result = self.get_llm_response(combined_prompt, "topic_analysis")
+            # Without stakeholders the policy text alone is sent (see prepare_debate)
+            combined_prompt = policy_text + stakeholder_context if stakeholders else policy_text
+            result = self.get_llm_response_key(combined_prompt, "topic_analysis", "debate_topics")
             
             if "error" in result:
-                print(f"❌ Error in topic analysis: {result['error']}")
+                logger.error(f"❌ Error in topic analysis: {result['error']}")
                 # Return fallback topics
                 return [
                     {
@@ -252,16 +616,16 @@ You are an expert policy analyst. Provide a comprehensive, citizen-friendly expl
                 ]
             
             topics = result.get("debate_topics", [])
-            print(f"✅ Found {len(topics)} debate topics")
+            logger.info(f"✅ Found {len(topics)} debate topics")
             for i, topic in enumerate(topics, 1):
                 title = topic.get('title', 'Unknown Topic')
                 priority = topic.get('priority', 'N/A')
-                print(f"   {i}. {title} (Priority: {priority}/10)")
+                logger.info(f"   {i}. {title} (Priority: {priority}/10)")
             
             return topics
             
         except Exception as e:
-            print(f"❌ Error in topic analysis: {str(e)}")
+            logger.error(f"❌ Error in topic analysis: {str(e)}")
             # Return fallback topics
             return [
                 {
@@ -273,37 +637,98 @@ You are an expert policy analyst. Provide a comprehensive, citizen-friendly expl
                 }
             ]
 
-    def research_single_stakeholder(self, stakeholder: Dict[str, Any], policy_text: str) -> Dict[str, Any]:
+    def prepare_debate(self, policy_text: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Identify stakeholders and analyze topics with concurrent LLM calls
+
+        Topic analysis only needs the policy text, so it runs without stakeholder
+        context alongside identification; the topics are then re-ranked against the
+        identified stakeholders locally.
+
+        Returns:
+            (stakeholders, topics)
+        """
+        executor = self._research_executor()
+        stakeholders_future = executor.submit(self.identify_stakeholders, policy_text)
+        topics_future = executor.submit(self.analyze_topics, policy_text, [])
+        stakeholders = stakeholders_future.result()
+        topics = topics_future.result()
+        return stakeholders, self.rank_topics_for_stakeholders(topics, stakeholders)
+
+    @staticmethod
+    def rank_topics_for_stakeholders(topics: List[Dict[str, Any]], stakeholders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Order topics by priority, then by how many identified stakeholders - with differing stances - they involve"""
+        stances = {
+            s.get('name', 'Unknown').lower(): s.get('stance', s.get('likely_stance', 'neutral'))
+            for s in stakeholders
+        }
+        default_involved = [s.get('name', 'Unknown') for s in stakeholders[:3]]
+        
+        def rank(topic: Dict[str, Any]) -> Tuple[float, int, int]:
+            involved = [
+                name for name in stances
+                if any(name in str(other).lower() or str(other).lower() in name
+                       for other in topic.get('stakeholders_involved', []))
+            ]
+            return _topic_priority(topic), len({stances[name] for name in involved}), len(involved)
+        
+        for topic in topics:
+            if not topic.get('stakeholders_involved'):
+                topic['stakeholders_involved'] = list(default_involved)
+        return sorted(topics, key=rank, reverse=True)
+
+    @staticmethod
+    def top_topics(topics: List[Dict[str, Any]], count: int = 3) -> List[Dict[str, Any]]:
+        """Highest-priority topics without sorting the whole list"""
+        return nlargest(count, topics, key=_topic_priority)
+
+    @classmethod
+    def _research_executor(cls) -> ThreadPoolExecutor:
+        """Persistent research pool, so repeated debates don't pay thread start-up"""
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    BaseDebateSystem._executor = ThreadPoolExecutor(
+                        max_workers=int(os.getenv("CIVIC_RESEARCH_WORKERS", "8")),
+                        thread_name_prefix="research"
+                    )
+                    atexit.register(BaseDebateSystem._executor.shutdown)
+        return cls._executor
+    
+    def research_single_stakeholder(self, stakeholder: Dict[str, Any], policy_text: str,
+                                    serialized_stakeholder: Optional[str] = None) -> Dict[str, Any]:
         """Research a single stakeholder's perspective (for parallel execution)"""
         stakeholder_name = stakeholder.get('name', 'Unknown')
         
-        print(f"🔍 Researching {stakeholder_name}'s perspective...")
+        logger.info(f"🔍 Researching {stakeholder_name}'s perspective...")
         
         try:
-            research_result = self.stakeholder_researcher._run(json.dumps(stakeholder), policy_text)
+            if serialized_stakeholder is None:
+                serialized_stakeholder = _json_dumps(stakeholder)
+            with self._llm_gate:
+                research_result = _call_tool(self.stakeholder_researcher, serialized_stakeholder, policy_text)
+            research_data = _json_loads(research_result)
             
-            if not research_result.startswith("Error"):
-                research_data = json.loads(research_result)
-                
-                # Store in knowledge base
+            # Store in knowledge base
+            with self._kb_lock:
                 kb_result = self.kb_manager._run(stakeholder_name, research_result, "create")
-                
-                print(f"✅ Research complete for {stakeholder_name}")
-                return {
-                    'name': stakeholder_name,
-                    'research_data': research_data,
-                    'kb_result': kb_result,
-                    'status': 'success'
-                }
-            else:
-                print(f"❌ Research failed for {stakeholder_name}: {research_result}")
-                return {
-                    'name': stakeholder_name,
-                    'error': research_result,
-                    'status': 'failed'
-                }
+            
+            logger.info(f"✅ Research complete for {stakeholder_name}")
+            return {
+                'name': stakeholder_name,
+                'research_data': research_data,
+                'kb_result': kb_result,
+                'status': 'success'
+            }
+        except ToolError as e:
+            logger.error(f"❌ Research failed for {stakeholder_name}: {e}")
+            return {
+                'name': stakeholder_name,
+                'error': str(e),
+                'status': 'failed'
+            }
         except Exception as e:
-            print(f"❌ Research error for {stakeholder_name}: {e}")
+            logger.error(f"❌ Research error for {stakeholder_name}: {e}")
             return {
                 'name': stakeholder_name,
                 'error': str(e),
@@ -312,37 +737,66 @@ You are an expert policy analyst. Provide a comprehensive, citizen-friendly expl
 
     def research_stakeholders_parallel(self, stakeholder_list: List[Dict[str, Any]], policy_text: str) -> Dict[str, Any]:
         """Research all stakeholders in parallel to save time"""
-        print(f"\n🔬 Starting parallel research for {len(stakeholder_list)} stakeholders...")
+        logger.info(f"\n🔬 Starting parallel research for {len(stakeholder_list)} stakeholders...")
         
         start_time = time.time()
-        stakeholder_research = {}
         
         # Use ThreadPoolExecutor for parallel research
-        with ThreadPoolExecutor(max_workers=min(len(stakeholder_list), 5)) as executor:
-            # Submit all research tasks
-            future_to_stakeholder = {
-                executor.submit(self.research_single_stakeholder, stakeholder, policy_text): stakeholder
-                for stakeholder in stakeholder_list
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_stakeholder):
-                stakeholder = future_to_stakeholder[future]
-                result = future.result()
-                
-                if result['status'] == 'success':
-                    stakeholder_research[result['name']] = result['research_data']
-                else:
-                    print(f"⚠️ Research issues for {result['name']}: {result.get('error', 'Unknown error')}")
+        # Serialize up front so worker threads don't contend for the GIL encoding their input
+        serialized = [(stakeholder, _json_dumps(stakeholder)) for stakeholder in stakeholder_list]
+        
+        executor = self._research_executor()
+        # Submit all research tasks
+        future_to_stakeholder = {
+            executor.submit(self.research_single_stakeholder, stakeholder, policy_text, stakeholder_json): stakeholder
+            for stakeholder, stakeholder_json in serialized
+        }
+        
+        # Collect results as they complete
+        return self._collect_research(
+            (future.result() for future in as_completed(future_to_stakeholder)),
+            len(stakeholder_list),
+            start_time
+        )
+    
+    @staticmethod
+    def _collect_research(results, stakeholder_count: int, start_time: float) -> Dict[str, Any]:
+        """Merge single-stakeholder research results into {name: research_data}"""
+        stakeholder_research = {}
+        for result in results:
+            if result['status'] == 'success':
+                stakeholder_research[result['name']] = result['research_data']
+            else:
+                logger.warning(f"⚠️ Research issues for {result['name']}: {result.get('error', 'Unknown error')}")
         
         end_time = time.time()
         duration = end_time - start_time
         
-        print(f"✅ Parallel research completed in {duration:.1f} seconds")
-        print(f"📊 Successfully researched {len(stakeholder_research)} out of {len(stakeholder_list)} stakeholders")
+        logger.info(f"✅ Parallel research completed in {duration:.1f} seconds")
+        logger.info(f"📊 Successfully researched {len(stakeholder_research)} out of {stakeholder_count} stakeholders")
         
         return stakeholder_research
     
+    async def research_single_stakeholder_async(self, stakeholder: Dict[str, Any], policy_text: str,
+                                                serialized_stakeholder: Optional[str] = None) -> Dict[str, Any]:
+        """Async wrapper around research_single_stakeholder"""
+        return await asyncio.to_thread(self.research_single_stakeholder, stakeholder, policy_text, serialized_stakeholder)
+    
+    async def research_stakeholders_async(self, stakeholder_list: List[Dict[str, Any]], policy_text: str,
+                                          max_concurrency: int = RESEARCH_ASYNC_CONCURRENCY) -> Dict[str, Any]:
+        """Research all stakeholders concurrently from an event loop, without the shared worker-pool cap"""
+        logger.info(f"\n🔬 Starting parallel research for {len(stakeholder_list)} stakeholders...")
+        
+        start_time = time.time()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def research_one(stakeholder: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.research_single_stakeholder_async(stakeholder, policy_text, _json_dumps(stakeholder))
+        
+        results = await asyncio.gather(*(research_one(stakeholder) for stakeholder in stakeholder_list))
+        return self._collect_research(results, len(stakeholder_list), start_time)
+    
     def generate_argument(self, stakeholder_name: str, topic: Dict[str, Any], argument_type: str) -> str:
         """Generate research-based argument for a stakeholder on a topic using proper LLM"""
         try:
@@ -351,39 +805,19 @@ You are an expert policy analyst. Provide a comprehensive, citizen-friendly expl
             topic_description = topic.get('description', '')
             
             # Enhanced prompt with explicit research-based instructions
-            prompt = f"""
-You are representing {stakeholder_name} in a policy debate about "{topic_title}".
-
-Topic: {topic_title}
-Description: {topic_description}
-
-Generate a {argument_type} argument from {stakeholder_name}'s perspective. The argument MUST be:
-- Factual and evidence-based (NO made-up statistics, data, or research citations)
-- Based on logical reasoning and real-world policy implications
-- Relevant to their likely interests and concerns as this stakeholder group
-- Professional, respectful, and substantive
-- 2-3 sentences long
-- Focused on actual policy impacts rather than speculative numbers
-
-IMPORTANT: Do NOT include any specific statistics, percentages, dollar amounts, or research citations unless they are widely known public facts. Focus on logical arguments about policy impacts, implementation challenges, and stakeholder concerns.
-
-Return ONLY a valid JSON object with this structure:
-{{
-    "stakeholder_name": "{stakeholder_name}",
-    "argument_type": "{argument_type}",
-    "content": "The actual argument content here (no made-up statistics)",
-    "key_points": ["main concern 1", "main concern 2"],
-    "reasoning": "The logical basis for this argument",
-    "concerns_addressed": ["specific concern 1", "specific concern 2"]
-}}
-"""
+            prompt = _ARGUMENT_PROMPT_TPL.format_map({
+                "stakeholder_name": stakeholder_name,
+                "topic_title": topic_title,
+                "topic_description": topic_description,
+                "argument_type": argument_type,
+            })
             
             result = self.get_llm_response(prompt, "argument_generation")
             
             if "error" in result:
                 # Return improved fallback argument
                 fallback_content = f"As {stakeholder_name}, I believe this policy's implementation requires careful consideration of how it will affect our community, including proper consultation with affected parties and clear guidelines for compliance."
-                return json.dumps({
+                return _json_dumps({
                     "stakeholder_name": stakeholder_name,
                     "argument_type": argument_type,
                     "content": fallback_content,
@@ -393,12 +827,12 @@ Return ONLY a valid JSON object with this structure:
                 })
             
             # Return the LLM result as JSON string
-            return json.dumps(result)
+            return _json_dumps(result)
             
         except Exception as e:
             # Return fallback argument on error
             fallback_content = f"As {stakeholder_name}, I have important concerns about this policy that need to be addressed through proper consultation and transparent implementation processes."
-            return json.dumps({
+            return _json_dumps({
                 "stakeholder_name": stakeholder_name,
                 "argument_type": argument_type,
                 "content": fallback_content,
@@ -407,49 +841,167 @@ Return ONLY a valid JSON object with this structure:
                 "concerns_addressed": ["Stakeholder input", "Process transparency"]
             })
     
-    def send_a2a_message(self, sender: str, receiver: str, message_type: str, content: str, context: Dict[str, Any]) -> str:
-        """Send agent-to-agent message"""
-        message_result = self.a2a_messenger._run(
-            sender,
-            receiver,
-            message_type,
-            content,
-            json.dumps(context)
+    def generate_arguments_batch(self, requests: List[Tuple[str, Dict[str, Any], str]]) -> List[str]:
+        """
+        Generate arguments for several (stakeholder_name, topic, argument_type) requests
+
+        Requests are sent ARGUMENT_BATCH_SIZE at a time as one multi-item LLM call, with
+        the chunks running concurrently; any item the model leaves out is generated
+        individually. Results keep input order.
+        """
+        if not requests:
+            return []
+
+        results: List[Optional[str]] = [None] * len(requests)
+        starts = range(0, len(requests), ARGUMENT_BATCH_SIZE)
+        if len(starts) == 1:
+            chunk_results = [self._generate_argument_chunk(requests)]
+        else:
+            executor = self._research_executor()
+            chunk_results = [
+                future.result() for future in [
+                    executor.submit(self._generate_argument_chunk, requests[start:start + ARGUMENT_BATCH_SIZE])
+                    for start in starts
+                ]
+            ]
+        for start, chunk_arguments in zip(starts, chunk_results, strict=True):
+            for offset, argument in chunk_arguments.items():
+                results[start + offset] = argument
+
+        missing = [i for i, argument in enumerate(results) if argument is None]
+        if missing:
+            from ..tools.custom_tool import BATCH_CONCURRENCY
+            with ThreadPoolExecutor(max_workers=min(len(missing), BATCH_CONCURRENCY)) as executor:
+                for i, argument in zip(missing, executor.map(lambda i: self.generate_argument(*requests[i]), missing), strict=True):
+                    results[i] = argument
+        return results
+
+    def _generate_argument_chunk(self, chunk: List[Tuple[str, Dict[str, Any], str]]) -> Dict[int, str]:
+        """One LLM call for a chunk of argument requests; returns {position: argument_json}"""
+        items = "\n".join(
+            f'<item id="{k}">\nStakeholder: {name}\nTopic: {topic.get("title", "Unknown Topic")}\n'
+            f'Description: {topic.get("description", "")}\nArgument type: {argument_type}\n</item>'
+            for k, (name, topic, argument_type) in enumerate(chunk)
         )
+        prompt = _ARGUMENT_BATCH_PROMPT_HEAD + items + "\n"
+        try:
+            result = self.get_llm_response(prompt, "argument_generation")
+        except Exception:
+            return {}
+        if not isinstance(result, dict) or "error" in result:
+            return {}
+
+        arguments = {}
+        for entry in result.get("arguments", []):
+            if not isinstance(entry, dict) or not entry.get("content"):
+                continue
+            try:
+                k = int(entry.pop("id"))
+            except (KeyError, TypeError, ValueError):
+                continue
+            if 0 <= k < len(chunk) and k not in arguments:
+                name, _, argument_type = chunk[k]
+                entry.setdefault("stakeholder_name", name)
+                entry.setdefault("argument_type", argument_type)
+                arguments[k] = _json_dumps(entry)
+        return arguments
+    
+    # Async variants - the LLM calls are I/O-bound, so callers can overlap them with
+    # asyncio.gather, e.g. prefetching the next policy while stakeholders are identified
+    async def load_policy_async(self, policy_name: str) -> Dict[str, Any]:
+        """Async wrapper around load_policy"""
+        return await asyncio.to_thread(self.load_policy, policy_name)
+    
+    async def identify_stakeholders_async(self, policy_text: str) -> List[Dict[str, Any]]:
+        """Async wrapper around identify_stakeholders"""
+        return await asyncio.to_thread(self.identify_stakeholders, policy_text)
+    
+    async def analyze_topics_async(self, policy_text: str, stakeholders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Async wrapper around analyze_topics"""
+        return await asyncio.to_thread(self.analyze_topics, policy_text, stakeholders)
+    
+    async def prepare_debate_async(self, policy_text: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Async wrapper around prepare_debate"""
+        return await asyncio.to_thread(self.prepare_debate, policy_text)
+    
+    async def generate_argument_async(self, stakeholder_name: str, topic: Dict[str, Any], argument_type: str) -> str:
+        """Async wrapper around generate_argument"""
+        return await asyncio.to_thread(self.generate_argument, stakeholder_name, topic, argument_type)
+    
+    def _serialize_context(self, context: Dict[str, Any]) -> str:
+        """Serialize an A2A context, reusing the string for contexts already sent this session"""
+        try:
+            key = tuple(sorted(context.items()))
+            hash(key)
+        except TypeError:
+            # Nested/unhashable values - not worth a cache entry
+            return _json_dumps(context)
         
-        if message_result.startswith("Error"):
-            return f"Error sending message: {message_result}"
-        
-        return message_result
+        serialized = self._ctx_cache.get(key)
+        if serialized is None:
+            serialized = self._ctx_cache[key] = _json_dumps(context)
+        return serialized
+    
+    def send_a2a_message(self, sender: str, receiver: str, message_type: str, content: str, context: Dict[str, Any]) -> str:
+        """Send agent-to-agent message"""
+        try:
+            return _call_tool(
+                self.a2a_messenger,
+                sender,
+                receiver,
+                message_type,
+                content,
+                self._serialize_context(context)
+            )
+        except ToolError as e:
+            return f"Error sending message: {e}"
+    
+    def send_a2a_message_batch(self, sender: str, receivers: List[str], message_type: str, content: str, context: Dict[str, Any]) -> List[str]:
+        """Send one agent-to-agent message to several receivers; results keep the receiver order"""
+        message_results = self.a2a_messenger.run_batch(sender, receivers, message_type, content, context)
+        return [
+            f"Error sending message: {result}" if result.startswith("Error") else result
+            for result in message_results
+        ]
     
     def create_debate_session(self, policy_info: Dict[str, Any], stakeholders: List[Dict[str, Any]]) -> str:
         """Create a debate session with the moderator"""
-        session_context = {
-            "policy_name": policy_info.get('title', 'Unknown Policy'),
-            "participants": [s.get('name', 'Unknown') for s in stakeholders],
-            "session_id": self.session_id,
-            "system_type": self.system_name
-        }
+        policy_name = policy_info.get('title', 'Unknown Policy')
+        participants = tuple(s.get('name', 'Unknown') for s in stakeholders)
         
-        moderator_result = self.debate_moderator._run(
-            self.session_id,
-            "start",
-            json.dumps(session_context)
-        )
-        
-        if moderator_result.startswith("Error"):
-            return f"Error creating debate session: {moderator_result}"
+        # Retries for the same policy and participants reuse the frozen context and its JSON
+        if self._session_context_json is None or self._session_context_key != (policy_name, participants):
+            session_context = {
+                "policy_name": policy_name,
+                "participants": list(participants),
+                "session_id": self.session_id,
+                "system_type": self.system_name
+            }
+            self.session_context = MappingProxyType(session_context)
+            self._session_context_json = _json_dumps(session_context)
+            self._session_context_key = (policy_name, participants)
         
-        return moderator_result
+        try:
+            return _call_tool(self.debate_moderator, self.session_id, "start", self._session_context_json)
+        except ToolError as e:
+            return f"Error creating debate session: {e}"
     
     def end_debate_session(self) -> str:
         """End the debate session"""
-        end_result = self.debate_moderator._run(self.session_id, "end")
-        
-        if end_result.startswith("Error"):
-            return f"Error ending debate session: {end_result}"
-        
-        return end_result
+        try:
+            return _call_tool(self.debate_moderator, self.session_id, "end")
+        except ToolError as e:
+            return f"Error ending debate session: {e}"
+    
+    def record_history(self, *entries: Any) -> None:
+        """Append entries to conversation_history"""
+        self.conversation_history.extend(entries)
+    
+    def dump_history(self, path: str) -> str:
+        """Write conversation_history to `path` as NDJSON (one entry per line)"""
+        # Encoded from the ring buffer, so evicted entries are neither kept nor exported
+        Path(path).write_bytes(b"".join(_json_line(entry) for entry in self.conversation_history))
+        return str(path)
     
     def get_session_stats(self) -> Dict[str, Any]:
         """Get session statistics"""
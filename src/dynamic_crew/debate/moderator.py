@@ -3,52 +3,23 @@ AI Moderator for human-like policy debates.
 """
 
 import random
-from typing import Dict, List, Any
+import sys
+from typing import Dict, List, Any, Optional
 
+from .random_pool import RandomPool
 
-class HumanModerator:
-    """
-    AI moderator with personality and natural speech patterns
-    """
-    
-    def __init__(self):
-        self.name = "Dr. Patricia Williams"
-        self.background = "Former journalist and policy expert, now facilitates public debates"
-        self.personality = "Professional but warm, keeps discussions focused while allowing passion"
-        self.transition_phrases = [
-            "Let's move to our next important topic...",
-            "This brings us to another crucial issue...",
-            "I'd like to shift our focus to...",
-            "Building on what we've heard, let's explore...",
-            "Now, let's examine..."
-        ]
-        self.interruption_phrases = [
-            "Hold on, let me make sure everyone gets a chance to respond...",
-            "I want to give everyone a chance to address this point...",
-            "Let's hear from other perspectives on this...",
-            "That's a strong point - how do others respond to that?",
-            "I'm seeing some passionate reactions here..."
-        ]
-        self.wrap_up_phrases = [
-            "As we wrap up this topic...",
-            "Before we move on...",
-            "Let me summarize what I'm hearing...",
-            "This seems to be a key point of disagreement...",
-            "I think we've identified the core tensions here..."
-        ]
-    
-    def introduce_debate(self, policy_title: str, participants: List[str], topics: List[str]) -> str:
-        """Opening introduction"""
-        return f"""
+
+# Speech templates, filled with str.format_map
+_INTRO_TEMPLATE = """
 *adjusts glasses and looks at the panel*
 
 Good evening, everyone. I'm Dr. Patricia Williams, and I'll be moderating tonight's discussion on {policy_title}.
 
-We have {len(participants)} distinguished panelists with us tonight: {', '.join(participants)}. Each brings a unique perspective to this important policy debate.
+We have {participant_count} distinguished panelists with us tonight: {participants}. Each brings a unique perspective to this important policy debate.
 
 *gestures to the agenda*
 
-Tonight we'll explore {len(topics)} key areas: {', '.join(topics[:3])}{'...' if len(topics) > 3 else ''}. 
+Tonight we'll explore {topic_count} key areas: {topics}{ellipsis}. 
 
 I encourage passionate but respectful dialogue. This is about real people and real consequences.
 
@@ -56,11 +27,8 @@ I encourage passionate but respectful dialogue. This is about real people and re
 
 Let's begin with opening statements. Each of you will have a chance to present your perspective, and then we'll dive into the details.
 """
-    
-    def transition_to_topic(self, topic_title: str, topic_number: int, total_topics: int) -> str:
-        """Transition to new topic"""
-        phrase = random.choice(self.transition_phrases)
-        return f"""
+
+_TRANSITION_TEMPLATE = """
 *leans forward slightly*
 
 {phrase} {topic_title}.
@@ -69,10 +37,8 @@ Let's begin with opening statements. Each of you will have a chance to present y
 
 This is topic {topic_number} of {total_topics}, and I suspect we'll see some strong opinions here. Let's hear how each of you views this issue.
 """
-    
-    def facilitate_exchange(self, speaker1: str, speaker2: str, topic: str) -> str:
-        """Encourage direct exchange between speakers"""
-        return f"""
+
+_EXCHANGE_TEMPLATE = """
 *notices the tension*
 
 {speaker1}, I can see you have a strong reaction to what {speaker2} just said. Please respond directly to their point about {topic}.
@@ -81,12 +47,8 @@ This is topic {topic_number} of {total_topics}, and I suspect we'll see some str
 
 And {speaker2}, I want you to have a chance to respond to {speaker1}'s concerns as well.
 """
-    
-    def interrupt_for_balance(self, dominant_speaker: str, quiet_speakers: List[str]) -> str:
-        """Interrupt to give others a chance"""
-        phrase = random.choice(self.interruption_phrases)
-        quiet_list = ', '.join(quiet_speakers)
-        return f"""
+
+_INTERRUPT_TEMPLATE = """
 *raises hand gently*
 
 {dominant_speaker}, you're making important points, but {phrase}
@@ -95,54 +57,22 @@ And {speaker2}, I want you to have a chance to respond to {speaker1}'s concerns
 
 {quiet_list}, I'd like to hear your thoughts on this. How do you see this issue?
 """
-    
-    def wrap_up_topic(self, topic_title: str, key_points: List[str]) -> str:
-        """Wrap up discussion of a topic"""
-        phrase = random.choice(self.wrap_up_phrases)
-        return f"""
+
+_WRAP_UP_TEMPLATE = """
 *pauses thoughtfully*
 
 {phrase} on {topic_title}.
 
 *counts on fingers*
 
-I'm hearing several key tensions: {', '.join(key_points[:3])}. These seem to be the fundamental disagreements we need to grapple with.
+I'm hearing several key tensions: {key_points}. These seem to be the fundamental disagreements we need to grapple with.
 
 *looks at the panel*
 
 Let's carry these insights forward as we continue.
 """
-    
-    def synthesize_conclusion(self, policy_title: str, all_arguments: List[Dict], participants: List[str]) -> str:
-        """Create unbiased conclusion based on all arguments"""
-        # Extract key themes and concerns from arguments
-        participant_concerns = {}
-        common_themes = []
-        
-        for arg in all_arguments:
-            speaker = arg.get('speaker', 'Unknown')
-            stakeholder = arg.get('stakeholder_group', 'Unknown')
-            if stakeholder not in participant_concerns:
-                participant_concerns[stakeholder] = []
-            participant_concerns[stakeholder].append(arg.get('content', ''))
-        
-        # Identify common themes (simplified approach)
-        if len(participants) > 1:
-            common_themes = [
-                "the complexity of implementation",
-                "the need for balanced solutions",
-                "concerns about unintended consequences"
-            ]
-        
-        # Build conclusion based on actual arguments
-        conclusion_parts = []
-        
-        for i, participant in enumerate(participants):
-            if i < len(all_arguments):
-                stakeholder_group = all_arguments[i].get('stakeholder_group', participant)
-                conclusion_parts.append(f"From {participant}'s perspective, we heard genuine concerns about the impacts on {stakeholder_group.lower()}. Their lived experience brings credibility to arguments about practical implementation challenges.")
-        
-        return f"""
+
+_CONCLUSION_TEMPLATE = """
 *removes glasses and looks thoughtfully at the panel*
 
 Thank you all for this rich discussion on {policy_title}. As someone who's moderated hundreds of these debates, I want to offer an unbiased synthesis of what we've heard tonight.
@@ -151,11 +81,11 @@ Thank you all for this rich discussion on {policy_title}. As someone who's moder
 
 **The Situation As I See It:**
 
-{' '.join(conclusion_parts)}
+{conclusion}
 
 **Areas of Surprising Agreement:**
 - All participants seem to agree that this policy addresses real problems
-- Everyone acknowledges {', '.join(common_themes[:2])}
+- Everyone acknowledges {common_themes}
 - There's consensus that effective implementation requires careful planning
 
 **The Core Tensions:**
@@ -173,4 +103,116 @@ The truth is, all our panelists raised valid points. Good policy isn't about win
 *pauses*
 
 That's the situation as I see it. Thank you all for your participation tonight.
-""" 
\ No newline at end of file
+"""
+
+# Themes acknowledged in every multi-participant conclusion
+_COMMON_THEMES = "the complexity of implementation, the need for balanced solutions"
+
+
+class HumanModerator:
+    """
+    AI moderator with personality and natural speech patterns
+    """
+    
+    # Phrase pools are shared by every moderator instance
+    TRANSITION_PHRASES = tuple(sys.intern(phrase) for phrase in (
+        "Let's move to our next important topic...",
+        "This brings us to another crucial issue...",
+        "I'd like to shift our focus to...",
+        "Building on what we've heard, let's explore...",
+        "Now, let's examine..."
+    ))
+    INTERRUPTION_PHRASES = tuple(sys.intern(phrase) for phrase in (
+        "Hold on, let me make sure everyone gets a chance to respond...",
+        "I want to give everyone a chance to address this point...",
+        "Let's hear from other perspectives on this...",
+        "That's a strong point - how do others respond to that?",
+        "I'm seeing some passionate reactions here..."
+    ))
+    WRAP_UP_PHRASES = tuple(sys.intern(phrase) for phrase in (
+        "As we wrap up this topic...",
+        "Before we move on...",
+        "Let me summarize what I'm hearing...",
+        "This seems to be a key point of disagreement...",
+        "I think we've identified the core tensions here..."
+    ))
+    
+    # Previous per-instance attribute names
+    transition_phrases = TRANSITION_PHRASES
+    interruption_phrases = INTERRUPTION_PHRASES
+    wrap_up_phrases = WRAP_UP_PHRASES
+    
+    def __init__(self):
+        self.name = "Dr. Patricia Williams"
+        self.background = "Former journalist and policy expert, now facilitates public debates"
+        self.personality = "Professional but warm, keeps discussions focused while allowing passion"
+    
+    def introduce_debate(self, policy_title: str, participants: List[str], topics: List[str]) -> str:
+        """Opening introduction"""
+        return _INTRO_TEMPLATE.format_map({
+            "policy_title": policy_title,
+            "participant_count": len(participants),
+            "participants": ', '.join(participants),
+            "topic_count": len(topics),
+            "topics": ', '.join(topics[:3]),
+            "ellipsis": '...' if len(topics) > 3 else ''
+        })
+    
+    def transition_to_topic(self, topic_title: str, topic_number: int, total_topics: int,
+                            pool: Optional[RandomPool] = None) -> str:
+        """Transition to new topic"""
+        _choice = pool.choice if pool is not None else random.choice
+        _phrases = self.TRANSITION_PHRASES
+        phrase = _choice(_phrases)
+        return _TRANSITION_TEMPLATE.format_map({
+            "phrase": phrase,
+            "topic_title": topic_title,
+            "topic_number": topic_number,
+            "total_topics": total_topics
+        })
+    
+    def facilitate_exchange(self, speaker1: str, speaker2: str, topic: str) -> str:
+        """Encourage direct exchange between speakers"""
+        return _EXCHANGE_TEMPLATE.format_map({"speaker1": speaker1, "speaker2": speaker2, "topic": topic})
+    
+    def interrupt_for_balance(self, dominant_speaker: str, quiet_speakers: List[str],
+                              pool: Optional[RandomPool] = None) -> str:
+        """Interrupt to give others a chance"""
+        _choice = pool.choice if pool is not None else random.choice
+        _phrases = self.INTERRUPTION_PHRASES
+        phrase = _choice(_phrases)
+        quiet_list = ', '.join(quiet_speakers)
+        return _INTERRUPT_TEMPLATE.format_map({
+            "dominant_speaker": dominant_speaker,
+            "phrase": phrase,
+            "quiet_list": quiet_list
+        })
+    
+    def wrap_up_topic(self, topic_title: str, key_points: List[str],
+                      pool: Optional[RandomPool] = None) -> str:
+        """Wrap up discussion of a topic"""
+        _choice = pool.choice if pool is not None else random.choice
+        _phrases = self.WRAP_UP_PHRASES
+        phrase = _choice(_phrases)
+        return _WRAP_UP_TEMPLATE.format_map({
+            "phrase": phrase,
+            "topic_title": topic_title,
+            "key_points": ', '.join(key_points[:3])
+        })
+    
+    def synthesize_conclusion(self, policy_title: str, all_arguments: List[Dict], participants: List[str]) -> str:
+        """Create unbiased conclusion based on all arguments"""
+        # Identify common themes (simplified approach)
+        common_themes = _COMMON_THEMES if len(participants) > 1 else ""
+        
+        # Build conclusion based on actual arguments - one per participant, in order
+        conclusion_parts = []
+        for participant, arg in zip(participants, all_arguments, strict=False):
+            stakeholder_group = arg.get('stakeholder_group', participant)
+            conclusion_parts.append(f"From {participant}'s perspective, we heard genuine concerns about the impacts on {stakeholder_group.lower()}. Their lived experience brings credibility to arguments about practical implementation challenges.")
+        
+        return _CONCLUSION_TEMPLATE.format_map({
+            "policy_title": policy_title,
+            "conclusion": ' '.join(conclusion_parts),
+            "common_themes": common_themes
+        })
@@ -2,8 +2,109 @@
 Human-like persona creation for policy debate participants.
 """
 
+import copy
 import random
-from typing import Dict, List, Any
+import re
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Union
+
+from .random_pool import RandomPool
+
+# Cue pools for humanize_argument, built once at import
+PHYSICAL_CUES_RESPOND = ("*leans forward*", "*gestures with hands*", "*voice getting louder*")
+PHYSICAL_CUES_REBUTTAL = ("*shakes head*", "*looks directly at them*", "*taps table*")
+PHYSICAL_CUES_DEFAULT = ("*sits up straight*", "*looks around table*", "*speaks clearly*")
+STARTERS_RESPOND = ("Wait, wait...", "I don't see it that way...", "I have to say something about that...", "Let me tell you what I think...")
+STARTERS_REBUTTAL = ("I don't agree with that...", "That's not right...", "I need to say something...")
+INTENSITY_CUES = ("*voice getting emotional*", "*speaking with feeling*", "*clearly upset*")
+EVIDENCE_INTROS = ("Here's what I know:", "This is what happens:", "Let me show you:")
+CONVERSATION_ELEMENTS_RESPOND = (
+    "You know what?",
+    "Here's the thing...",
+    "I need to be honest here...",
+    "Let me be straight with you..."
+)
+CONVERSATION_ELEMENTS_REBUTTAL = (
+    "That's just not realistic...",
+    "I've seen this before...",
+    "We tried that approach...",
+    "The reality is..."
+)
+
+
+# Fields humanize_argument reads; _build_persona guarantees they exist
+_PERSONA_DEFAULTS = MappingProxyType({
+    "key_phrases": ("Let me explain...",),
+    "emotional_triggers": (),
+    "response_style": "responds with facts and personal experience"
+})
+_speech_fields = itemgetter("key_phrases", "emotional_triggers")
+
+# Complex terms and their plain-language replacements for _simplify_content
+_SIMPLE_TERMS = {
+    "implementation": "putting into action",
+    "regulatory compliance": "following the rules",
+    "stakeholder": "person affected",
+    "legislation": "law",
+    "pursuant": "according to",
+    "comprehensive": "complete",
+    "facilitate": "help",
+    "substantial": "big",
+    "significant": "important",
+    "optimize": "make better",
+    "utilize": "use",
+    "demonstrate": "show",
+    "accommodation": "place to live",
+    "affordable housing": "homes people can afford",
+    "rent control": "limits on rent increases",
+    "displacement": "being forced to move",
+    "gentrification": "neighborhoods getting expensive",
+    "market dynamics": "how the housing market works",
+    "property values": "how much homes are worth",
+    "investment viability": "whether it's worth investing",
+    "regulatory framework": "the rules and laws",
+    "socioeconomic": "about money and social class",
+    "policy effectiveness": "how well the policy works",
+    "constituent": "voter",
+    "budgetary constraints": "not having enough money",
+    "infrastructure": "basic systems like roads and utilities",
+    "zoning": "rules about what can be built where"
+}
+# Longest terms first, so a longer phrase wins over any term it contains
+_SIMPLE_TERMS_RE = re.compile("|".join(map(re.escape, sorted(_SIMPLE_TERMS, key=len, reverse=True))))
+
+
+def _simple_term(match: "re.Match[str]") -> str:
+    return _SIMPLE_TERMS[match.group(0)]
+
+
+# Where _simplify_content breaks long sentences, and what each break becomes
+_SENTENCE_BREAKS = {", ": ". ", " and ": ". ", " but ": ". But "}
+_SENTENCE_BREAK_RE = re.compile("|".join(map(re.escape, _SENTENCE_BREAKS)))
+
+
+def _sentence_break(match: "re.Match[str]") -> str:
+    return _SENTENCE_BREAKS[match.group(0)]
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable stand-in for stakeholder data values (lists and dicts become tuples)"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=256)
+def _trigger_pattern(triggers: tuple) -> Optional["re.Pattern[str]"]:
+    """One case-insensitive alternation matching any of a persona's emotional triggers"""
+    triggers = tuple(t for t in triggers if t)
+    if not triggers:
+        return None
+    return re.compile("|".join(re.escape(t) for t in triggers), re.IGNORECASE)
 
 
 class HumanPersona:
@@ -80,12 +181,33 @@ class HumanPersona:
         }
     }
     
+    # Personas built from a template, keyed by (stakeholder_name, frozen stakeholder_data); FIFO-bounded
+    _PERSONA_CACHE: Dict[tuple, Dict[str, Any]] = {}
+    _PERSONA_CACHE_SIZE = 256
+    
     @classmethod
     def create_persona(cls, stakeholder_name: str, stakeholder_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a human persona for a stakeholder"""
+        try:
+            cache_key = (stakeholder_name, _freeze(stakeholder_data))
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+        cached = cls._PERSONA_CACHE.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            # Deep copies: callers may mutate the nested lists of the persona they get
+            return copy.deepcopy(cached)
         
         # Find the best matching template
         template = cls._find_best_template(stakeholder_name)
+        if template is not None and cache_key is not None:
+            # Template personas are deterministic; the generic one below draws a random age
+            persona = cls._build_persona(template, stakeholder_name, stakeholder_data)
+            if len(cls._PERSONA_CACHE) >= cls._PERSONA_CACHE_SIZE:
+                del cls._PERSONA_CACHE[next(iter(cls._PERSONA_CACHE))]
+            # The persona references the caller's stakeholder_data lists - cache a private copy
+            cls._PERSONA_CACHE[cache_key] = copy.deepcopy(persona)
+            return persona
         
         if not template:
             # Create generic template
@@ -101,85 +223,112 @@ class HumanPersona:
                 "response_style": "responds with facts and personal experience"
             }
         
-        # Enhance with stakeholder-specific data
-        enhanced_persona = {
-            **template,
-            "stakeholder_group": stakeholder_name,
-            "likely_stance": stakeholder_data.get("likely_stance", "neutral"),
-            "specific_interests": stakeholder_data.get("interests", []),
-            "policy_concerns": stakeholder_data.get("key_concerns", []),
-            "impact_level": stakeholder_data.get("impact", "moderate")
-        }
+        return cls._build_persona(template, stakeholder_name, stakeholder_data)
+    
+    @staticmethod
+    def _build_persona(template: Mapping[str, Any], stakeholder_name: str, stakeholder_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Enhance a template with stakeholder-specific data"""
+        enhanced_persona = dict(_PERSONA_DEFAULTS)
+        enhanced_persona.update(template)
+        enhanced_persona.update(
+            stakeholder_group=stakeholder_name,
+            likely_stance=stakeholder_data.get("likely_stance", "neutral"),
+            specific_interests=stakeholder_data.get("interests", []),
+            policy_concerns=stakeholder_data.get("key_concerns", []),
+            impact_level=stakeholder_data.get("impact", "moderate")
+        )
         
         return enhanced_persona
     
+    # Read-only templates with tuple fields, handed out without copying
+    _FROZEN_TEMPLATES = {
+        name: MappingProxyType({
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in template.items()
+        })
+        for name, template in PERSONA_TEMPLATES.items()
+    }
+    
+    # Lowercased template names, and stakeholder keywords mapped to templates (checked in order)
+    _LOWER_TEMPLATE_NAMES = {name.lower(): name for name in PERSONA_TEMPLATES}
+    _KEYWORD_MATCHES = (
+        ("tenant", "Tenants"),
+        ("renter", "Tenants"),
+        ("landlord", "Landlords"),
+        ("property owner", "Property Owners"),
+        ("owner", "Property Owners"),
+        ("city", "City Officials"),
+        ("government", "City Officials"),
+        ("official", "City Officials"),
+        ("advocate", "Housing Advocates"),
+        ("housing", "Housing Advocates"),
+        ("community", "Community Organizations"),
+        ("organization", "Community Organizations")
+    )
+    
     @classmethod
-    def _find_best_template(cls, stakeholder_name: str) -> Dict[str, Any]:
-        """Find the best matching template for a stakeholder"""
-        stakeholder_lower = stakeholder_name.lower()
-        
+    def _find_best_template(cls, stakeholder_name: str) -> Optional[Mapping[str, Any]]:
+        """Find the best matching template for a stakeholder (read-only view)"""
+        template_name = cls._match_template_name(stakeholder_name)
+        if template_name is None:
+            return None
+        return cls._FROZEN_TEMPLATES[template_name]
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _match_template_name(stakeholder_name: str) -> Optional[str]:
+        """Name of the template for a stakeholder; templates are fixed, so results are cached"""
         # Direct matches
-        if stakeholder_name in cls.PERSONA_TEMPLATES:
-            return cls.PERSONA_TEMPLATES[stakeholder_name].copy()
+        if stakeholder_name in HumanPersona.PERSONA_TEMPLATES:
+            return stakeholder_name
         
-        # Keyword matching
-        for template_name, template in cls.PERSONA_TEMPLATES.items():
-            if template_name.lower() in stakeholder_lower or stakeholder_lower in template_name.lower():
-                return template.copy()
+        stakeholder_lower = stakeholder_name.lower()
         
-        # Partial matches
-        keyword_matches = {
-            "tenant": "Tenants",
-            "renter": "Tenants", 
-            "landlord": "Landlords",
-            "property owner": "Property Owners",
-            "owner": "Property Owners",
-            "city": "City Officials",
-            "government": "City Officials",
-            "official": "City Officials",
-            "advocate": "Housing Advocates",
-            "housing": "Housing Advocates",
-            "community": "Community Organizations",
-            "organization": "Community Organizations"
-        }
+        # Exact match ignoring case, then name containment
+        if stakeholder_lower in HumanPersona._LOWER_TEMPLATE_NAMES:
+            return HumanPersona._LOWER_TEMPLATE_NAMES[stakeholder_lower]
+        for template_lower, template_name in HumanPersona._LOWER_TEMPLATE_NAMES.items():
+            if template_lower in stakeholder_lower or stakeholder_lower in template_lower:
+                return template_name
         
-        for keyword, template_name in keyword_matches.items():
+        # Partial matches
+        for keyword, template_name in HumanPersona._KEYWORD_MATCHES:
             if keyword in stakeholder_lower:
-                return cls.PERSONA_TEMPLATES[template_name].copy()
+                return template_name
         
         return None
     
     @classmethod
-    def humanize_argument(cls, persona: Dict[str, Any], content: str, evidence: List[str], argument_type: str, context: str = "") -> str:
-        """Convert structured argument to natural human speech in simple language"""
+    def humanize_argument(cls, persona: Dict[str, Any], content: str, evidence: List[str], argument_type: str, context: str = "",
+                          pool: Optional[RandomPool] = None) -> str:
+        """Convert structured argument to natural human speech in simple language; pool supplies pre-drawn randomness"""
         
-        person_name = persona['name']
-        response_style = persona.get('response_style', 'responds thoughtfully')
+        _choice = pool.choice if pool is not None else random.choice
+        try:
+            key_phrases, emotional_triggers = _speech_fields(persona)
+        except KeyError:
+            # Persona built outside create_persona
+            key_phrases = persona.get('key_phrases', _PERSONA_DEFAULTS['key_phrases'])
+            emotional_triggers = persona.get('emotional_triggers', ())
+        responding = "responding to" in context.lower()
         
-        # Simple physical cues based on argument type
-        if "responding to" in context.lower():
-            physical_cues = ["*leans forward*", "*gestures with hands*", "*voice getting louder*"]
+        # Simple physical cues and conversational starters based on argument type
+        if responding:
+            physical_cues, starters = PHYSICAL_CUES_RESPOND, STARTERS_RESPOND
         elif argument_type == "rebuttal":
-            physical_cues = ["*shakes head*", "*looks directly at them*", "*taps table*"]
+            physical_cues, starters = PHYSICAL_CUES_REBUTTAL, STARTERS_REBUTTAL
         else:
-            physical_cues = ["*sits up straight*", "*looks around table*", "*speaks clearly*"]
-        
-        physical_cue = random.choice(physical_cues)
+            physical_cues = PHYSICAL_CUES_DEFAULT
+            starters = key_phrases
         
-        # Simple conversational starters
-        if "responding to" in context.lower():
-            starters = ["Wait, wait...", "I don't see it that way...", "I have to say something about that...", "Let me tell you what I think..."]
-        elif argument_type == "rebuttal":
-            starters = ["I don't agree with that...", "That's not right...", "I need to say something..."]
-        else:
-            starters = persona.get('key_phrases', ["Let me explain..."])
-        
-        starter = random.choice(starters if isinstance(starters, list) else [starters])
+        physical_cue = _choice(physical_cues)
+        starter = _choice(starters if isinstance(starters, (list, tuple)) else [starters])
         
         # Simple emotional responses
-        if any(trigger in content.lower() for trigger in persona.get('emotional_triggers', [])):
-            intensity = ["*voice getting emotional*", "*speaking with feeling*", "*clearly upset*"]
-            intensity_cue = random.choice(intensity)
+        # Compiled per trigger set (not stored on the persona, which callers may serialize)
+        trigger_re = _trigger_pattern(tuple(emotional_triggers))
+        if trigger_re is not None and trigger_re.search(content):
+            intensity_cue = _choice(INTENSITY_CUES)
         else:
             intensity_cue = ""
         
@@ -187,58 +336,25 @@ class HumanPersona:
         simplified_content = cls._simplify_content(content)
         
         # Build the simple human speech
-        human_speech = f"{physical_cue}\n\n{starter} {simplified_content}"
+        parts = [physical_cue, f"{starter} {simplified_content}"]
         
         # Add evidence in simple terms
         if evidence:
-            evidence_intro = ["Here's what I know:", "This is what happens:", "Let me show you:"]
             simple_evidence = cls._simplify_content(evidence[0])
-            human_speech += f"\n\n{random.choice(evidence_intro)} {simple_evidence}"
+            parts.append(f"{_choice(EVIDENCE_INTROS)} {simple_evidence}")
         
         # Add emotional intensity if present
         if intensity_cue:
-            human_speech += f"\n\n{intensity_cue}"
+            parts.append(intensity_cue)
         
         # Add conversational elements
-        return cls._add_conversational_elements(human_speech, persona, argument_type, context)
+        return cls._add_conversational_elements(parts, persona, argument_type, responding, pool)
     
     @classmethod
     def _simplify_content(cls, content: str) -> str:
         """Simplify complex content for layman understanding"""
-        # Replace complex terms with simpler ones
-        replacements = {
-            "implementation": "putting into action",
-            "regulatory compliance": "following the rules",
-            "stakeholder": "person affected",
-            "legislation": "law",
-            "pursuant": "according to",
-            "comprehensive": "complete",
-            "facilitate": "help",
-            "substantial": "big",
-            "significant": "important",
-            "optimize": "make better",
-            "utilize": "use",
-            "demonstrate": "show",
-            "accommodation": "place to live",
-            "affordable housing": "homes people can afford",
-            "rent control": "limits on rent increases",
-            "displacement": "being forced to move",
-            "gentrification": "neighborhoods getting expensive",
-            "market dynamics": "how the housing market works",
-            "property values": "how much homes are worth",
-            "investment viability": "whether it's worth investing",
-            "regulatory framework": "the rules and laws",
-            "socioeconomic": "about money and social class",
-            "policy effectiveness": "how well the policy works",
-            "constituent": "voter",
-            "budgetary constraints": "not having enough money",
-            "infrastructure": "basic systems like roads and utilities",
-            "zoning": "rules about what can be built where"
-        }
-        
-        simplified = content
-        for complex_term, simple_term in replacements.items():
-            simplified = simplified.replace(complex_term, simple_term)
+        # Replace complex terms with simpler ones, in one pass
+        simplified = _SIMPLE_TERMS_RE.sub(_simple_term, content)
         
         # Break up long sentences
         sentences = simplified.split('. ')
@@ -246,7 +362,7 @@ class HumanPersona:
         for sentence in sentences:
             if len(sentence) > 100:  # If sentence is too long
                 # Try to break it at commas or conjunctions
-                parts = sentence.replace(', ', '. ').replace(' and ', '. ').replace(' but ', '. But ')
+                parts = _SENTENCE_BREAK_RE.sub(_sentence_break, sentence)
                 short_sentences.append(parts)
             else:
                 short_sentences.append(sentence)
@@ -254,35 +370,30 @@ class HumanPersona:
         return '. '.join(short_sentences)
     
     @classmethod
-    def _add_conversational_elements(cls, content: str, persona: Dict[str, Any], argument_type: str, context: str = "") -> str:
-        """Add natural conversational elements"""
+    def _add_conversational_elements(cls, content: Union[str, List[str]], persona: Dict[str, Any], argument_type: str, responding: bool = False,
+                                     pool: Optional[RandomPool] = None) -> str:
+        """Add natural conversational elements; content may be a list of paragraphs to join"""
+        parts = [content] if isinstance(content, str) else list(content)
         
         # Add natural pauses and emphasis
-        conversation_elements = []
+        conversation_elements = ()
         
-        if "responding to" in context.lower():
-            conversation_elements.extend([
-                "You know what?",
-                "Here's the thing...",
-                "I need to be honest here...",
-                "Let me be straight with you..."
-            ])
+        if responding:
+            conversation_elements += CONVERSATION_ELEMENTS_RESPOND
         
         if argument_type == "rebuttal":
-            conversation_elements.extend([
-                "That's just not realistic...",
-                "I've seen this before...",
-                "We tried that approach...",
-                "The reality is..."
-            ])
+            conversation_elements += CONVERSATION_ELEMENTS_REBUTTAL
+        
+        # One draw for both gates: low byte for the pause, high byte for the element
+        bits = pool.next() & 0xFFFF if pool is not None else random.getrandbits(16)
         
         # Add dramatic pauses
-        if random.random() < 0.3:  # 30% chance
-            content += "\n\n*pauses dramatically*"
+        if (bits & 0xFF) < 77:  # ~30% chance (77/256)
+            parts.append("*pauses dramatically*")
         
         # Add conversational element
-        if conversation_elements and random.random() < 0.4:  # 40% chance
-            element = random.choice(conversation_elements)
-            content = f"{element} {content}"
+        if conversation_elements and (bits >> 8) < 102:  # ~40% chance (102/256)
+            element = pool.choice(conversation_elements) if pool is not None else random.choice(conversation_elements)
+            parts[0] = f"{element} {parts[0]}"
         
-        return content 
\ No newline at end of file
+        return "\n\n".join(parts) 
\ No newline at end of file
@@ -0,0 +1,50 @@
+"""
+Pre-drawn random numbers for the human-like debate speech helpers.
+"""
+
+import random
+from typing import Optional, Sequence, TypeVar
+
+# NumPy fills a whole batch with one C call; fall back to slicing one big getrandbits draw
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+T = TypeVar("T")
+
+_VALUE_BITS = 31
+_VALUE_MASK = (1 << _VALUE_BITS) - 1
+
+
+class RandomPool:
+    """
+    Batch of random 31-bit integers consumed one at a time
+
+    HumanPersona and HumanModerator make dozens of small random draws per debate
+    round; drawing them in batches replaces a Python-level RNG call per draw with
+    a list pop.
+    """
+
+    def __init__(self, size: int = 64, seed: Optional[int] = None):
+        self.size = size
+        self._rng = np.random.default_rng(seed) if NUMPY_AVAILABLE else random.Random(seed)
+        self._values: list = []
+
+    def _refill(self) -> None:
+        if NUMPY_AVAILABLE:
+            self._values = self._rng.integers(0, 1 << _VALUE_BITS, size=self.size).tolist()
+        else:
+            bits = self._rng.getrandbits(_VALUE_BITS * self.size)
+            self._values = [(bits >> (_VALUE_BITS * i)) & _VALUE_MASK for i in range(self.size)]
+
+    def next(self) -> int:
+        """Next random integer in [0, 2**31)"""
+        if not self._values:
+            self._refill()
+        return self._values.pop()
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """Random element of a non-empty sequence"""
+        return seq[self.next() % len(seq)]
@@ -4,53 +4,61 @@ Shows live agent interactions without complex logging that causes hangs
 """
 
 import json
-import time
+import logging
 import uuid
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
-from ..base import BaseDebateSystem
+from ..base import BaseDebateSystem, _json_loads, _log_timestamp
+
+logger = logging.getLogger(__name__)
 
 
 class DebugDebateSystem(BaseDebateSystem):
     """Real-time debug debate system with live agent action logging"""
     
-    def __init__(self):
-        super().__init__("debug_debate")
-        print("🐛 Debug Mode: Shows live agent interactions without complex logging")
+    def __init__(self, pacing: Optional[float] = None):
+        super().__init__("debug_debate", pacing)
+        logger.info("🐛 Debug Mode: Shows live agent interactions without complex logging")
     
     def log_step(self, step: str, message: str, status: str = "🔄"):
         """Log each step with timestamp"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"\n[{timestamp}] {status} {step}: {message}")
+        timestamp = _log_timestamp()
+        logger.info(f"\n[{timestamp}] {status} {step}: {message}")
     
     def log_agent_action(self, agent_name: str, action: str, details: str = ""):
         """Log individual agent actions"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        print(f"[{timestamp}] 🤖 {agent_name}: {action}")
+        logger.info("\n".join(self._agent_action_lines(agent_name, action, details)))
+    
+    @staticmethod
+    def _agent_action_lines(agent_name: str, action: str, details: str = "") -> List[str]:
+        """Output lines for an agent action, for callers that buffer their output"""
+        lines = [f"[{_log_timestamp()}] 🤖 {agent_name}: {action}"]
         if details:
-            print(f"    💬 {details}")
+            lines.append(f"    💬 {details}")
+        return lines
     
     def create_personas(self, stakeholder_list: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Create simple personas for debug mode"""
-        personas = {}
-        
-        print(f"\n👥 DEBATE PARTICIPANTS:")
-        for i, stakeholder in enumerate(stakeholder_list, 1):
-            name = stakeholder.get('name', 'Unknown')
-            stance = stakeholder.get('likely_stance', 'unknown')
-            
-            # Create simple persona
-            persona = {
+        # Create simple personas
+        personas = {
+            name: {
                 'name': name,
                 'stakeholder_group': name,
-                'stance': stance,
+                'stance': stakeholder.get('likely_stance', 'unknown'),
                 'interests': stakeholder.get('interests', []),
                 'concerns': stakeholder.get('key_concerns', [])
             }
-            
-            personas[name] = persona
-            print(f"   {i}. {name} (Initial stance: {stance})")
+            for stakeholder in stakeholder_list
+            for name in (stakeholder.get('name', 'Unknown'),)
+        }
+        
+        lines = ["\n👥 DEBATE PARTICIPANTS:"]
+        lines.extend(
+            f"   {i}. {stakeholder.get('name', 'Unknown')} (Initial stance: {stakeholder.get('likely_stance', 'unknown')})"
+            for i, stakeholder in enumerate(stakeholder_list, 1)
+        )
+        logger.info("\n".join(lines))
         
         return personas
     
@@ -63,33 +71,37 @@ class DebugDebateSystem(BaseDebateSystem):
         debate_topic = topics[0]
         results = []
         
-        print(f"\n🔴 ROUND {round_num}: {round_type.upper()}")
-        print("-" * 40)
+        # Output is buffered and written once per block rather than line by line
+        out = [f"\n🔴 ROUND {round_num}: {round_type.upper()}", "-" * 40]
         
         if round_num == 1:
-            print(f"\n🎯 DEBATING: {debate_topic.get('title', 'Unknown Topic')}")
-            print(f"📝 Description: {debate_topic.get('description', 'No description')}")
-            print("\n" + "="*60)
+            out.append(f"\n🎯 DEBATING: {debate_topic.get('title', 'Unknown Topic')}")
+            out.append(f"📝 Description: {debate_topic.get('description', 'No description')}")
+            out.append("\n" + "="*60)
+        
+        logger.info("\n".join(out))
+        out.clear()
         
-        for i, stakeholder in enumerate(stakeholders):
-            name = stakeholder.get('name', 'Unknown')
+        # Every stakeholder argues the same topic - generate the round's arguments together
+        names = [stakeholder.get('name', 'Unknown') for stakeholder in stakeholders]
+        argument_results = self.generate_arguments_batch([(name, debate_topic, round_type) for name in names])
+        
+        for name, argument_result in zip(names, argument_results, strict=True):
             self.log_agent_action(f"{name} Agent", f"Preparing {round_type}...")
             
-            time.sleep(1)  # Simulate thinking time
-            
-            argument_result = self.generate_argument(name, debate_topic, round_type)
+            self.pause()  # Simulate thinking time
             
             if not argument_result.startswith("Error"):
                 try:
-                    argument = json.loads(argument_result)
+                    argument = _json_loads(argument_result)
                     content = argument.get('content', 'No content available')
                     strength = argument.get('strength', 'N/A')
                     
-                    print(f"\n💬 {name}:")
-                    print(f"   {content}")
-                    print(f"   (Argument strength: {strength}/10)")
+                    out.append(f"\n💬 {name}:")
+                    out.append(f"   {content}")
+                    out.append(f"   (Argument strength: {strength}/10)")
                     
-                    self.log_agent_action(f"{name} Agent", "✅ Statement delivered")
+                    out.extend(self._agent_action_lines(f"{name} Agent", "✅ Statement delivered"))
                     
                     results.append({
                         'speaker': name,
@@ -100,11 +112,14 @@ class DebugDebateSystem(BaseDebateSystem):
                     })
                     
                 except json.JSONDecodeError:
-                    print(f"\n💬 {name}: [Argument parsing failed]")
-                    self.log_agent_action(f"{name} Agent", "❌ Argument parsing failed")
+                    out.append(f"\n💬 {name}: [Argument parsing failed]")
+                    out.extend(self._agent_action_lines(f"{name} Agent", "❌ Argument parsing failed"))
             else:
-                print(f"\n💬 {name}: [Failed to generate argument]")
-                self.log_agent_action(f"{name} Agent", "❌ Failed to generate argument")
+                out.append(f"\n💬 {name}: [Failed to generate argument]")
+                out.extend(self._agent_action_lines(f"{name} Agent", "❌ Failed to generate argument"))
+            
+            logger.info("\n".join(out))
+            out.clear()
         
         return results
     
@@ -114,41 +129,44 @@ class DebugDebateSystem(BaseDebateSystem):
         if len(stakeholders) < 2:
             return []
         
-        print(f"\n📡 A2A MESSAGING")
-        print("-" * 20)
+        logger.info("\n📡 A2A MESSAGING")
+        logger.info("-" * 20)
         
         messages = []
         
         # Simulate cross-stakeholder messaging
-        for i in range(len(stakeholders)):
-            for j in range(i + 1, len(stakeholders)):
-                sender = stakeholders[i].get('name', 'Unknown')
-                receiver = stakeholders[j].get('name', 'Unknown')
+        # Each speaker's latest statement, so a sender's lookup is O(1) instead of a reverse scan
+        last_argument = {result['speaker']: result for result in round_results}
+        names = [stakeholder.get('name', 'Unknown') for stakeholder in stakeholders]
+        
+        for i, sender in enumerate(names):
+            receivers = names[i + 1:]
+            if not receivers:
+                continue
+            
+            sender_arg = last_argument.get(sender)
+            if sender_arg:
+                message_content = f"Regarding {sender_arg.get('type', 'argument')}: {sender_arg.get('content', '')[:100]}..."
                 
+                # One batched send covers every receiver of this sender
+                message_results = self.send_a2a_message_batch(
+                    sender,
+                    receivers,
+                    "debate_point",
+                    message_content,
+                    {'round': sender_arg.get('round', 1)}
+                )
+            else:
+                message_results = [None] * len(receivers)
+            
+            for receiver, message_result in zip(receivers, message_results, strict=True):
                 self.log_agent_action(f"{sender} Agent", f"Sending message to {receiver}...")
                 
-                # Find sender's last argument
-                sender_arg = None
-                for result in reversed(round_results):
-                    if result['speaker'] == sender:
-                        sender_arg = result
-                        break
-                
-                if sender_arg:
-                    message_content = f"Regarding {sender_arg.get('type', 'argument')}: {sender_arg.get('content', '')[:100]}..."
-                    
-                    message_result = self.send_a2a_message(
-                        sender,
-                        receiver,
-                        "debate_point",
-                        message_content,
-                        {'round': sender_arg.get('round', 1)}
-                    )
-                    
+                if message_result is not None:
                     if not message_result.startswith("Error"):
                         try:
-                            message = json.loads(message_result)
-                            print(f"   📧 {sender} → {receiver}: {message.get('message_type', 'unknown')}")
+                            message = _json_loads(message_result)
+                            logger.info(f"   📧 {sender} → {receiver}: {message.get('message_type', 'unknown')}")
                             messages.append(message)
                             self.log_agent_action(f"{sender} Agent", f"✅ Message sent to {receiver}")
                         except json.JSONDecodeError:
@@ -156,15 +174,17 @@ class DebugDebateSystem(BaseDebateSystem):
                     else:
                         self.log_agent_action(f"{sender} Agent", f"❌ Message failed: {message_result}")
                 
-                time.sleep(0.5)  # Brief pause between messages
+                self.pause(0.5)  # Brief pause between messages
         
         return messages
     
     def run_debate(self, policy_name: str) -> Dict[str, Any]:
         """Run complete debug debate with live logging"""
+        # Cached LLM responses never carry over from an earlier debate
+        self._llm_cache.clear()
         
-        print("🎭 REAL-TIME POLICY DEBATE SYSTEM")
-        print("=" * 50)
+        logger.info("🎭 REAL-TIME POLICY DEBATE SYSTEM")
+        logger.info("=" * 50)
         
         start_time = datetime.now()
         
@@ -175,9 +195,9 @@ class DebugDebateSystem(BaseDebateSystem):
             policy_text = policy_info.get("text", "")
             self.log_step("STEP 1", f"✅ Policy loaded: {policy_info.get('title', 'Unknown')}", "✅")
             
-            # Step 2: Identify Stakeholders
+            # Step 2: Identify Stakeholders (topic analysis runs alongside)
             self.log_step("STEP 2", "Identifying stakeholders...", "🔍")
-            stakeholders = self.identify_stakeholders(policy_text)
+            stakeholders, topics = self.prepare_debate(policy_text)
             self.log_step("STEP 2", f"✅ Found {len(stakeholders)} stakeholders", "✅")
             
             # Step 3: Create Personas
@@ -189,15 +209,14 @@ class DebugDebateSystem(BaseDebateSystem):
             
             # Step 5: Topic Analysis
             self.log_step("STEP 4", "Analyzing debate topics...", "📋")
-            topics = self.analyze_topics(policy_text, stakeholders)
             
             self.log_agent_action("Topic Analyzer", f"✅ Identified {len(topics)} debate topics")
             
-            print("\n📋 DEBATE TOPICS:")
-            for i, topic in enumerate(topics[:3], 1):  # Show top 3 topics
+            logger.info("\n📋 DEBATE TOPICS:")
+            for i, topic in enumerate(self.top_topics(topics), 1):  # Show top 3 topics
                 title = topic.get('title', 'Unknown Topic')
                 priority = topic.get('priority', 'N/A')
-                print(f"   {i}. {title} (Priority: {priority}/10)")
+                logger.info(f"   {i}. {title} (Priority: {priority}/10)")
             
             # Step 6: Initialize Debate Session
             self.log_step("STEP 5", "Starting debate session...", "🎭")
@@ -214,7 +233,7 @@ class DebugDebateSystem(BaseDebateSystem):
                 # Round 1: Opening Statements
                 round1_results = self.run_debate_round(stakeholders, topics, "claim", 1)
                 all_results.extend(round1_results)
-                self.conversation_history.extend([r['content'] for r in round1_results])
+                self.record_history(*(r['content'] for r in round1_results))
                 
                 # A2A Messaging after round 1
                 messages = self.simulate_a2a_messaging(stakeholders, round1_results)
@@ -223,12 +242,12 @@ class DebugDebateSystem(BaseDebateSystem):
                 # Round 2: Rebuttals
                 round2_results = self.run_debate_round(stakeholders, topics, "rebuttal", 2)
                 all_results.extend(round2_results)
-                self.conversation_history.extend([r['content'] for r in round2_results])
+                self.record_history(*(r['content'] for r in round2_results))
                 
                 # Round 3: Closing Statements
                 round3_results = self.run_debate_round(stakeholders, topics, "closing", 3)
                 all_results.extend(round3_results)
-                self.conversation_history.extend([r['content'] for r in round3_results])
+                self.record_history(*(r['content'] for r in round3_results))
             
             # Step 8: End Session
             self.log_step("STEP 7", "Ending debate session...", "🏁")
@@ -248,20 +267,20 @@ class DebugDebateSystem(BaseDebateSystem):
                 'research': stakeholder_research,
                 'debate_rounds': all_results,
                 'a2a_messages': all_messages,
-                'conversation_history': self.conversation_history,
+                'conversation_history': list(self.conversation_history),
                 'duration': duration,
                 'start_time': start_time.isoformat(),
                 'end_time': end_time.isoformat()
             }
             
-            print(f"\n🎉 === DEBUG DEBATE COMPLETED ===")
-            print(f"📊 Duration: {duration:.1f} seconds")
-            print(f"💬 Total statements: {len(all_results)}")
-            print(f"📧 A2A messages: {len(all_messages)}")
-            print(f"🎭 Participants: {len(stakeholders)}")
+            logger.info("\n🎉 === DEBUG DEBATE COMPLETED ===")
+            logger.info(f"📊 Duration: {duration:.1f} seconds")
+            logger.info(f"💬 Total statements: {len(all_results)}")
+            logger.info(f"📧 A2A messages: {len(all_messages)}")
+            logger.info(f"🎭 Participants: {len(stakeholders)}")
             
             return results
             
         except Exception as e:
-            print(f"❌ Error in debug debate: {e}")
+            logger.error(f"❌ Error in debug debate: {e}")
             raise 
\ No newline at end of file
@@ -4,9 +4,11 @@ Real stakeholders debating like actual people with personalities, emotions, and
 """
 
 import json
-import time
 import uuid
+from contextlib import nullcontext
 from datetime import datetime
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 import random
 
@@ -16,9 +18,13 @@ try:
 except ImportError:
     WEAVE_AVAILABLE = False
 
-from ..base import BaseDebateSystem
+from ..base import BaseDebateSystem, _json_loads
 from ..moderator import HumanModerator
 from ..personas import HumanPersona
+from ..random_pool import RandomPool
+
+# Shared context for _weave_attributes when tracing is off - reusable and stateless
+_NO_TRACE = nullcontext()
 
 
 class HumanDebateSystem(BaseDebateSystem):
@@ -26,8 +32,8 @@ class HumanDebateSystem(BaseDebateSystem):
     Enhanced human-like debate system with active moderator and natural conversation flow
     """
     
-    def __init__(self):
-        super().__init__("human_debate")
+    def __init__(self, pacing: Optional[float] = None):
+        super().__init__("human_debate", pacing)
         
         # Check if Weave tracing is disabled via environment variable
         import os
@@ -44,35 +50,25 @@ class HumanDebateSystem(BaseDebateSystem):
             os.environ['WEAVE_AUTO_PATCH'] = '0'
             self.weave_enabled = False
         
+        # Tracing helpers are bound once; with tracing off they cost nothing per call
+        if self.weave_enabled:
+            self._weave_op = lambda func: weave.op()(func)
+            self._weave_attributes = weave.attributes
+        else:
+            self._weave_op = lambda func: func
+            self._weave_attributes = lambda attrs: _NO_TRACE
+        
         # Enhanced session tracking
         self.current_topic = 0
         self.moderator = HumanModerator()
-        self.speaking_time = {}  # Track who's been speaking
+        self.random_pool = RandomPool()  # Shared by persona and moderator speech
+        self.speaking_time = Counter()  # Track who's been speaking
         
         self.log_step("System Initialization", f"Enhanced Human-Like Debate System Active - Session: {self.session_id}", "🎭")
         self.log_step("Moderator Setup", f"Moderator: {self.moderator.name}", "👩‍💼")
         if self.weave_enabled:
             self.log_step("Weave Tracing", "View traces at: https://wandb.ai/aniruddhr04-university-of-cincinnati/civicai-human-debate", "📊")
     
-    def _weave_op(self, func):
-        """Decorator wrapper for weave operations"""
-        if hasattr(self, 'weave_enabled') and self.weave_enabled:
-            return weave.op()(func)
-        return func
-    
-    def _weave_attributes(self, attrs):
-        """Context manager wrapper for weave attributes"""
-        if hasattr(self, 'weave_enabled') and self.weave_enabled:
-            return weave.attributes(attrs)
-        else:
-            # Return a dummy context manager
-            class DummyContext:
-                def __enter__(self):
-                    return self
-                def __exit__(self, *args):
-                    pass
-            return DummyContext()
-    
     def create_personas(self, stakeholder_list: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Create human personas for all stakeholders"""
         self.log_step("Persona Creation", "Creating Human Personas", "👥")
@@ -100,8 +96,9 @@ class HumanDebateSystem(BaseDebateSystem):
             self.personas = personas
             return personas
     
-    def generate_human_argument(self, persona: Dict[str, Any], topic: Dict[str, Any], argument_type: str, context: str = "") -> str:
-        """Generate human-like argument based on persona and context"""
+    def generate_human_argument(self, persona: Dict[str, Any], topic: Dict[str, Any], argument_type: str, context: str = "",
+                                argument_result: Optional[str] = None) -> str:
+        """Generate human-like argument based on persona and context; argument_result skips the LLM call if prefetched"""
         
         stakeholder_name = persona['stakeholder_group']
         person_name = persona['name']
@@ -122,19 +119,21 @@ class HumanDebateSystem(BaseDebateSystem):
             "step": "human_argument"
         }):
             # Use the argument generator with enhanced context
-            argument_result = self.generate_argument(stakeholder_name, topic, argument_type)
+            if argument_result is None:
+                argument_result = self.generate_argument(stakeholder_name, topic, argument_type)
             
             if argument_result.startswith("Error"):
                 return f"*{person_name} struggles to find words* I... this is difficult to articulate, but..."
             
             # Convert structured response to natural speech
             try:
-                structured_data = json.loads(argument_result)
+                structured_data = _json_loads(argument_result)
                 content = structured_data.get('content', '')
                 evidence = structured_data.get('evidence', [])
                 
                 # Make it more conversational and contextual
-                human_speech = HumanPersona.humanize_argument(persona, content, evidence, argument_type, context)
+                human_speech = HumanPersona.humanize_argument(persona, content, evidence, argument_type, context,
+                                                                pool=self.random_pool)
                 
                 # Store for later synthesis
                 self.all_arguments.append({
@@ -152,14 +151,30 @@ class HumanDebateSystem(BaseDebateSystem):
             except json.JSONDecodeError:
                 return f"*{person_name} speaks passionately* Look, the bottom line is..."
     
-    def facilitate_natural_exchange(self, personas: Dict[str, Dict[str, Any]], topic: Dict[str, Any], exchange_type: str) -> List[str]:
-        """Facilitate natural back-and-forth exchange on a topic"""
+    @staticmethod
+    def _exchange_argument_requests(persona_list: List[Dict[str, Any]], topic: Dict[str, Any]) -> List[tuple]:
+        """Argument requests for one topic exchange: opening claim, each rebuttal, and the first speaker's reply"""
+        argument_requests = [(persona_list[0]['stakeholder_group'], topic, "claim")]
+        argument_requests += [(responder['stakeholder_group'], topic, "rebuttal") for responder in persona_list[1:]]
+        if len(persona_list) > 2:
+            argument_requests.append((persona_list[0]['stakeholder_group'], topic, "rebuttal"))
+        return argument_requests
+    
+    def facilitate_natural_exchange(self, personas: Dict[str, Dict[str, Any]], topic: Dict[str, Any], exchange_type: str,
+                                    argument_results: Optional[List[str]] = None) -> List[str]:
+        """Facilitate natural back-and-forth exchange on a topic; argument_results may be prefetched"""
         
         self.log_step("Natural Exchange", f"Starting discussion on: {topic.get('title', 'Discussion')}", "💬")
         
         exchanges = []
         persona_list = list(personas.values())
         
+        # Arguments depend only on speaker, topic and type, not on the turn order - fetch the
+        # whole exchange up front
+        final_reply = len(persona_list) > 2
+        if argument_results is None:
+            argument_results = self.generate_arguments_batch(self._exchange_argument_requests(persona_list, topic))
+        
         with self._weave_attributes({
             "topic": topic.get('title', 'Unknown'),
             "exchange_type": exchange_type,
@@ -169,10 +184,11 @@ class HumanDebateSystem(BaseDebateSystem):
         }):
             # First speaker introduces the topic
             first_speaker = persona_list[0]
-            first_statement = self.generate_human_argument(first_speaker, topic, "claim")
+            first_statement = self.generate_human_argument(first_speaker, topic, "claim",
+                                                           argument_result=argument_results[0])
             exchanges.append(first_statement)
             self.log_agent_action(first_speaker['name'], "Opening Statement", first_statement)
-            time.sleep(1)
+            self.pause()
             
             # Other speakers respond in turn
             for i in range(1, len(persona_list)):
@@ -181,13 +197,14 @@ class HumanDebateSystem(BaseDebateSystem):
                 
                 # Context-aware response
                 context = f"responding to {previous_speaker}'s points about {topic.get('title', 'this issue')}"
-                response = self.generate_human_argument(responder, topic, "rebuttal", context)
+                response = self.generate_human_argument(responder, topic, "rebuttal", context,
+                                                        argument_result=argument_results[i])
                 exchanges.append(response)
                 self.log_agent_action(responder['name'], "Response", response)
-                time.sleep(1)
+                self.pause()
                 
                 # Moderator might interject
-                if i == len(persona_list) - 1 and len(persona_list) > 2:
+                if i == len(persona_list) - 1 and final_reply:
                     moderator_interjection = self.moderator.facilitate_exchange(
                         persona_list[0]['name'], 
                         responder['name'], 
@@ -195,16 +212,17 @@ class HumanDebateSystem(BaseDebateSystem):
                     )
                     exchanges.append(moderator_interjection)
                     self.log_agent_action(self.moderator.name, "Moderator Interjection", moderator_interjection)
-                    time.sleep(1)
+                    self.pause()
                     
                     # First speaker responds to final point
                     final_context = f"responding to {responder['name']}'s challenge"
-                    final_response = self.generate_human_argument(first_speaker, topic, "rebuttal", final_context)
+                    final_response = self.generate_human_argument(first_speaker, topic, "rebuttal", final_context,
+                                                                  argument_result=argument_results[-1])
                     exchanges.append(final_response)
                     self.log_agent_action(first_speaker['name'], "Final Response", final_response)
             
             # Add to conversation history
-            self.conversation_history.extend(exchanges)
+            self.record_history(*exchanges)
             
             return exchanges
     
@@ -221,78 +239,98 @@ class HumanDebateSystem(BaseDebateSystem):
             "speaking_stats": self.speaking_time.copy()
         }
         
-        with self._weave_attributes({
-            "total_topics": len(topics_list),
-            "participants": len(personas),
-            "session_id": self.session_id,
-            "step": "multi_topic_debate"
-        }):
-            # Discuss each topic
-            for topic_num, topic in enumerate(topics_list, 1):
-                self.log_step("Topic Transition", f"Topic {topic_num}/{len(topics_list)}: {topic.get('title', 'Unknown')}", "📋")
-                
-                # Moderator introduces topic
-                if topic_num > 1:
-                    transition = self.moderator.transition_to_topic(
-                        topic.get('title', 'Unknown'), 
-                        topic_num, 
-                        len(topics_list)
-                    )
-                    debate_results["moderator_transitions"].append(transition)
-                    self.log_agent_action(self.moderator.name, "Topic Transition", transition)
-                    time.sleep(1)
-                
-                # Natural exchange on this topic
-                exchanges = self.facilitate_natural_exchange(personas, topic, "discussion")
-                
-                # Check for balance - if someone hasn't spoken much, moderator intervenes
-                self._check_speaking_balance(personas)
-                
-                topic_result = {
-                    "topic_number": topic_num,
-                    "topic_title": topic.get('title', 'Unknown'),
-                    "exchanges": exchanges,
-                    "timestamp": datetime.now().isoformat()
-                }
-                
-                debate_results["topics_discussed"].append(topic_result)
-                debate_results["natural_exchanges"].extend(exchanges)
-                
-                # Moderator wraps up topic
-                if topic_num < len(topics_list):
-                    key_points = [f"disagreement about {topic.get('title', 'this issue')}"]
-                    wrap_up = self.moderator.wrap_up_topic(topic.get('title', 'Unknown'), key_points)
-                    self.log_agent_action(self.moderator.name, "Topic Wrap-up", wrap_up)
-                    time.sleep(1)
+        prefetch = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        try:
+            with self._weave_attributes({
+                "total_topics": len(topics_list),
+                "participants": len(personas),
+                "session_id": self.session_id,
+                "step": "multi_topic_debate"
+            }):
+                # The next topic's arguments are generated while the current topic is presented
+                persona_list = list(personas.values())
+                next_arguments = (
+                    prefetch.submit(self.generate_arguments_batch, self._exchange_argument_requests(persona_list, topics_list[0]))
+                    if topics_list and persona_list else None
+                )
                 
-                self.log_step("Topic Complete", f"Topic {topic_num} complete", "✅")
-                time.sleep(2)
+                # Discuss each topic
+                for topic_num, topic in enumerate(topics_list, 1):
+                    argument_results = next_arguments.result() if next_arguments is not None else None
+                    if topic_num < len(topics_list) and persona_list:
+                        next_arguments = prefetch.submit(
+                            self.generate_arguments_batch,
+                            self._exchange_argument_requests(persona_list, topics_list[topic_num])
+                        )
+                    
+                    self.log_step("Topic Transition", f"Topic {topic_num}/{len(topics_list)}: {topic.get('title', 'Unknown')}", "📋")
+                    
+                    # Moderator introduces topic
+                    if topic_num > 1:
+                        transition = self.moderator.transition_to_topic(
+                            topic.get('title', 'Unknown'), 
+                            topic_num, 
+                            len(topics_list),
+                            pool=self.random_pool
+                        )
+                        debate_results["moderator_transitions"].append(transition)
+                        self.log_agent_action(self.moderator.name, "Topic Transition", transition)
+                        self.pause()
+                    
+                    # Natural exchange on this topic
+                    exchanges = self.facilitate_natural_exchange(personas, topic, "discussion", argument_results)
+                    
+                    # Check for balance - if someone hasn't spoken much, moderator intervenes
+                    self._check_speaking_balance(personas)
+                    
+                    topic_result = {
+                        "topic_number": topic_num,
+                        "topic_title": topic.get('title', 'Unknown'),
+                        "exchanges": exchanges,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                    
+                    debate_results["topics_discussed"].append(topic_result)
+                    debate_results["natural_exchanges"].extend(exchanges)
+                    
+                    # Moderator wraps up topic
+                    if topic_num < len(topics_list):
+                        key_points = [f"disagreement about {topic.get('title', 'this issue')}"]
+                        wrap_up = self.moderator.wrap_up_topic(topic.get('title', 'Unknown'), key_points, pool=self.random_pool)
+                        self.log_agent_action(self.moderator.name, "Topic Wrap-up", wrap_up)
+                        self.pause()
+                    
+                    self.log_step("Topic Complete", f"Topic {topic_num} complete", "✅")
+                    self.pause(2)
+        finally:
+            # Don't block on a prefetch for a topic that will never be discussed
+            prefetch.shutdown(wait=False, cancel_futures=True)
         
         return debate_results
     
     def _check_speaking_balance(self, personas: Dict[str, Dict[str, Any]]):
         """Check if speaking time is balanced, have moderator intervene if needed"""
         
-        total_speaking = sum(self.speaking_time.values())
-        if total_speaking < 2:
+        if self.speaking_time.total() < 2:
             return
         
-        # Find who's spoken the most and least
-        most_spoken = max(self.speaking_time, key=self.speaking_time.get)
-        least_spoken = min(self.speaking_time, key=self.speaking_time.get)
+        # Find who's spoken the most and least (one sort; ties keep first-seen order)
+        ranked = self.speaking_time.most_common()
+        most_spoken, most_count = ranked[0]
+        least_count = ranked[-1][1]
         
         # If imbalance is significant, moderator intervenes
-        if self.speaking_time[most_spoken] > self.speaking_time[least_spoken] + 2:
-            quiet_speakers = [name for name, count in self.speaking_time.items() 
-                            if count < self.speaking_time[most_spoken] - 1]
+        if most_count > least_count + 2:
+            quiet_speakers = [name for name, count in self.speaking_time.items() if count < most_count - 1]
             
             if quiet_speakers:
                 interruption = self.moderator.interrupt_for_balance(
                     personas[most_spoken]['name'], 
-                    [personas[name]['name'] for name in quiet_speakers]
+                    [personas[name]['name'] for name in quiet_speakers],
+                    pool=self.random_pool
                 )
                 self.log_agent_action(self.moderator.name, "Balance Intervention", interruption)
-                time.sleep(1)
+                self.pause()
     
     def synthesize_unbiased_conclusion(self, policy_info: Dict[str, Any], personas: Dict[str, Dict[str, Any]]) -> str:
         """Generate unbiased conclusion based on all arguments presented"""
@@ -319,6 +357,8 @@ class HumanDebateSystem(BaseDebateSystem):
     
     def run_debate(self, policy_name: str) -> Dict[str, Any]:
         """Run complete enhanced human-like debate session with active moderator"""
+        # Cached LLM responses never carry over from an earlier debate
+        self._llm_cache.clear()
         
         self.log_step("Debate Start", f"Enhanced Human-Like Policy Debate: {policy_name.upper()}", "🚀")
         self.log_step("Session Info", f"Session ID: {self.session_id}", "🎭")
@@ -341,14 +381,13 @@ class HumanDebateSystem(BaseDebateSystem):
                 
                 # Step 2: Identify Stakeholders
                 self.log_step("Stakeholder Identification", "Identifying Stakeholders", "🎯")
-                stakeholder_list = self.identify_stakeholders(policy_text)
+                stakeholder_list, topics_list = self.prepare_debate(policy_text)
                 
                 # Step 3: Create Human Personas
                 personas = self.create_personas(stakeholder_list)
                 
                 # Step 4: Analyze Multiple Debate Topics
                 self.log_step("Topic Analysis", "Analyzing Debate Topics", "📋")
-                topics_list = self.analyze_topics(policy_text, stakeholder_list)
                 
                 self.log_step("Topics Found", f"Found {len(topics_list)} debate topics", "✅")
                 for i, topic in enumerate(topics_list, 1):
@@ -364,7 +403,7 @@ class HumanDebateSystem(BaseDebateSystem):
                     topic_titles
                 )
                 self.log_agent_action(self.moderator.name, "Debate Introduction", introduction)
-                time.sleep(2)
+                self.pause(2)
                 
                 # Step 6: Enhanced Multi-Topic Debate
                 debate_results = self.run_multi_topic_debate(personas, topics_list)
@@ -383,8 +422,8 @@ class HumanDebateSystem(BaseDebateSystem):
                     "topics_discussed": topics_list,
                     "debate_results": debate_results,
                     "moderator_conclusion": conclusion,
-                    "all_arguments": self.all_arguments,
-                    "conversation_history": self.conversation_history,
+                    "all_arguments": list(self.all_arguments),
+                    "conversation_history": list(self.conversation_history),
                     "speaking_stats": self.speaking_time,
                     "start_time": start_time.isoformat(),
                     "end_time": end_time.isoformat(),
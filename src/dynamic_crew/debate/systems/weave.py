@@ -3,9 +3,9 @@ Weave-Integrated Real-Time Policy Debate System
 Perfect for hackathon demonstrations with full tracing capabilities
 """
 
-import json
-import time
+import logging
 import uuid
+from contextlib import nullcontext
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
@@ -16,7 +16,12 @@ except ImportError:
     WEAVE_AVAILABLE = False
     print("⚠️  Weave not available - install with: pip install weave")
 
-from ..base import BaseDebateSystem
+from ..base import BaseDebateSystem, ToolError, _call_tool, _json_loads, _json_dumps
+
+logger = logging.getLogger(__name__)
+
+# Shared context for _weave_attributes when tracing is off - reusable and stateless
+_NO_TRACE = nullcontext()
 
 
 class WeaveDebateSystem(BaseDebateSystem):
@@ -24,38 +29,27 @@ class WeaveDebateSystem(BaseDebateSystem):
     Real-time debate system with comprehensive Weave tracing for hackathon demos
     """
     
-    def __init__(self):
-        super().__init__("weave_debate")
+    def __init__(self, pacing: Optional[float] = None):
+        super().__init__("weave_debate", pacing)
         
         if WEAVE_AVAILABLE:
             # Initialize Weave if available
             weave.init(project_name="civicai-hackathon")
             self.weave_enabled = True
-            print(f"🔗 Weave System Active - Session: {self.session_id}")
-            print(f"📊 View traces at: https://wandb.ai/aniruddhr04-university-of-cincinnati/civicai-hackathon")
+            logger.info(f"🔗 Weave System Active - Session: {self.session_id}")
+            logger.info("📊 View traces at: https://wandb.ai/aniruddhr04-university-of-cincinnati/civicai-hackathon")
         else:
             self.weave_enabled = False
-            print(f"🔗 Weave System Active (Tracing Disabled) - Session: {self.session_id}")
-            print("⚠️  Weave not available - install with: pip install weave")
-    
-    def _weave_op(self, func):
-        """Decorator wrapper for weave operations"""
-        if WEAVE_AVAILABLE and hasattr(self, 'weave_enabled') and self.weave_enabled:
-            return weave.op()(func)
-        return func
-    
-    def _weave_attributes(self, attrs):
-        """Context manager wrapper for weave attributes"""
-        if WEAVE_AVAILABLE and hasattr(self, 'weave_enabled') and self.weave_enabled:
-            return weave.attributes(attrs)
+            logger.info(f"🔗 Weave System Active (Tracing Disabled) - Session: {self.session_id}")
+            logger.warning("⚠️  Weave not available - install with: pip install weave")
+        
+        # Tracing helpers are bound once; with tracing off they cost nothing per call
+        if self.weave_enabled:
+            self._weave_op = lambda func: weave.op()(func)
+            self._weave_attributes = weave.attributes
         else:
-            # Return a dummy context manager
-            class DummyContext:
-                def __enter__(self):
-                    return self
-                def __exit__(self, *args):
-                    pass
-            return DummyContext()
+            self._weave_op = lambda func: func
+            self._weave_attributes = lambda attrs: _NO_TRACE
     
     def create_personas(self, stakeholder_list: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Create simple personas for weave tracking"""
@@ -77,7 +71,7 @@ class WeaveDebateSystem(BaseDebateSystem):
     @weave.op() if WEAVE_AVAILABLE else lambda x: x
     def load_policy_with_tracing(self, policy_name: str) -> Dict[str, Any]:
         """Load policy with weave tracing"""
-        print(f"\n📄 Loading Policy: {policy_name}")
+        logger.info(f"\n📄 Loading Policy: {policy_name}")
         
         with self._weave_attributes({
             "policy_name": policy_name,
@@ -86,15 +80,15 @@ class WeaveDebateSystem(BaseDebateSystem):
         }):
             policy_info = self.load_policy(policy_name)
             
-            print(f"✅ Policy loaded: {policy_info.get('title', 'Unknown Title')}")
-            print(f"📊 Policy text length: {len(policy_info.get('text', ''))} characters")
+            logger.info(f"✅ Policy loaded: {policy_info.get('title', 'Unknown Title')}")
+            logger.info(f"📊 Policy text length: {len(policy_info.get('text', ''))} characters")
             
             return policy_info
     
     @weave.op() if WEAVE_AVAILABLE else lambda x: x
     def identify_stakeholders_with_tracing(self, policy_text: str) -> List[Dict[str, Any]]:
         """Identify stakeholders with weave tracing"""
-        print(f"\n🎯 Identifying Stakeholders...")
+        logger.info("\n🎯 Identifying Stakeholders...")
         
         with self._weave_attributes({
             "policy_text_length": len(policy_text),
@@ -103,19 +97,19 @@ class WeaveDebateSystem(BaseDebateSystem):
         }):
             stakeholder_list = self.identify_stakeholders(policy_text)
             
-            print(f"✅ Found {len(stakeholder_list)} stakeholders:")
+            logger.info(f"✅ Found {len(stakeholder_list)} stakeholders:")
             for i, stakeholder in enumerate(stakeholder_list, 1):
                 name = stakeholder.get('name', 'Unknown')
                 stakeholder_type = stakeholder.get('type', 'unknown')
                 stance = stakeholder.get('likely_stance', 'unknown')
-                print(f"   {i}. {name} ({stakeholder_type}) - Stance: {stance}")
+                logger.info(f"   {i}. {name} ({stakeholder_type}) - Stance: {stance}")
             
             return stakeholder_list
     
     def research_stakeholder_perspective(self, stakeholder: Dict[str, Any], policy_text: str) -> Dict[str, Any]:
         """Research stakeholder perspective with Weave tracing"""
         stakeholder_name = stakeholder.get('name', 'Unknown')
-        print(f"\n🔍 Researching {stakeholder_name} perspective...")
+        logger.info(f"\n🔍 Researching {stakeholder_name} perspective...")
         
         with self._weave_attributes({
             "stakeholder_name": stakeholder_name,
@@ -123,26 +117,23 @@ class WeaveDebateSystem(BaseDebateSystem):
             "session_id": self.session_id,
             "step": "research_stakeholder"
         }):
-            research_result = self.stakeholder_researcher._run(
-                json.dumps(stakeholder), 
-                policy_text
-            )
-            
-            if research_result.startswith("Error"):
-                print(f"❌ Research failed for {stakeholder_name}: {research_result}")
-                return {"error": research_result}
+            try:
+                research_result = _call_tool(self.stakeholder_researcher, _json_dumps(stakeholder), policy_text)
+            except ToolError as e:
+                logger.error(f"❌ Research failed for {stakeholder_name}: {e}")
+                return {"error": str(e)}
             
-            research_data = json.loads(research_result)
+            research_data = _json_loads(research_result)
             
-            print(f"✅ Research completed for {stakeholder_name}")
-            print(f"   📊 Confidence: {research_data.get('confidence_level', 'unknown')}")
-            print(f"   📋 Summary: {research_data.get('research_summary', '')[:100]}...")
+            logger.info(f"✅ Research completed for {stakeholder_name}")
+            logger.info(f"   📊 Confidence: {research_data.get('confidence_level', 'unknown')}")
+            logger.info(f"   📋 Summary: {research_data.get('research_summary', '')[:100]}...")
             
             return research_data
     
     def analyze_debate_topics_with_tracing(self, policy_text: str, stakeholder_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Analyze debate topics with Weave tracing"""
-        print(f"\n📋 Analyzing debate topics...")
+        logger.info("\n📋 Analyzing debate topics...")
         
         with self._weave_attributes({
             "stakeholder_count": len(stakeholder_data.get('stakeholders', [])),
@@ -151,17 +142,17 @@ class WeaveDebateSystem(BaseDebateSystem):
         }):
             topics_list = self.analyze_topics(policy_text, stakeholder_data['stakeholders'])
             
-            print(f"✅ Found {len(topics_list)} debate topics:")
-            for i, topic in enumerate(topics_list[:3], 1):  # Show top 3
+            logger.info(f"✅ Found {len(topics_list)} debate topics:")
+            for i, topic in enumerate(self.top_topics(topics_list), 1):  # Show top 3
                 title = topic.get('title', 'Unknown Topic')
                 priority = topic.get('priority', 0)
-                print(f"   {i}. {title} (Priority: {priority}/10)")
+                logger.info(f"   {i}. {title} (Priority: {priority}/10)")
             
             return topics_list
     
     def generate_argument_with_tracing(self, stakeholder_name: str, topic: Dict[str, Any], argument_type: str) -> Dict[str, Any]:
         """Generate stakeholder argument with Weave tracing"""
-        print(f"\n💬 {stakeholder_name} generating {argument_type}...")
+        logger.info(f"\n💬 {stakeholder_name} generating {argument_type}...")
         
         with self._weave_attributes({
             "stakeholder_name": stakeholder_name,
@@ -175,20 +166,20 @@ class WeaveDebateSystem(BaseDebateSystem):
             argument_result = self.generate_argument(stakeholder_name, topic, argument_type)
             
             if argument_result.startswith("Error"):
-                print(f"❌ Argument generation failed: {argument_result}")
+                logger.error(f"❌ Argument generation failed: {argument_result}")
                 return {"error": argument_result}
             
-            argument_data = json.loads(argument_result)
+            argument_data = _json_loads(argument_result)
             
-            print(f"✅ {argument_type.title()} generated")
-            print(f"   💪 Strength: {argument_data.get('strength', 'N/A')}/10")
-            print(f"   📝 Preview: {argument_data.get('content', '')[:100]}...")
+            logger.info(f"✅ {argument_type.title()} generated")
+            logger.info(f"   💪 Strength: {argument_data.get('strength', 'N/A')}/10")
+            logger.info(f"   📝 Preview: {argument_data.get('content', '')[:100]}...")
             
             return argument_data
     
     def send_a2a_message_with_tracing(self, sender: str, receiver: str, message_type: str, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Send A2A message with Weave tracing"""
-        print(f"\n📧 A2A Message: {sender} → {receiver}")
+        logger.info(f"\n📧 A2A Message: {sender} → {receiver}")
         
         with self._weave_attributes({
             "sender": sender,
@@ -201,23 +192,53 @@ class WeaveDebateSystem(BaseDebateSystem):
             message_result = self.send_a2a_message(sender, receiver, message_type, content, context)
             
             if message_result.startswith("Error"):
-                print(f"❌ A2A message failed: {message_result}")
+                logger.error(f"❌ A2A message failed: {message_result}")
                 return {"error": message_result}
             
-            message_data = json.loads(message_result)
+            message_data = _json_loads(message_result)
             
-            print(f"✅ Message sent successfully")
-            print(f"   📋 Type: {message_data.get('message_type', 'unknown')}")
-            print(f"   🆔 ID: {message_data.get('message_id', 'unknown')}")
+            logger.info("✅ Message sent successfully")
+            logger.info(f"   📋 Type: {message_data.get('message_type', 'unknown')}")
+            logger.info(f"   🆔 ID: {message_data.get('message_id', 'unknown')}")
             
             return message_data
     
+    def send_a2a_messages_with_tracing(self, sender: str, receivers: List[str], message_type: str, content: str, context: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Send one A2A message to several receivers in a single traced batch"""
+        logger.info(f"\n📧 A2A Message: {sender} → {', '.join(receivers)}")
+        
+        with self._weave_attributes({
+            "sender": sender,
+            "receivers": receivers,
+            "message_type": message_type,
+            "session_id": self.session_id,
+            "debate_round": self.debate_round,
+            "step": "a2a_message"
+        }):
+            message_results = self.send_a2a_message_batch(sender, receivers, message_type, content, context)
+            
+            messages = []
+            for receiver, message_result in zip(receivers, message_results, strict=True):
+                if message_result.startswith("Error"):
+                    logger.error(f"❌ A2A message to {receiver} failed: {message_result}")
+                    messages.append({"error": message_result})
+                    continue
+                
+                message_data = _json_loads(message_result)
+                
+                logger.info(f"✅ Message sent successfully to {receiver}")
+                logger.info(f"   📋 Type: {message_data.get('message_type', 'unknown')}")
+                logger.info(f"   🆔 ID: {message_data.get('message_id', 'unknown')}")
+                messages.append(message_data)
+            
+            return messages
+    
     def run_debate_round_with_tracing(self, stakeholder_list: List[Dict[str, Any]], topics_list: List[Dict[str, Any]], round_type: str) -> Dict[str, Any]:
         """Run debate round with comprehensive tracing"""
         
         self.debate_round += 1
         
-        print(f"\n🎭 === ROUND {self.debate_round}: {round_type.upper()} ===")
+        logger.info(f"\n🎭 === ROUND {self.debate_round}: {round_type.upper()} ===")
         
         with self._weave_attributes({
             "round_number": self.debate_round,
@@ -236,7 +257,7 @@ class WeaveDebateSystem(BaseDebateSystem):
             
             # Use first topic for debate
             main_topic = topics_list[0] if topics_list else {"title": "Policy Discussion", "priority": 5}
-            print(f"📢 Topic: {main_topic.get('title', 'Unknown')}")
+            logger.info(f"📢 Topic: {main_topic.get('title', 'Unknown')}")
             
             # Generate arguments for each stakeholder
             for stakeholder in stakeholder_list:
@@ -252,7 +273,7 @@ class WeaveDebateSystem(BaseDebateSystem):
                     })
                     
                     # Store in conversation history
-                    self.conversation_history.append(argument_data.get('content', ''))
+                    self.record_history(argument_data.get('content', ''))
                     
                     # Store in all arguments
                     self.all_arguments.append({
@@ -265,35 +286,35 @@ class WeaveDebateSystem(BaseDebateSystem):
                         "timestamp": datetime.now().isoformat()
                     })
                 
-                time.sleep(1)  # Pause between speakers
+                self.pause()  # Pause between speakers
             
             # A2A messaging after each round
             if len(stakeholder_list) >= 2:
-                print(f"\n📡 A2A Messaging Round {self.debate_round}")
+                logger.info(f"\n📡 A2A Messaging Round {self.debate_round}")
+                
+                # Each speaker's argument from this round, so a sender's lookup is O(1)
+                round_arguments = {}
+                for arg in round_results["arguments"]:
+                    round_arguments.setdefault(arg["stakeholder"], arg["argument_data"])
+                names = [stakeholder.get('name', 'Unknown') for stakeholder in stakeholder_list]
                 
-                for i in range(len(stakeholder_list)):
-                    for j in range(i + 1, len(stakeholder_list)):
-                        sender = stakeholder_list[i].get('name', 'Unknown')
-                        receiver = stakeholder_list[j].get('name', 'Unknown')
+                for i, sender in enumerate(names):
+                    receivers = names[i + 1:]
+                    sender_arg = round_arguments.get(sender)
+                    
+                    if receivers and sender_arg:
+                        message_content = f"Regarding {round_type}: {sender_arg.get('content', '')[:100]}..."
+                        context = {
+                            "round": self.debate_round,
+                            "topic": main_topic.get('title', 'Unknown')
+                        }
                         
-                        # Find sender's argument from this round
-                        sender_arg = None
-                        for arg in round_results["arguments"]:
-                            if arg["stakeholder"] == sender:
-                                sender_arg = arg["argument_data"]
-                                break
+                        # One batched send covers every receiver of this sender
+                        message_batch = self.send_a2a_messages_with_tracing(
+                            sender, receivers, "debate_response", message_content, context
+                        )
                         
-                        if sender_arg:
-                            message_content = f"Regarding {round_type}: {sender_arg.get('content', '')[:100]}..."
-                            context = {
-                                "round": self.debate_round,
-                                "topic": main_topic.get('title', 'Unknown')
-                            }
-                            
-                            message_data = self.send_a2a_message_with_tracing(
-                                sender, receiver, "debate_response", message_content, context
-                            )
-                            
+                        for receiver, message_data in zip(receivers, message_batch, strict=True):
                             if "error" not in message_data:
                                 round_results["a2a_messages"].append({
                                     "sender": sender,
@@ -301,19 +322,21 @@ class WeaveDebateSystem(BaseDebateSystem):
                                     "message_data": message_data,
                                     "timestamp": datetime.now().isoformat()
                                 })
-                        
-                        time.sleep(0.5)  # Brief pause between messages
+                    
+                    self.pause(0.5 * len(receivers))  # Brief pause between messages
             
-            print(f"✅ Round {self.debate_round} completed - {len(round_results['arguments'])} arguments, {len(round_results['a2a_messages'])} A2A messages")
+            logger.info(f"✅ Round {self.debate_round} completed - {len(round_results['arguments'])} arguments, {len(round_results['a2a_messages'])} A2A messages")
             
             return round_results
     
     @weave.op() if WEAVE_AVAILABLE else lambda x: x
     def run_debate(self, policy_name: str) -> Dict[str, Any]:
         """Run complete debate with full Weave tracing"""
+        # Cached LLM responses never carry over from an earlier debate
+        self._llm_cache.clear()
         
-        print(f"\n🚀 === WEAVE-TRACED POLICY DEBATE: {policy_name.upper()} ===")
-        print(f"🎭 Session ID: {self.session_id}")
+        logger.info(f"\n🚀 === WEAVE-TRACED POLICY DEBATE: {policy_name.upper()} ===")
+        logger.info(f"🎭 Session ID: {self.session_id}")
         
         start_time = datetime.now()
         
@@ -335,7 +358,7 @@ class WeaveDebateSystem(BaseDebateSystem):
                 personas = self.create_personas(stakeholder_list)
                 
                 # Step 4: Research Stakeholder Perspectives (Parallel)
-                print(f"\n🔬 === PARALLEL RESEARCH PHASE ===")
+                logger.info("\n🔬 === PARALLEL RESEARCH PHASE ===")
                 stakeholder_research = self.research_stakeholders_parallel(stakeholder_list, policy_text)
                 
                 # Step 5: Analyze Topics
@@ -343,12 +366,12 @@ class WeaveDebateSystem(BaseDebateSystem):
                 topics_list = self.analyze_debate_topics_with_tracing(policy_text, stakeholder_summary)
                 
                 # Step 6: Initialize Debate Session
-                print(f"\n🎭 === DEBATE SESSION INITIALIZATION ===")
+                logger.info("\n🎭 === DEBATE SESSION INITIALIZATION ===")
                 session_result = self.create_debate_session(policy_info, stakeholder_list)
-                print(f"✅ Session initialized: {session_result}")
+                logger.info(f"✅ Session initialized: {session_result}")
                 
                 # Step 7: Run Debate Rounds
-                print(f"\n🗣️ === DEBATE ROUNDS ===")
+                logger.info("\n🗣️ === DEBATE ROUNDS ===")
                 round_results = []
                 
                 # Round 1: Opening Statements
@@ -364,9 +387,9 @@ class WeaveDebateSystem(BaseDebateSystem):
                 round_results.append(round3)
                 
                 # Step 8: End Session
-                print(f"\n🏁 === SESSION CONCLUSION ===")
+                logger.info("\n🏁 === SESSION CONCLUSION ===")
                 end_result = self.end_debate_session()
-                print(f"✅ Session ended: {end_result}")
+                logger.info(f"✅ Session ended: {end_result}")
                 
                 end_time = datetime.now()
                 duration = (end_time - start_time).total_seconds()
@@ -380,8 +403,8 @@ class WeaveDebateSystem(BaseDebateSystem):
                     "stakeholder_research": stakeholder_research,
                     "topics_list": topics_list,
                     "round_results": round_results,
-                    "all_arguments": self.all_arguments,
-                    "conversation_history": self.conversation_history,
+                    "all_arguments": list(self.all_arguments),
+                    "conversation_history": list(self.conversation_history),
                     "duration": duration,
                     "start_time": start_time.isoformat(),
                     "end_time": end_time.isoformat()
@@ -391,17 +414,17 @@ class WeaveDebateSystem(BaseDebateSystem):
                 total_arguments = sum(len(r.get('arguments', [])) for r in round_results)
                 total_messages = sum(len(r.get('a2a_messages', [])) for r in round_results)
                 
-                print(f"\n🎉 === WEAVE-TRACED DEBATE COMPLETED ===")
-                print(f"📊 Duration: {duration:.1f} seconds")
-                print(f"💬 Total arguments: {total_arguments}")
-                print(f"📧 Total A2A messages: {total_messages}")
-                print(f"🎭 Participants: {len(stakeholder_list)}")
+                logger.info("\n🎉 === WEAVE-TRACED DEBATE COMPLETED ===")
+                logger.info(f"📊 Duration: {duration:.1f} seconds")
+                logger.info(f"💬 Total arguments: {total_arguments}")
+                logger.info(f"📧 Total A2A messages: {total_messages}")
+                logger.info(f"🎭 Participants: {len(stakeholder_list)}")
                 
                 if WEAVE_AVAILABLE:
-                    print(f"🔗 View full traces at: https://wandb.ai/aniruddhr04-university-of-cincinnati/civicai-hackathon")
+                    logger.info("🔗 View full traces at: https://wandb.ai/aniruddhr04-university-of-cincinnati/civicai-hackathon")
                 
                 return results
                 
             except Exception as e:
-                print(f"❌ Error in weave debate: {e}")
+                logger.error(f"❌ Error in weave debate: {e}")
                 raise 
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+Append-only prompt context for the CivicAI debate workflow
+
+DebateContext keeps the policy text and stakeholder list as a fixed first block
+and adds later workflow outputs (research, topics) as new blocks at the end, so
+every task description is built from the same blocks in the same order.
+"""
+
+import logging
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class DebateContext:
+    """
+    Shared, append-only context blocks for the tasks of one debate workflow
+    """
+
+    def __init__(self, max_chars: int = 200_000):
+        self.max_chars = max_chars
+        self.blocks: List[str] = []
+
+    def reset(self, policy_text: str, stakeholder_list: List[Dict[str, Any]]) -> None:
+        """Start a new workflow: keep only the policy/stakeholder prefix"""
+        self.blocks = [f"Policy text: {policy_text}\nStakeholders: {stakeholder_list}\n\n"]
+
+    def append(self, label: str, content: Any) -> None:
+        """Add a block after the existing prefix; earlier blocks are never modified"""
+        block = f"{label}:\n{content}\n\n"
+        if len(self) + len(block) > self.max_chars:
+            # Dropping old blocks would change the prefix anyway - keep the base and start over
+            logger.warning(
+                f"Debate context over {self.max_chars} chars - dropping {len(self.blocks) - 1} "
+                f"earlier block(s) before adding '{label}'"
+            )
+            self.blocks = self.blocks[:1]
+        self.blocks.append(block)
+
+    def render(self, instruction: str) -> str:
+        """Full task description: the shared prefix followed by the task instruction"""
+        return "".join(self.blocks) + instruction
+
+    def __len__(self) -> int:
+        return sum(len(block) for block in self.blocks)
@@ -0,0 +1,130 @@
+"""
+LLM response cache for CivicAI Policy Debate System
+
+Repeated workflow runs resend the same policy text and stakeholder context to
+the LLM. This module provides an exact-match response cache keyed by a hash of
+the prompt inputs, with TTL expiry and LRU eviction, plus a plan cache that
+reuses planning outputs for near-duplicate policies.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class LLMResponseCache:
+    """
+    Thread-safe in-memory LRU cache for LLM/task responses
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Build a deterministic cache key from prompt components"""
+        payload = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached response if present and not expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a response, evicting the least recently used entry if full"""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Clear all cached responses"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class PlanCache:
+    """
+    Cache of planning outputs (stakeholders, debate topics) for near-duplicate policies
+
+    Two policies match when they involve the same stakeholders and the word
+    shingles of their text overlap by at least `similarity_threshold` (Jaccard).
+    """
+
+    def __init__(self, max_entries: int = 64, similarity_threshold: float = 0.9, shingle_size: int = 3,
+                 max_plans_per_key: int = 16):
+        self.max_entries = max_entries
+        self.max_plans_per_key = max_plans_per_key
+        self.similarity_threshold = similarity_threshold
+        self.shingle_size = shingle_size
+        self._entries: OrderedDict[str, list] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _shingles(self, text: str) -> frozenset:
+        words = text.lower().split()
+        if len(words) <= self.shingle_size:
+            return frozenset([" ".join(words)])
+        return frozenset(
+            " ".join(words[i:i + self.shingle_size])
+            for i in range(len(words) - self.shingle_size + 1)
+        )
+
+    @staticmethod
+    def _stakeholder_key(stakeholder_list: List[Dict[str, Any]]) -> str:
+        return json.dumps(sorted(s.get("name", "") for s in stakeholder_list))
+
+    def lookup(self, policy_text: str, stakeholder_list: List[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        Find the cached plan for the most similar earlier policy
+
+        Returns:
+            (plan, similarity); plan is None when nothing reaches the threshold
+        """
+        shingles = self._shingles(policy_text)
+        best_plan, best_similarity = None, 0.0
+        with self._lock:
+            for cached_shingles, plan in self._entries.get(self._stakeholder_key(stakeholder_list), []):
+                union = len(shingles | cached_shingles)
+                similarity = len(shingles & cached_shingles) / union if union else 1.0
+                if similarity > best_similarity:
+                    best_plan, best_similarity = plan, similarity
+
+        if best_similarity >= self.similarity_threshold:
+            return best_plan, best_similarity
+        return None, best_similarity
+
+    def store(self, policy_text: str, stakeholder_list: List[Dict[str, Any]], plan: Dict[str, Any]) -> None:
+        """Remember the plan produced for a policy"""
+        key = self._stakeholder_key(stakeholder_list)
+        with self._lock:
+            plans = self._entries.setdefault(key, [])
+            plans.append((self._shingles(policy_text), plan))
+            del plans[:-self.max_plans_per_key]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -50,6 +50,7 @@ def run():
             print("  No test_data directory found")
         return
     
+    crew_instance = None
     try:
         crew_instance = DynamicCrewAutomationForPolicyAnalysisAndDebateCrew()
         result = crew_instance.crew().kickoff(inputs=inputs)
@@ -70,6 +71,9 @@ def run():
     except Exception as e:
         print(f"❌ Error during policy analysis: {e}")
         raise
+    finally:
+        if crew_instance is not None:
+            crew_instance.close()
 
 def run_with_dynamic_agents():
     """
@@ -89,6 +93,7 @@ def run_with_dynamic_agents():
     
     print(f"🚀 Starting enhanced policy analysis with dynamic agents for: {policy_name}")
     
+    crew_instance = None
     try:
         crew_instance = DynamicCrewAutomationForPolicyAnalysisAndDebateCrew()
         
@@ -192,6 +197,9 @@ def run_with_dynamic_agents():
         import traceback
         traceback.print_exc()
         raise
+    finally:
+        if crew_instance is not None:
+            crew_instance.close()
 
 def run_structured_debate():
     """
@@ -211,6 +219,7 @@ def run_structured_debate():
     
     print(f"🎭 Starting structured policy debate with A2A protocols for: {policy_name}")
     
+    crew_instance = None
     try:
         crew_instance = DynamicCrewAutomationForPolicyAnalysisAndDebateCrew()
         
@@ -315,6 +324,9 @@ def run_structured_debate():
         import traceback
         traceback.print_exc()
         raise
+    finally:
+        if crew_instance is not None:
+            crew_instance.close()
 
 def train():
     """
@@ -109,6 +109,7 @@ CACHE_CONFIG = {
     "ttl_hours": 24,
     "max_entries": 1000,
     "cache_directory": ".cache/policy_discovery",
+    "context_ttl_hours": 6,
 }
 
 # Rate limiting
@@ -2,8 +2,12 @@
 Utility classes for policy classification and stakeholder analysis
 """
 
+import hashlib
+import json
 import logging
+import os
 import re
+import time
 from datetime import datetime
 from typing import Any
 
@@ -389,4 +393,69 @@ class PolicyCache:
     def clear(self) -> None:
         """Clear the cache"""
         self.cache.clear()
-        self.logger.info("Policy cache cleared") 
\ No newline at end of file
+        self.logger.info("Policy cache cleared") 
+
+
+class PolicyDiskCache:
+    """
+    Persistent JSON-file cache for policy discovery results, keyed by a
+    content hash of the request context
+    """
+
+    def __init__(self, cache_directory: str, ttl_hours: float = 6):
+        self.cache_directory = cache_directory
+        self.ttl_seconds = ttl_hours * 3600
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def make_key(**context: Any) -> str:
+        """Build a stable hash key from the given context values"""
+        normalized = {
+            name: sorted(value) if isinstance(value, (list, tuple, set)) else value
+            for name, value in context.items()
+        }
+        payload = json.dumps(normalized, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_directory, f"{key}.json")
+
+    def get(self, key: str) -> Any | None:
+        """Get item from disk if present and not expired"""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("timestamp", 0) > self.ttl_seconds:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+        return entry.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        """Write item to disk with current timestamp"""
+        try:
+            os.makedirs(self.cache_directory, exist_ok=True)
+            tmp_path = f"{self._path(key)}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"timestamp": time.time(), "value": value}, f)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Failed to write discovery cache entry {key}: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached entries"""
+        if not os.path.isdir(self.cache_directory):
+            return
+        for name in os.listdir(self.cache_directory):
+            if name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.cache_directory, name))
+                except OSError:
+                    pass
@@ -14,6 +14,9 @@ load_dotenv()
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Maximum concurrent provider calls when batched debate calls fall back to one call per item
+BATCH_CONCURRENCY = 3
+
 # Mock pandas for timestamp functionality
 class pd:
     class Timestamp:
@@ -903,6 +906,15 @@ class A2AMessenger(BaseTool):
         except Exception as e:
             return f"Error sending message: {str(e)}"
 
+    def run_batch(self, sender: str, receivers: List[str], message_type: str, content: str, context: Union[str, Dict[str, Any]] = "{}") -> List[str]:
+        """Send the same message to several receivers, parsing the context once; results keep the receiver order"""
+        if isinstance(context, str):
+            try:
+                context = json.loads(context)
+            except (json.JSONDecodeError, TypeError):
+                context = {}
+        return [self._run(sender, receiver, message_type, content, context) for receiver in receivers]
+
 class DebateModerator(BaseTool):
     name: str = "DebateModerator"
     description: str = (
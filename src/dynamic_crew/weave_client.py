@@ -10,6 +10,7 @@ import json
 import logging
 import time
 import random
+import threading
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 from functools import wraps
@@ -39,6 +40,13 @@ except ImportError:
     WEAVE_AVAILABLE = False
     print("⚠️  Weave not available for inference - install with: pip install weave")
 
+# httpx backs the OpenAI SDK; a shared client keeps provider connections alive between calls
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 def retry_with_backoff(max_retries=3, base_delay=1, max_delay=60):
@@ -138,6 +146,11 @@ class RobustLLMClient:
             'local': 10
         }
         
+        # Pooled HTTP connections and one SDK client per provider, created on first use
+        self._http_client = None
+        self._provider_clients = {}
+        self._client_lock = threading.Lock()
+        
         logger.info(f"✅ Robust LLM Client initialized with {len(self.providers)} providers")
         print(f"✅ Robust LLM Client initialized with {len(self.providers)} providers")
     
@@ -230,6 +243,39 @@ class RobustLLMClient:
         time.sleep(30)  # Wait 30 seconds
         return self.providers[0] if self.providers else None
     
+    def _get_provider_client(self, provider: Dict[str, Any]):
+        """Get the OpenAI-compatible client for a provider, reusing its connection pool"""
+        client = self._provider_clients.get(provider['name'])
+        if client is not None:
+            return client
+        
+        import openai
+        
+        with self._client_lock:
+            client = self._provider_clients.get(provider['name'])
+            if client is None:
+                if HTTPX_AVAILABLE and self._http_client is None:
+                    self._http_client = httpx.Client(
+                        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                        timeout=httpx.Timeout(60.0)
+                    )
+                client = openai.OpenAI(
+                    api_key=provider['api_key'],
+                    base_url=provider['base_url'],
+                    timeout=provider['timeout'],
+                    http_client=self._http_client
+                )
+                self._provider_clients[provider['name']] = client
+        return client
+    
+    def close(self):
+        """Close pooled provider connections"""
+        with self._client_lock:
+            self._provider_clients.clear()
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+    
     @retry_with_backoff(max_retries=3, base_delay=2)
     def _call_provider(self, provider: Dict[str, Any], prompt: str, **kwargs) -> str:
         """Make API call to specific provider"""
@@ -244,13 +290,7 @@ class RobustLLMClient:
                 )
             
             # Handle API-based providers (Groq, OpenAI, etc.)
-            import openai
-            
-            client = openai.OpenAI(
-                api_key=provider['api_key'],
-                base_url=provider['base_url'],
-                timeout=provider['timeout']
-            )
+            client = self._get_provider_client(provider)
             
             response = client.chat.completions.create(
                 model=provider['model'],
@@ -591,4 +631,9 @@ def initialize_weave_client(project_name: str = "civicai-policy-debate") -> Robu
     """
     global _llm_client
     _llm_client = RobustLLMClient(project_name=project_name)
-    return _llm_client 
\ No newline at end of file
+    return _llm_client
+
+def close_weave_client():
+    """Close the global LLM client's pooled connections, if it was created"""
+    if _llm_client is not None:
+        _llm_client.close()
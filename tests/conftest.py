@@ -0,0 +1,8 @@
+"""
+Shared pytest setup: make the src/ layout importable without an editable install
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
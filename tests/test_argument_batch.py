@@ -0,0 +1,116 @@
+"""
+Tests for batched argument generation and its per-item fallback
+"""
+
+import json
+
+import pytest
+
+from dynamic_crew.debate import base
+from dynamic_crew.debate.base import BaseDebateSystem
+
+
+class StubDebateSystem(BaseDebateSystem):
+    def __init__(self, responses):
+        super().__init__("Test System", pacing=0)
+        self.responses = list(responses)
+        self.prompts = []
+        self.single_calls = []
+
+    def get_llm_response(self, prompt, analysis_type="general"):
+        self.prompts.append(prompt)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def generate_argument(self, stakeholder_name, topic, argument_type):
+        self.single_calls.append((stakeholder_name, topic["title"], argument_type))
+        return json.dumps({"content": f"single {stakeholder_name}"})
+
+    def run_debate(self, policy_name):
+        return {}
+
+    def create_personas(self, stakeholder_list):
+        return {}
+
+
+def _requests(count):
+    return [(f"Stakeholder {i}", {"title": f"Topic {i}", "description": "d"}, "support") for i in range(count)]
+
+
+def _arguments(ids):
+    return {"arguments": [{"id": i, "content": f"batched {i}"} for i in ids]}
+
+
+@pytest.fixture
+def needs_tools():
+    # The fallback path reads BATCH_CONCURRENCY from the tools module, which imports CrewAI
+    pytest.importorskip("crewai")
+
+
+@pytest.mark.unit
+class TestGenerateArgumentChunk:
+    def test_parses_items_and_fills_defaults(self):
+        system = StubDebateSystem([_arguments([1, 0])])
+        arguments = system._generate_argument_chunk(_requests(2))
+        assert set(arguments) == {0, 1}
+        parsed = json.loads(arguments[1])
+        assert parsed == {"content": "batched 1", "stakeholder_name": "Stakeholder 1", "argument_type": "support"}
+        assert '<item id="1">' in system.prompts[0]
+
+    @pytest.mark.parametrize("entries", [
+        [{"id": 0, "content": ""}],
+        [{"content": "no id"}],
+        [{"id": "x", "content": "bad id"}],
+        [{"id": 5, "content": "out of range"}],
+        ["not a dict"],
+    ])
+    def test_skips_malformed_entries(self, entries):
+        system = StubDebateSystem([{"arguments": entries}])
+        assert system._generate_argument_chunk(_requests(2)) == {}
+
+    def test_keeps_first_of_duplicate_ids(self):
+        system = StubDebateSystem([{"arguments": [{"id": 0, "content": "first"}, {"id": 0, "content": "second"}]}])
+        assert json.loads(system._generate_argument_chunk(_requests(1))[0])["content"] == "first"
+
+    @pytest.mark.parametrize("response", [
+        {"error": "LLM error"},
+        ["not", "a", "dict"],
+        RuntimeError("boom"),
+    ])
+    def test_failed_call_returns_nothing(self, response):
+        system = StubDebateSystem([response])
+        assert system._generate_argument_chunk(_requests(2)) == {}
+
+
+@pytest.mark.unit
+class TestGenerateArgumentsBatch:
+    def test_empty_requests_make_no_call(self):
+        system = StubDebateSystem([])
+        assert system.generate_arguments_batch([]) == []
+        assert system.prompts == []
+
+    def test_single_chunk_keeps_input_order(self):
+        system = StubDebateSystem([_arguments([2, 0, 1])])
+        results = system.generate_arguments_batch(_requests(3))
+        assert [json.loads(r)["content"] for r in results] == ["batched 0", "batched 1", "batched 2"]
+        assert system.single_calls == []
+
+    def test_multiple_chunks_map_back_to_positions(self, monkeypatch):
+        monkeypatch.setattr(base, "ARGUMENT_BATCH_SIZE", 2)
+        system = StubDebateSystem([_arguments([0, 1]), _arguments([0, 1]), _arguments([0])])
+        results = system.generate_arguments_batch(_requests(5))
+        assert [json.loads(r)["stakeholder_name"] for r in results] == [f"Stakeholder {i}" for i in range(5)]
+        assert len(system.prompts) == 3
+
+    def test_missing_items_fall_back_to_single_calls(self, needs_tools):
+        system = StubDebateSystem([_arguments([1])])
+        results = system.generate_arguments_batch(_requests(3))
+        assert [json.loads(r)["content"] for r in results] == ["single Stakeholder 0", "batched 1", "single Stakeholder 2"]
+        assert system.single_calls == [("Stakeholder 0", "Topic 0", "support"), ("Stakeholder 2", "Topic 2", "support")]
+
+    def test_failed_batch_falls_back_for_every_item(self, needs_tools):
+        system = StubDebateSystem([{"error": "LLM error"}])
+        results = system.generate_arguments_batch(_requests(2))
+        assert [json.loads(r)["content"] for r in results] == ["single Stakeholder 0", "single Stakeholder 1"]
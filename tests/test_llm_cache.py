@@ -0,0 +1,112 @@
+"""
+Tests for the in-memory LLM response and planning caches
+"""
+
+import pytest
+
+from dynamic_crew import llm_cache
+from dynamic_crew.llm_cache import LLMResponseCache, PlanCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(llm_cache.time, "monotonic", fake)
+    return fake
+
+
+@pytest.mark.unit
+class TestLLMResponseCache:
+    def test_make_key_ignores_argument_order(self):
+        assert LLMResponseCache.make_key(a=1, b="x") == LLMResponseCache.make_key(b="x", a=1)
+        assert LLMResponseCache.make_key(a=1) != LLMResponseCache.make_key(a=2)
+
+    def test_get_counts_hits_and_misses(self, clock):
+        cache = LLMResponseCache()
+        assert cache.get("k") is None
+        cache.set("k", "v")
+        assert cache.get("k") == "v"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used(self, clock):
+        cache = LLMResponseCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_expires_after_ttl(self, clock):
+        cache = LLMResponseCache(ttl_seconds=10)
+        cache.set("k", "v")
+        clock.now += 10
+        assert cache.get("k") == "v"
+        clock.now += 0.1
+        assert cache.get("k") is None
+        assert "k" not in cache._entries
+
+    def test_clear_resets_entries_and_counters(self, clock):
+        cache = LLMResponseCache()
+        cache.set("k", "v")
+        cache.get("k")
+        cache.clear()
+        assert cache.get("k") is None
+        assert (cache.hits, cache.misses) == (0, 1)
+
+
+POLICY = "the city will expand bus service to all neighborhoods and reduce fares for students and seniors"
+STAKEHOLDERS = [{"name": "Riders"}, {"name": "Transit Agency"}]
+
+
+@pytest.mark.unit
+class TestPlanCache:
+    def test_exact_text_matches(self):
+        cache = PlanCache()
+        cache.store(POLICY, STAKEHOLDERS, {"topics": ["fares"]})
+        plan, similarity = cache.lookup(POLICY, STAKEHOLDERS)
+        assert plan == {"topics": ["fares"]}
+        assert similarity == 1.0
+
+    def test_near_duplicate_above_threshold_matches(self):
+        cache = PlanCache(similarity_threshold=0.8)
+        cache.store(POLICY, STAKEHOLDERS, {"topics": ["fares"]})
+        plan, similarity = cache.lookup(POLICY + " citywide", STAKEHOLDERS)
+        assert plan == {"topics": ["fares"]}
+        assert 0.8 <= similarity < 1.0
+
+    def test_dissimilar_text_misses_but_reports_similarity(self):
+        cache = PlanCache()
+        cache.store(POLICY, STAKEHOLDERS, {"topics": ["fares"]})
+        plan, similarity = cache.lookup("a new zoning rule for downtown parking garages", STAKEHOLDERS)
+        assert plan is None
+        assert similarity < 0.9
+
+    def test_stakeholder_order_is_ignored_but_set_must_match(self):
+        cache = PlanCache()
+        cache.store(POLICY, STAKEHOLDERS, {"topics": ["fares"]})
+        assert cache.lookup(POLICY, list(reversed(STAKEHOLDERS)))[0] == {"topics": ["fares"]}
+        assert cache.lookup(POLICY, STAKEHOLDERS[:1]) == (None, 0.0)
+
+    def test_short_text_is_a_single_shingle(self):
+        cache = PlanCache(shingle_size=3)
+        assert cache._shingles("Bus Fares") == frozenset(["bus fares"])
+
+    def test_plans_per_key_and_keys_are_bounded(self):
+        cache = PlanCache(max_entries=1, max_plans_per_key=2)
+        for i in range(3):
+            cache.store(f"{POLICY} {i}", STAKEHOLDERS, {"n": i})
+        assert [plan["n"] for _, plan in next(iter(cache._entries.values()))] == [1, 2]
+
+        cache.store(POLICY, [{"name": "Other"}], {"n": "other"})
+        assert cache.lookup(POLICY + " 2", STAKEHOLDERS)[0] is None
+        assert cache.lookup(POLICY, [{"name": "Other"}])[0] == {"n": "other"}
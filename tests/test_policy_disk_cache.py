@@ -0,0 +1,62 @@
+"""
+Tests for the on-disk policy discovery cache
+"""
+
+import json
+import os
+
+import pytest
+
+# The policy_discovery package imports its CrewAI agent on import
+pytest.importorskip("crewai")
+
+from dynamic_crew.policy_discovery import utils  # noqa: E402
+from dynamic_crew.policy_discovery.utils import PolicyDiskCache  # noqa: E402
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PolicyDiskCache(str(tmp_path / "discovery"), ttl_hours=1)
+
+
+@pytest.mark.unit
+class TestPolicyDiskCache:
+    def test_make_key_ignores_order_of_arguments_and_list_values(self):
+        assert PolicyDiskCache.make_key(city="A", topics=["x", "y"]) == PolicyDiskCache.make_key(topics=("y", "x"), city="A")
+        assert PolicyDiskCache.make_key(city="A") != PolicyDiskCache.make_key(city="B")
+
+    def test_round_trip_creates_directory(self, cache):
+        assert cache.get("k") is None
+        cache.set("k", {"policies": [1, 2]})
+        assert cache.get("k") == {"policies": [1, 2]}
+        assert os.listdir(cache.cache_directory) == ["k.json"]
+
+    def test_expired_entry_is_removed(self, cache, monkeypatch):
+        cache.set("k", "v")
+        now = utils.time.time()
+        monkeypatch.setattr(utils.time, "time", lambda: now + 3601)
+        assert cache.get("k") is None
+        assert not os.path.exists(os.path.join(cache.cache_directory, "k.json"))
+
+    def test_corrupt_file_is_a_miss(self, cache):
+        os.makedirs(cache.cache_directory)
+        with open(os.path.join(cache.cache_directory, "k.json"), "w", encoding="utf-8") as f:
+            f.write("{not json")
+        assert cache.get("k") is None
+
+    def test_unserializable_value_is_not_written(self, cache):
+        cache.set("k", object())
+        assert cache.get("k") is None
+
+    def test_clear_removes_only_entries(self, cache):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        other = os.path.join(cache.cache_directory, "notes.txt")
+        with open(other, "w", encoding="utf-8") as f:
+            json.dump({}, f)
+        cache.clear()
+        assert os.listdir(cache.cache_directory) == ["notes.txt"]
+
+    def test_clear_without_directory_is_a_no_op(self, cache):
+        cache.clear()
+        assert not os.path.exists(cache.cache_directory)
@@ -0,0 +1,44 @@
+"""
+Tests for the batched random number pool used by the human-like debate helpers
+"""
+
+import pytest
+
+from dynamic_crew.debate import random_pool
+from dynamic_crew.debate.random_pool import RandomPool
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param and not random_pool.NUMPY_AVAILABLE:
+        pytest.skip("numpy not installed")
+    monkeypatch.setattr(random_pool, "NUMPY_AVAILABLE", request.param)
+
+
+@pytest.mark.unit
+class TestRandomPool:
+    def test_values_are_31_bit(self, backend):
+        pool = RandomPool(size=16, seed=1)
+        values = [pool.next() for _ in range(100)]
+        assert all(0 <= v < 2 ** 31 for v in values)
+        assert len(set(values)) > 90
+
+    def test_same_seed_gives_same_sequence(self, backend):
+        first, second = RandomPool(size=8, seed=42), RandomPool(size=8, seed=42)
+        assert [first.next() for _ in range(20)] == [second.next() for _ in range(20)]
+
+    def test_refills_in_batches_of_size(self, backend):
+        pool = RandomPool(size=4, seed=0)
+        pool.next()
+        assert len(pool._values) == 3
+        for _ in range(3):
+            pool.next()
+        assert pool._values == []
+        pool.next()
+        assert len(pool._values) == 3
+
+    def test_choice_covers_sequence(self, backend):
+        pool = RandomPool(seed=7)
+        options = ["a", "b", "c"]
+        picks = {pool.choice(options) for _ in range(200)}
+        assert picks == set(options)
@@ -0,0 +1,91 @@
+"""
+Tests for the process-wide LLM concurrency/RPM gate
+"""
+
+import threading
+
+import pytest
+
+from dynamic_crew.debate import base
+from dynamic_crew.debate.base import _LLMRateGate
+
+
+class FakeTime:
+    """Stands in for the time module: monotonic() is manual, sleep() advances it"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_time(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(base, "time", fake)
+    return fake
+
+
+def _enter(gate, count):
+    for _ in range(count):
+        with gate:
+            pass
+
+
+@pytest.mark.unit
+class TestLLMRateGate:
+    def test_burst_up_to_budget_does_not_wait(self, fake_time):
+        _enter(_LLMRateGate(max_concurrency=4, requests_per_minute=60), 60)
+        assert fake_time.sleeps == []
+
+    def test_requests_past_budget_are_spaced_to_rate(self, fake_time):
+        _enter(_LLMRateGate(max_concurrency=4, requests_per_minute=60), 63)
+        assert fake_time.sleeps == pytest.approx([1.0, 1.0, 1.0])
+
+    def test_budget_drains_over_time(self, fake_time):
+        gate = _LLMRateGate(max_concurrency=4, requests_per_minute=60)
+        _enter(gate, 60)
+        fake_time.now += 30
+        _enter(gate, 30)
+        assert fake_time.sleeps == []
+        _enter(gate, 1)
+        assert fake_time.sleeps == pytest.approx([1.0])
+
+    def test_zero_rpm_disables_pacing(self, fake_time):
+        _enter(_LLMRateGate(max_concurrency=4, requests_per_minute=0), 100)
+        assert fake_time.sleeps == []
+
+    def test_caps_concurrent_holders(self):
+        gate = _LLMRateGate(max_concurrency=2, requests_per_minute=0)
+        release = threading.Event()
+        inside = threading.Semaphore(0)
+        peak = []
+        active = [0]
+        lock = threading.Lock()
+
+        def worker():
+            with gate:
+                with lock:
+                    active[0] += 1
+                    peak.append(active[0])
+                inside.release()
+                release.wait(5)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        assert inside.acquire(timeout=5) and inside.acquire(timeout=5)
+        assert not inside.acquire(timeout=0.2)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        assert max(peak) == 2
+        assert len(peak) == 3